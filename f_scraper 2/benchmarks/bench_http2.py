@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark HTTP/2 multiplexing (HttpxScraper) against HTTP/1.1 (RequestsScraper).
+
+By default both engines fetch the same page many times, concurrently, from a
+local HTTPS server that speaks HTTP/2 and adds a fixed server-side delay. The
+server counts the TCP connections each engine opens. Running the local server
+needs ``hypercorn`` and ``trustme``; pass ``--url`` to benchmark against a
+real site instead.
+
+Usage:
+    python benchmarks/bench_http2.py [--requests N] [--concurrency C] [--delay-ms D]
+    python benchmarks/bench_http2.py --url https://example.com/ [--requests N]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import ssl
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.httpx_scraper import HttpxScraper
+from scrapers.requests_scraper import RequestsScraper
+
+PAGE = b'<html><body>' + b'<div class="festival">Festival</div>' * 500 + b'</body></html>'
+
+
+class LocalServer:
+    """HTTPS server speaking HTTP/2 and HTTP/1.1, counting client connections."""
+
+    def __init__(self, delay: float):
+        import trustme
+
+        self.delay = delay
+        self.connections = set()
+        self._ca = trustme.CA()
+        cert = self._ca.issue_cert('127.0.0.1')
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.certfile = os.path.join(self._tmpdir.name, 'cert.pem')
+        self.keyfile = os.path.join(self._tmpdir.name, 'key.pem')
+        self.cafile = os.path.join(self._tmpdir.name, 'ca.pem')
+        cert.cert_chain_pems[0].write_to_path(self.certfile)
+        cert.private_key_pem.write_to_path(self.keyfile)
+        self._ca.cert_pem.write_to_path(self.cafile)
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            self.port = sock.getsockname()[1]
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    async def _app(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return
+        self.connections.add(scope['client'])
+        await asyncio.sleep(self.delay)
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'text/html'), (b'content-length', str(len(PAGE)).encode())]})
+        await send({'type': 'http.response.body', 'body': PAGE})
+
+    def _serve(self) -> None:
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+
+        config = Config()
+        config.bind = [f'127.0.0.1:{self.port}']
+        config.certfile = self.certfile
+        config.keyfile = self.keyfile
+        config.loglevel = 'WARNING'
+
+        async def _main():
+            self._stop = asyncio.Event()
+            self._loop = asyncio.get_running_loop()
+            task = asyncio.ensure_future(serve(self._app, config, shutdown_trigger=self._stop.wait))
+            # Wait until hypercorn accepts connections
+            while True:
+                try:
+                    _, writer = await asyncio.open_connection('127.0.0.1', self.port)
+                except OSError:
+                    await asyncio.sleep(0.01)
+                else:
+                    writer.close()
+                    break
+            self._started.set()
+            await task
+
+        asyncio.run(_main())
+
+    def start(self) -> 'LocalServer':
+        self._thread.start()
+        self._started.wait(10)
+        return self
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(5)
+        self._tmpdir.cleanup()
+
+
+def bench_requests(url: str, count: int, concurrency: int, cafile: str = None) -> float:
+    """Fetch with RequestsScraper from a thread pool; returns wall time in seconds."""
+    scraper = RequestsScraper({'use_proxies': False, 'pool_maxsize': concurrency, 'retry_workers': concurrency,
+                               'verify_ssl': cafile or True, 'rate_limit': False})
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            list(pool.map(lambda _: scraper.get_page(url, max_retries=1), range(count)))
+        return time.perf_counter() - start
+    finally:
+        scraper.close()
+
+
+def bench_httpx(url: str, count: int, concurrency: int, cafile: str = None) -> float:
+    """Fetch with HttpxScraper on one event loop; returns wall time in seconds."""
+    verify = ssl.create_default_context(cafile=cafile) if cafile else True
+    scraper = HttpxScraper({'max_retries': 1, 'verify_ssl': verify, 'rate_limit': False})
+
+    async def _run() -> float:
+        start = time.perf_counter()
+        async for _, result in scraper.afetch_many([url] * count, concurrency=concurrency):
+            if isinstance(result, Exception):
+                raise result
+        elapsed = time.perf_counter() - start
+        await scraper.aclose()
+        return elapsed
+
+    try:
+        return asyncio.run(_run())
+    finally:
+        print(f"    httpx responses by version: {scraper.get_stats()['http_versions']}")
+        scraper.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--url', help='Benchmark against this URL instead of a local server')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--delay-ms', type=float, default=50, help='Server-side delay of the local server')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    server = None
+    url, cafile = args.url, None
+    if not url:
+        server = LocalServer(args.delay_ms / 1000).start()
+        url, cafile = f"https://127.0.0.1:{server.port}/festival", server.cafile
+
+    print(f"{args.requests} requests to {url}, concurrency {args.concurrency}")
+    try:
+        for name, bench in [('requests (HTTP/1.1)', bench_requests), ('httpx (HTTP/2)', bench_httpx)]:
+            if server:
+                server.connections.clear()
+            elapsed = bench(url, args.requests, args.concurrency, cafile)
+            line = f"  {name:<20} {elapsed:6.2f} s  {args.requests / elapsed:7.1f} req/s"
+            if server:
+                line += f"  {len(server.connections)} connections"
+            print(line)
+    finally:
+        if server:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
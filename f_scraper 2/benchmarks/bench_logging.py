@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-request logging overhead seen by fetch threads.
+
+The change from the old setup (synchronous FileHandler, f-string messages)
+to the queue-based pipeline from ``scrapers.logging_setup`` (lazy %-style
+messages, formatting and disk writes on a background thread) is two changes
+at once, so each handler is timed with both message styles:
+
+- sync/f-string vs. sync/lazy isolates the message style;
+- sync/lazy vs. queue/lazy isolates moving work to the listener thread.
+
+"fetch-thread CPU" only counts the logging thread's own CPU time. For the
+queue setups, the listener's formatting and writing happen elsewhere and are
+reported separately as the time ``stop_logging`` takes to drain the queue.
+
+Usage:
+    python benchmarks/bench_logging.py [--requests N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.logging_setup import configure_logging, stop_logging
+
+URL = "https://filmfreeway.com/festivals/12345?page=3"
+
+
+def simulate_requests_fstring(logger: logging.Logger, count: int) -> None:
+    for i in range(count):
+        logger.info(f"Trying to fetch {URL} with requests engine")
+        logger.info(f"Response length: {i * 17} characters")
+        logger.info(f"Successfully fetched {URL} with requests engine")
+
+
+def simulate_requests_lazy(logger: logging.Logger, count: int) -> None:
+    for i in range(count):
+        logger.info("Trying to fetch %s with %s engine", URL, 'requests')
+        logger.info("Response length: %s characters", i * 17)
+        logger.info("Successfully fetched %s with %s engine", URL, 'requests')
+
+
+def _timed(func, logger: logging.Logger, count: int) -> tuple:
+    """Run a simulation, returning (wall seconds, calling-thread CPU seconds)."""
+    start_wall = time.perf_counter()
+    start_cpu = time.thread_time()
+    func(logger, count)
+    return time.perf_counter() - start_wall, time.thread_time() - start_cpu
+
+
+def bench_sync(simulate, count: int, log_file: str) -> tuple:
+    """Time the old synchronous FileHandler setup."""
+    logger = logging.getLogger('bench.sync')
+    handler = logging.FileHandler(log_file)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    try:
+        return _timed(simulate, logger, count) + (0.0,)
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def bench_queue(simulate, count: int, log_file: str) -> tuple:
+    """Time the queue-based pipeline as seen by the logging thread, then its drain."""
+    configure_logging(log_file=log_file, console=False, logger_name='bench.queue')
+    logger = logging.getLogger('bench.queue')
+    logger.propagate = False
+    try:
+        timings = _timed(simulate, logger, count)
+    finally:
+        start_drain = time.perf_counter()
+        stop_logging()
+    return timings + (time.perf_counter() - start_drain,)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=20000, help='Number of simulated requests')
+    args = parser.parse_args()
+
+    setups = (
+        ("sync FileHandler + f-strings", bench_sync, simulate_requests_fstring),
+        ("sync FileHandler + lazy %", bench_sync, simulate_requests_lazy),
+        ("queue + f-strings", bench_queue, simulate_requests_fstring),
+        ("queue + lazy %", bench_queue, simulate_requests_lazy),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [(label, bench(simulate, args.requests, os.path.join(tmp, f'{index}.log')))
+                   for index, (label, bench, simulate) in enumerate(setups)]
+
+    for label, (wall, cpu, drain) in results:
+        print(f"{label:30} wall {wall / args.requests * 1e6:7.1f} us/request, "
+              f"fetch-thread CPU {cpu / args.requests * 1e6:7.1f} us/request, "
+              f"listener drain {drain:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
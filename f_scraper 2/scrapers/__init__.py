@@ -5,6 +5,7 @@ This package provides a modular architecture with multiple scraping engines:
 - Playwright for JavaScript-heavy pages
 - CloudScraper for bypassing Cloudflare protection
 - Requests with rotating proxies for basic pages
+- HTTPX for HTTP/2 multiplexed fetching
 
 It also includes IP rotation using:
 - requests-ip-rotator for AWS-based IP rotation
@@ -21,12 +22,22 @@ With enhanced browser fingerprinting evasion:
 - Cookie management
 """
 
+import importlib
+
 from scrapers.base_scraper import BaseScraper, ScraperException
-from scrapers.requests_scraper import RequestsScraper
-from scrapers.cloudscraper_engine import CloudScraperEngine
-from scrapers.playwright_scraper import PlaywrightScraper
-from scrapers.proxy_manager import ProxyManager, Proxy
-from scrapers.scraper_factory import ScraperFactory
+
+# Engines and their dependencies are imported on first attribute access, so
+# `import scrapers` stays cheap and a job only pays for the engines it uses.
+_LAZY_ATTRIBUTES = {
+    'RequestsScraper': 'scrapers.requests_scraper',
+    'CloudScraperEngine': 'scrapers.cloudscraper_engine',
+    'PlaywrightScraper': 'scrapers.playwright_scraper',
+    'HttpxScraper': 'scrapers.httpx_scraper',
+    'ProxyManager': 'scrapers.proxy_manager',
+    'Proxy': 'scrapers.proxy_manager',
+    'ScraperFactory': 'scrapers.scraper_factory',
+    'register_engine': 'scrapers.registry',
+}
 
 __all__ = [
     'BaseScraper',
@@ -34,7 +45,22 @@ __all__ = [
     'RequestsScraper',
     'CloudScraperEngine',
     'PlaywrightScraper',
+    'HttpxScraper',
     'ProxyManager',
     'Proxy',
     'ScraperFactory',
+    'register_engine',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
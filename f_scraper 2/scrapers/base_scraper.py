@@ -6,23 +6,25 @@ This module defines the base scraper class that serves as the foundation for all
 specialized scrapers in the system.
 """
 
+import asyncio
 import logging
 import random
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Callable
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, List, Callable, AsyncIterator, Iterable, Mapping, Tuple, Union
 import json
 import os
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("scraper.log"),
-        logging.StreamHandler()
-    ]
-)
+from scrapers import dns_cache
+from scrapers.latency import DEFAULT_MAX_HOSTS, LatencyStats
+from scrapers.rate_limiter import (DEFAULT_SETTING as DEFAULT_RATE_LIMIT, RateLimiter,
+                                   create_from_config as create_rate_limiter)
+from scrapers.retry_scheduler import RetryScheduler
+from scrapers.stats import ShardedStats
+from scrapers.url_utils import get_host
+
+# Configure logging (handlers are set up by the application, see logging_setup)
 logger = logging.getLogger(__name__)
 
 
@@ -43,24 +45,33 @@ class BaseScraper(ABC):
         self.config = config or {}
         self.max_retries = self.config.get('max_retries', 5)
         self.retry_delay = self.config.get('retry_delay', 2)
+        self.retry_workers = self.config.get('retry_workers', 8)
+        # Longest Retry-After we are willing to wait for before giving up on a URL
+        self.max_retry_after = self.config.get('max_retry_after', 600)
+        self.parser = self.config.get('parser', 'auto')
+        self._parser_backend = None
+        
+        # Optional process-wide DNS cache (shared by every engine)
+        dns_cache.install_from_config(self.config.get('dns_cache'))
+        
+        # Per-host rate limiter; the scraper factory replaces it with one
+        # shared by all of its engines
+        self.rate_limiter: Optional[RateLimiter] = create_rate_limiter(self.config.get('rate_limit', DEFAULT_RATE_LIMIT))
+        
+        # robots.txt rules, consulted before each fetch when 'respect_robots'
+        # is set (imported here because the robots module depends on this one)
+        from scrapers.robots import create_from_config as create_robots_cache
+        self.robots = create_robots_cache(self.config.get('respect_robots'))
+        self._retry_scheduler = None
         self.user_agents = self._load_user_agents()
         self.current_user_agent = self._get_random_user_agent()
         self.cookies = {}
         self.headers = self._get_default_headers()
         self.session = None  # To be initialized by subclasses
-        self.success_rate = 0.0
-        self.request_count = 0
-        self.success_count = 0
         
-        # Initialize stats tracking
-        self.stats = {
-            'requests': 0,
-            'success': 0,
-            'failures': 0,
-            'retries': 0,
-            'total_time': 0,
-            'avg_response_time': 0,
-        }
+        # Initialize stats tracking (safe to update from many threads); at most
+        # 'latency_hosts' hosts get their own latency histograms
+        self._stats = ShardedStats(self.config.get('latency_hosts', DEFAULT_MAX_HOSTS))
 
     def _load_user_agents(self) -> List[str]:
         """Load a list of user agents from file or use defaults.
@@ -74,7 +85,7 @@ class BaseScraper(ABC):
                 with open('user_agents.json', 'r') as f:
                     return json.load(f)
         except Exception as e:
-            logger.warning(f"Error loading user agents from file: {e}")
+            logger.warning("Error loading user agents from file: %s", e)
         
         # Default user agents (modern browsers)
         return [
@@ -128,7 +139,7 @@ class BaseScraper(ABC):
         self.headers["User-Agent"] = self.current_user_agent
         if self.session:
             self.session.headers.update({"User-Agent": self.current_user_agent})
-        logger.debug(f"Rotated user agent to: {self.current_user_agent}")
+        logger.debug("Rotated user agent to: %s", self.current_user_agent)
 
     def update_cookies(self, cookies: Dict[str, str]) -> None:
         """Update the cookies for the scraper.
@@ -140,23 +151,242 @@ class BaseScraper(ABC):
         if self.session:
             for key, value in cookies.items():
                 self.session.cookies.set(key, value)
-        logger.debug(f"Updated cookies: {cookies}")
+        logger.debug("Updated cookies: %s", cookies)
+
+    def _throttle(self, host: str) -> None:
+        """Wait until the rate limiter allows a request to a host.
+
+        Blocks the calling thread; work on the retry scheduler uses
+        ``_reserve`` so the wait doesn't hold a worker.
+
+        Args:
+            host: Host about to be requested.
+        """
+        if self.rate_limiter and host:
+            self.rate_limiter.acquire(host)
+
+    def _reserve(self, host: str) -> float:
+        """Book the next rate limiter slot of a host without waiting for it.
+
+        Args:
+            host: Host about to be requested.
+
+        Returns:
+            Seconds until the slot is due.
+        """
+        if self.rate_limiter and host:
+            return self.rate_limiter.reserve(host)
+        return 0.0
+
+    def _check_robots(self, url: str) -> None:
+        """Make sure robots.txt allows a URL and apply the host's Crawl-delay.
+
+        Args:
+            url: URL about to be fetched.
+
+        Raises:
+            RobotsDisallowedError: If robots.txt disallows the URL.
+        """
+        if self.robots:
+            self.robots.check(url, self.rate_limiter)
+
+    async def _acheck_robots(self, url: str) -> None:
+        """Like ``_check_robots``, but downloads robots.txt off the event loop.
+
+        Args:
+            url: URL about to be fetched.
+
+        Raises:
+            RobotsDisallowedError: If robots.txt disallows the URL.
+        """
+        if self.robots and not self.robots.is_cached(url):
+            await asyncio.get_running_loop().run_in_executor(None, self._check_robots, url)
+        else:
+            self._check_robots(url)
+
+    def _check_response(self, url: str, status_code: int, headers: Mapping[str, str] = None) -> None:
+        """Raise for a failed response, pausing the host if the server throttled us.
+
+        Args:
+            url: URL of the response.
+            status_code: HTTP status of the response.
+            headers: Response headers.
+
+        Raises:
+            HttpStatusError: If the status is not a success (see
+                ``scrapers.response_policy``).
+        """
+        # Imported here because response_policy depends on this module
+        from scrapers.response_policy import HttpStatusError, check_response
+        
+        try:
+            check_response(url, status_code, headers, self.max_retry_after)
+        except HttpStatusError as e:
+            if e.retry_after and self.rate_limiter:
+                # Hold back every request to this host, not just this URL's retry,
+                # but no longer than we would wait to retry the URL itself
+                self.rate_limiter.pause(get_host(url), min(e.retry_after, self.max_retry_after))
+            raise
+
+    async def _athrottle(self, host: str) -> None:
+        """Wait until the rate limiter allows a request, without blocking the event loop.
+
+        Args:
+            host: Host about to be requested.
+        """
+        if self.rate_limiter and host:
+            await self.rate_limiter.aacquire(host)
+
+    @property
+    def retry_scheduler(self) -> RetryScheduler:
+        """Retry scheduler shared by all fetches of this scraper (created on first use)."""
+        if self._retry_scheduler is None:
+            self._retry_scheduler = RetryScheduler(self.retry_workers, name=type(self).__name__)
+        return self._retry_scheduler
+
+    def _close_retry_scheduler(self) -> None:
+        """Shut down the retry scheduler if one was started."""
+        if self._retry_scheduler is not None:
+            self._retry_scheduler.close()
+            self._retry_scheduler = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Request counters summed across all threads."""
+        return self._summarize_counters(self._stats.counters())
+
+    @staticmethod
+    def _summarize_counters(counters: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the public stats dictionary from merged counters."""
+        return {
+            'requests': counters['requests'],
+            'success': counters['success'],
+            'failures': counters['failures'],
+            'retries': counters['retries'],
+            'total_time': counters['total_time'],
+            'avg_response_time': counters['total_time'] / counters['success'] if counters['success'] else 0,
+        }
+
+    @property
+    def request_count(self) -> int:
+        """Number of attempts made, successful or not."""
+        return self._stats.counters()['attempts']
+
+    @property
+    def success_count(self) -> int:
+        """Number of successful attempts."""
+        return self._stats.counters()['success']
+
+    @property
+    def success_rate(self) -> float:
+        """Fraction of attempts that succeeded."""
+        counters = self._stats.counters()
+        return counters['success'] / counters['attempts'] if counters['attempts'] else 0.0
+
+    @property
+    def latency(self) -> LatencyStats:
+        """Latency histograms merged across all threads."""
+        return self._stats.latency()
+
+    def _record_attempt(self, host: str, elapsed: float, success: bool,
+                        ttfb: Optional[float] = None, body: Optional[float] = None) -> None:
+        """Update request stats and latency histograms after one attempt.
+
+        Args:
+            host: Host the attempt targeted.
+            elapsed: Duration of the attempt in seconds.
+            success: Whether the attempt succeeded.
+            ttfb: Optional time to first byte in seconds.
+            body: Optional body download time in seconds.
+        """
+        self._stats.record_attempt(host, elapsed, success, ttfb=ttfb, body=body)
 
-    def random_delay(self, min_delay: float = 1.0, max_delay: float = 5.0) -> None:
-        """Wait for a random amount of time to avoid detection.
+    def _record_timings(self, host: str, ttfb: Optional[float] = None, body: Optional[float] = None) -> None:
+        """Record response phase timings for a request.
 
         Args:
-            min_delay: Minimum delay in seconds.
-            max_delay: Maximum delay in seconds.
+            host: Host the response came from.
+            ttfb: Time to first byte in seconds.
+            body: Body download time in seconds.
+        """
+        self._stats.record_timings(host, ttfb=ttfb, body=body)
+
+    def parse_html(self, html: str) -> Any:
+        """Parse HTML with the configured parser backend and record the parse time.
+
+        Args:
+            html: HTML content to parse.
+
+        Returns:
+            Parsed document (see ``scrapers.html_parser.parse_html``).
         """
-        # Use a non-uniform distribution to make delays appear more human-like
-        # More weight towards shorter delays, but occasional longer ones
-        delay = min_delay + (max_delay - min_delay) * (random.random() ** 2)
-        time.sleep(delay)
+        # Imported here because html_parser depends on this module
+        from scrapers.html_parser import parse_html, resolve_backend
+        
+        if self._parser_backend is None:
+            self._parser_backend = resolve_backend(self.parser)
+        start_time = time.perf_counter()
+        document = parse_html(html, self._parser_backend)
+        self._stats.record_parse(self._parser_backend, time.perf_counter() - start_time)
+        return document
+
+    def submit_with_backoff(self, func: Callable, *args, host: str = '', **kwargs) -> Future:
+        """Schedule a function with exponential backoff without blocking.
+
+        Failed attempts are parked on the retry scheduler until their backoff
+        expires, so no thread sleeps while waiting to retry. Attempts waiting
+        for the host's turn on the rate limiter are parked the same way.
+
+        Args:
+            func: Function to retry.
+            *args: Arguments to pass to the function.
+            host: Host the call targets, used for per-host retry queue depth.
+            **kwargs: Keyword arguments to pass to the function.
+
+        Returns:
+            Future resolved with the result of the function, or with the last
+            exception if all retries fail.
+        """
+        def _attempt(attempt: int) -> Any:
+            start_time = time.time()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                self._record_attempt(host, time.time() - start_time, success=False)
+                raise
+            self._record_attempt(host, time.time() - start_time, success=True)
+            return result
+
+        def _backoff(attempt: int, error: Exception) -> float:
+            # Wait exactly as long as the server asked, if it did
+            retry_after = getattr(error, 'retry_after', None)
+            if retry_after is not None:
+                return retry_after
+            return self.retry_delay * (2 ** (attempt - 1)) + random.uniform(0, 1)
+
+        def _on_retry(attempt: int, error: Exception, wait_time: float) -> None:
+            logger.warning("Attempt %s/%s failed: %s. Retrying in %.2f seconds...", attempt, self.max_retries, error, wait_time)
+
+            # Rotate user agent on retry
+            self.rotate_user_agent()
+
+            # If we've retried multiple times, try clearing cookies
+            if attempt > self.max_retries // 2:
+                logger.info("Clearing cookies for fresh session")
+                self.cookies = {}
+                if self.session:
+                    self.session.cookies.clear()
+
+        return self.retry_scheduler.submit(_attempt, host=host, max_retries=self.max_retries,
+                                           backoff=_backoff, on_retry=_on_retry,
+                                           throttle=lambda: self._reserve(host))
 
     def retry_with_backoff(self, func: Callable, *args, **kwargs) -> Any:
         """Retry a function with exponential backoff.
 
+        Blocks the calling thread until the result is available; the backoff
+        itself is handled by the retry scheduler (see ``submit_with_backoff``).
+
         Args:
             func: Function to retry.
             *args: Arguments to pass to the function.
@@ -166,49 +396,15 @@ class BaseScraper(ABC):
             Result of the function.
 
         Raises:
-            ScraperException: If all retries fail.
+            ScraperException: If all retries fail. Errors that are not
+                retryable are raised as they are, after the first attempt.
         """
-        retries = 0
-        while retries < self.max_retries:
-            try:
-                start_time = time.time()
-                result = func(*args, **kwargs)
-                elapsed = time.time() - start_time
-                
-                # Update stats
-                self.stats['requests'] += 1
-                self.stats['success'] += 1
-                self.stats['total_time'] += elapsed
-                self.stats['avg_response_time'] = self.stats['total_time'] / self.stats['success']
-                
-                # Update success rate
-                self.request_count += 1
-                self.success_count += 1
-                self.success_rate = self.success_count / self.request_count
-                
-                return result
-            except Exception as e:
-                self.stats['failures'] += 1
-                self.stats['retries'] += 1
-                self.request_count += 1
-                self.success_rate = self.success_count / self.request_count
-                
-                wait_time = self.retry_delay * (2 ** retries) + random.uniform(0, 1)
-                logger.warning(f"Attempt {retries + 1}/{self.max_retries} failed: {e}. Retrying in {wait_time:.2f} seconds...")
-                time.sleep(wait_time)
-                retries += 1
-                
-                # Rotate user agent on retry
-                self.rotate_user_agent()
-                
-                # If we've retried multiple times, try clearing cookies
-                if retries > self.max_retries // 2:
-                    logger.info("Clearing cookies for fresh session")
-                    self.cookies = {}
-                    if self.session:
-                        self.session.cookies.clear()
-        
-        raise ScraperException(f"Failed after {self.max_retries} retries")
+        try:
+            return self.submit_with_backoff(func, *args, **kwargs).result()
+        except Exception as e:
+            if not getattr(e, 'retryable', True):
+                raise
+            raise ScraperException(f"Failed after {self.max_retries} retries") from e
 
     @abstractmethod
     def get_page(self, url: str, **kwargs) -> str:
@@ -223,6 +419,68 @@ class BaseScraper(ABC):
         """
         pass
 
+    async def aget_page(self, url: str, **kwargs) -> str:
+        """Get page content without blocking the event loop.
+
+        The default implementation runs the synchronous ``get_page`` in the
+        loop's default executor. Engines with a native async transport
+        override this.
+
+        Args:
+            url: URL to fetch.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Page content as HTML string.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.get_page(url, **kwargs))
+
+    async def afetch_many(self, urls: Iterable[str], concurrency: int = 10,
+                          **kwargs) -> AsyncIterator[Tuple[str, Union[str, Exception]]]:
+        """Fetch many URLs concurrently, yielding results as they finish.
+
+        At most ``concurrency`` fetches are in flight at any time. Failures do
+        not abort the batch; the exception is yielded in place of the content.
+
+        Args:
+            urls: URLs to fetch.
+            concurrency: Maximum number of fetches in flight.
+            **kwargs: Additional keyword arguments passed to ``aget_page``.
+
+        Yields:
+            Tuples of (url, content) or (url, exception), in completion order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        async def _fetch(url: str) -> Tuple[str, Union[str, Exception]]:
+            try:
+                return url, await self.aget_page(url, **kwargs)
+            except Exception as e:
+                logger.warning("Error fetching %s: %s", url, e)
+                return url, e
+
+        # Keep a sliding window of tasks so large URL iterators aren't
+        # materialized up front
+        pending = set()
+        url_iter = iter(urls)
+        try:
+            while True:
+                for url in url_iter:
+                    pending.add(asyncio.ensure_future(_fetch(url)))
+                    if len(pending) >= concurrency:
+                        break
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # Don't leave fetches running if the consumer stops early
+            for task in pending:
+                task.cancel()
+
     @abstractmethod
     def close(self) -> None:
         """Close the scraper and clean up resources."""
@@ -234,7 +492,14 @@ class BaseScraper(ABC):
         Returns:
             Dictionary of scraper statistics.
         """
+        counters = self._stats.counters()
         return {
-            **self.stats,
-            'success_rate': self.success_rate,
+            **self._summarize_counters(counters),
+            'success_rate': counters['success'] / counters['attempts'] if counters['attempts'] else 0.0,
+            'retry_queue': self._retry_scheduler.queue_depths() if self._retry_scheduler else {},
+            'latency': self.latency.snapshot(),
+            'parse': {backend: histogram.snapshot() for backend, histogram in self._stats.parse_latency().items()},
+            **({'rate_limiter': self.rate_limiter.get_stats()} if self.rate_limiter else {}),
+            **({'robots': self.robots.get_stats()} if self.robots else {}),
+            **({'dns_cache': dns_cache.get_dns_cache().get_stats()} if dns_cache.get_dns_cache() else {}),
         }
@@ -7,16 +7,18 @@ This module implements a scraper using CloudScraper for bypassing Cloudflare pro
 
 import logging
 import random
+import threading
 import time
 from typing import Dict, Any, Optional, List, Union
 import os
 import json
 
 import cloudscraper
-from bs4 import BeautifulSoup
 import requests
 
 from scrapers.base_scraper import BaseScraper, ScraperException
+from scrapers.streaming import read_body, DEFAULT_CHUNK_SIZE
+from scrapers.url_utils import get_host
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -39,16 +41,36 @@ class CloudScraperEngine(BaseScraper):
         self.interpreter = self.config.get('interpreter', 'js2py')  # js2py, nodejs
         self.allow_brotli = self.config.get('allow_brotli', True)
         
-        # Initialize CloudScraper
+        # Streaming downloads with an optional cap on the decompressed body size
+        self.stream = self.config.get('stream', False)
+        self.max_body_size = self.config.get('max_body_size', None)
+        self.stream_chunk_size = self.config.get('stream_chunk_size', DEFAULT_CHUNK_SIZE)
+        
+        # Initialize CloudScraper; fetches on other threads may replace the
+        # session after a failure, so swaps happen under a lock
+        self.scraper = None
+        self._scraper_lock = threading.Lock()
         self._initialize_scraper()
         
-        logger.info(f"Initialized CloudScraper engine with {self.browser} browser")
+        logger.info("Initialized CloudScraper engine with %s browser", self.browser)
+
+    def _initialize_scraper(self, stale: Any = None) -> None:
+        """Initialize the CloudScraper session, closing the one it replaces.
+
+        Args:
+            stale: Session the caller saw fail. If another thread has already
+                replaced it, the current session is kept.
+        """
+        with self._scraper_lock:
+            if stale is not None and self.scraper is not stale:
+                return
+            self._replace_scraper()
 
-    def _initialize_scraper(self) -> None:
-        """Initialize the CloudScraper session."""
+    def _replace_scraper(self) -> None:
+        """Build a new CloudScraper session; the caller holds the lock."""
         try:
             # Create a CloudScraper instance
-            self.scraper = cloudscraper.create_scraper(
+            scraper = cloudscraper.create_scraper(
                 browser={
                     'browser': self.browser,
                     'platform': 'darwin',  # macOS
@@ -61,50 +83,62 @@ class CloudScraperEngine(BaseScraper):
             )
             
             # Set default headers
-            self.scraper.headers.update(self.headers)
+            scraper.headers.update(self.headers)
             
             # Set cookies if any
             if self.cookies:
                 for name, value in self.cookies.items():
-                    self.scraper.cookies.set(name, value)
+                    scraper.cookies.set(name, value)
             
             # Add common cookies that help bypass Cloudflare
-            self.scraper.cookies.set('cf_clearance', '', domain='filmfreeway.com')
-            self.scraper.cookies.set('__cf_bm', '', domain='filmfreeway.com')
+            scraper.cookies.set('cf_clearance', '', domain='filmfreeway.com')
+            scraper.cookies.set('__cf_bm', '', domain='filmfreeway.com')
             
         except Exception as e:
-            logger.error(f"Error initializing CloudScraper: {e}")
+            logger.error("Error initializing CloudScraper: %s", e)
             raise ScraperException(f"Failed to initialize CloudScraper: {e}")
+        
+        previous, self.scraper = self.scraper, scraper
+        if previous is not None:
+            previous.close()
 
     def get_page(self, url: str, **kwargs) -> str:
         """Get page content using CloudScraper.
 
         Args:
             url: URL to fetch.
-            **kwargs: Additional keyword arguments.
+            **kwargs: Additional keyword arguments. ``stream``,
+                ``max_body_size`` and ``stop_when`` override the streaming
+                settings for this call (see ``scrapers.streaming.read_body``).
 
         Returns:
             Page content as HTML string.
         """
+        # Session the latest attempt went through
+        used = None
+        
         def _fetch_page(url):
+            nonlocal used
+            scraper = used = self.scraper
             method = kwargs.get('method', 'GET')
             params = kwargs.get('params', None)
             data = kwargs.get('data', None)
             json_data = kwargs.get('json', None)
             timeout = kwargs.get('timeout', 30)
             proxies = kwargs.get('proxies', None)
+            stream = kwargs.get('stream', self.stream)
             
-            # Rotate user agent for each request
-            self.rotate_user_agent()
-            self.scraper.headers.update({"User-Agent": self.current_user_agent})
+            # Rotate the user agent for each request; headers go with the
+            # request because the session is shared between threads
+            headers = {"User-Agent": self._get_random_user_agent()}
             
             # Set the referer to make the request appear more legitimate
             if 'referer' in kwargs:
-                self.scraper.headers.update({"Referer": kwargs['referer']})
+                headers["Referer"] = kwargs['referer']
             elif url.startswith('https://filmfreeway.com/'):
-                self.scraper.headers.update({"Referer": "https://filmfreeway.com/"})
+                headers["Referer"] = "https://filmfreeway.com/"
             else:
-                self.scraper.headers.update({"Referer": "https://www.google.com/"})
+                headers["Referer"] = "https://www.google.com/"
             
             # Add a random query parameter to bypass caching
             cache_buster = f"_cb={random.randint(1000000, 9999999)}"
@@ -114,50 +148,72 @@ class CloudScraperEngine(BaseScraper):
                 request_url = f"{url}?{cache_buster}"
             
             # Make the request
+            request_start = time.time()
             if method.upper() == 'POST':
-                response = self.scraper.post(
+                response = scraper.post(
                     request_url,
                     params=params,
+                    headers=headers,
                     data=data,
                     json=json_data,
                     timeout=timeout,
-                    proxies=proxies
+                    proxies=proxies,
+                    stream=stream
                 )
             else:
-                response = self.scraper.get(
+                response = scraper.get(
                     request_url,
                     params=params,
+                    headers=headers,
                     timeout=timeout,
-                    proxies=proxies
+                    proxies=proxies,
+                    stream=stream
                 )
             
-            response.raise_for_status()
+            if stream:
+                html = read_body(response, max_bytes=kwargs.get('max_body_size', self.max_body_size),
+                                 stop_when=kwargs.get('stop_when'), chunk_size=self.stream_chunk_size)
+            else:
+                html = response.text
             
-            # Extract and update cookies
-            self.update_cookies(dict(response.cookies))
+            # response.elapsed stops once the headers are parsed; the rest is the body
+            ttfb = response.elapsed.total_seconds()
+            self._record_timings(get_host(url), ttfb=ttfb, body=max(0.0, time.time() - request_start - ttfb))
             
             # Check if we need to reinitialize the scraper due to Cloudflare issues
-            if 'CF-RAY' in response.headers and response.status_code == 503:
+            if 'CF-RAY' in response.headers and response.status_code == 503 and 'Retry-After' not in response.headers:
                 logger.warning("Detected Cloudflare challenge, reinitializing scraper...")
-                self._initialize_scraper()
+                self._initialize_scraper(stale=scraper)
                 raise ScraperException("Cloudflare challenge detected, retrying...")
             
-            return response.text
-        
-        try:
-            # Use retry with backoff for the request
-            content = self.retry_with_backoff(_fetch_page, url)
+            # Fail or back off according to the status; a throttled host is
+            # paused for its Retry-After
+            self._check_response(url, response.status_code, response.headers)
             
-            # Random delay to appear more human-like
-            self.random_delay(2.0, 5.0)
+            # Extract and update cookies
+            self.update_cookies(dict(response.cookies))
             
-            return content
+            return html
+        
+        # Checked once up front, so Crawl-delay is applied before the first
+        # rate limiter slot is booked and a disallowed URL never takes one
+        self._check_robots(url)
+        
+        try:
+            # Use retry with backoff for the request; each attempt waits for
+            # the host's turn on the rate limiter
+            return self.retry_with_backoff(_fetch_page, url, host=get_host(url))
             
         except Exception as e:
-            logger.error(f"Error in get_page: {e}")
+            # A 404 or an oversized body would be the same with a fresh
+            # session, so keep the warmed one and its cookies
+            if not getattr(e, 'retryable', True):
+                raise
+            
+            logger.error("Error in get_page: %s", e)
             
             # If we've exhausted retries with CloudScraper, try to reinitialize
-            self._initialize_scraper()
+            self._initialize_scraper(stale=used)
             
             # Re-raise the exception for the caller to handle
             raise
@@ -165,22 +221,24 @@ class CloudScraperEngine(BaseScraper):
     def close(self) -> None:
         """Close the scraper and clean up resources."""
         try:
+            self._close_retry_scheduler()
             if self.scraper:
                 self.scraper.close()
             logger.info("Closed CloudScraper engine")
         except Exception as e:
-            logger.error(f"Error closing CloudScraper engine: {e}")
+            logger.error("Error closing CloudScraper engine: %s", e)
 
-    def extract_data(self, html: str) -> BeautifulSoup:
-        """Extract data from HTML using BeautifulSoup.
+    def extract_data(self, html: str) -> Any:
+        """Extract data from HTML using the configured parser backend.
 
         Args:
             html: HTML content to parse.
 
         Returns:
-            BeautifulSoup object.
+            Parsed document; a BeautifulSoup object unless the selectolax
+            backend is configured.
         """
-        return BeautifulSoup(html, 'html.parser')
+        return self.parse_html(html)
 
     def get_cookies(self) -> Dict[str, str]:
         """Get cookies from the current session.
@@ -192,13 +250,13 @@ class CloudScraperEngine(BaseScraper):
             if self.scraper:
                 # Extract cookies from the cloudscraper session
                 cookies = {name: value for name, value in self.scraper.cookies.items()}
-                logger.info(f"Retrieved {len(cookies)} cookies from CloudScraperEngine")
+                logger.info("Retrieved %s cookies from CloudScraperEngine", len(cookies))
                 return cookies
             else:
                 logger.warning("No active scraper session to get cookies from")
                 return {}
         except Exception as e:
-            logger.error(f"Error getting cookies from CloudScraperEngine: {e}")
+            logger.error("Error getting cookies from CloudScraperEngine: %s", e)
             return {}
 
     def detect_cloudflare_captcha(self, html: str) -> bool:
@@ -210,7 +268,7 @@ class CloudScraperEngine(BaseScraper):
         Returns:
             True if a CAPTCHA is detected, False otherwise.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self.parse_html(html)
         
         # Check for common Cloudflare CAPTCHA elements
         if soup.select('form[action="/?__cf_chl_captcha_tk="]'):
@@ -233,7 +291,7 @@ class CloudScraperEngine(BaseScraper):
         Args:
             url: URL that triggered the CAPTCHA.
         """
-        logger.warning(f"Cloudflare CAPTCHA detected for {url}, reinitializing scraper...")
+        logger.warning("Cloudflare CAPTCHA detected for %s, reinitializing scraper...", url)
         
         # Wait a bit longer before retrying
         time.sleep(random.uniform(10, 20))
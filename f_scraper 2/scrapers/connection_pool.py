@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Connection Pooling
+
+This module provides a Requests transport adapter with tunable urllib3 pool
+sizes and per-host connection reuse metrics. Every request that is served by
+an already-open connection is a pool hit; every new connection is a miss that
+pays a TCP (and usually TLS) handshake.
+
+It also provides a pool of Requests sessions, so one scraper can serve many
+threads: each caller leases a session with its own headers and cookies, while
+all sessions share the same adapters and therefore the same connections.
+"""
+
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterable, Iterator, List
+
+import requests
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that keeps request and connection counts for its pools.
+
+    urllib3 pools count the requests they serve and the connections they open.
+    Pools evicted from the pool manager are folded into a retired total so the
+    counts survive eviction.
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOLSIZE, pool_maxsize: int = DEFAULT_POOLSIZE,
+                 pool_block: bool = False, **kwargs):
+        """Initialize the adapter.
+
+        Args:
+            pool_connections: Number of per-host pools to keep.
+            pool_maxsize: Maximum number of idle connections kept per host.
+            pool_block: Wait for a free connection instead of opening an
+                extra one when a pool is exhausted.
+            **kwargs: Additional arguments passed to HTTPAdapter.
+        """
+        self._retired: Dict[str, Dict[str, int]] = {}
+        self._retired_lock = threading.Lock()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                         pool_block=pool_block, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self._track(self.poolmanager)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs):
+        is_new = proxy not in self.proxy_manager
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if is_new:
+            self._track(manager)
+        return manager
+
+    def _track(self, manager) -> None:
+        """Fold the counts of pools evicted from a pool manager into the retired totals."""
+        pools = manager.pools
+        previous = pools.dispose_func
+
+        def _dispose(pool) -> None:
+            with self._retired_lock:
+                self._add(self._retired, pool)
+            if previous:
+                previous(pool)
+
+        pools.dispose_func = _dispose
+
+    @staticmethod
+    def _add(hosts: Dict[str, Dict[str, int]], pool) -> None:
+        counts = hosts.setdefault(pool.host, {'requests': 0, 'new_connections': 0})
+        counts['requests'] += pool.num_requests
+        counts['new_connections'] += pool.num_connections
+
+    def pool_counts(self) -> Dict[str, Dict[str, int]]:
+        """Get raw request and new connection counts per host.
+
+        Returns:
+            Dictionary mapping host to its 'requests' and 'new_connections'.
+        """
+        with self._retired_lock:
+            hosts = {host: dict(counts) for host, counts in self._retired.items()}
+
+        for manager in [self.poolmanager] + list(self.proxy_manager.values()):
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is not None:
+                    self._add(hosts, pool)
+        return hosts
+
+
+def summarize_pool_counts(adapters: Iterable[PooledHTTPAdapter]) -> Dict[str, Any]:
+    """Merge the pool counts of several adapters into hit/miss statistics.
+
+    Args:
+        adapters: Adapters to summarize.
+
+    Returns:
+        Dictionary with overall requests, hits (reused connections), misses
+        (new connections) and hit rate, plus the same per host under 'hosts'.
+    """
+    hosts: Dict[str, Dict[str, int]] = {}
+    for adapter in adapters:
+        for host, counts in adapter.pool_counts().items():
+            merged = hosts.setdefault(host, {'requests': 0, 'new_connections': 0})
+            merged['requests'] += counts['requests']
+            merged['new_connections'] += counts['new_connections']
+
+    def _summary(requests: int, new_connections: int) -> Dict[str, Any]:
+        hits = max(0, requests - new_connections)
+        return {
+            'requests': requests,
+            'hits': hits,
+            'misses': new_connections,
+            'hit_rate': hits / requests if requests else 0.0,
+        }
+
+    return {
+        **_summary(sum(c['requests'] for c in hosts.values()),
+                   sum(c['new_connections'] for c in hosts.values())),
+        'hosts': {host: _summary(c['requests'], c['new_connections']) for host, c in hosts.items()},
+    }
+
+
+class SessionPool:
+    """Sessions leased to one caller at a time, created on demand up to a limit."""
+
+    def __init__(self, create_session: Callable[[], requests.Session], size: int = 8):
+        """Initialize the session pool.
+
+        Args:
+            create_session: Callable building a new, ready to use session.
+            size: Maximum number of sessions; callers wait for a free one
+                once they all are leased.
+        """
+        self.size = max(1, size)
+        self._create_session = create_session
+        # LIFO so the most recently used (warmest) session is leased first
+        self._idle: 'queue.LifoQueue[requests.Session]' = queue.LifoQueue()
+        self._sessions: List[requests.Session] = []
+        self._lock = threading.Lock()
+        self._stats = {'leases': 0, 'waits': 0}
+
+    def add(self, session: requests.Session) -> None:
+        """Put an existing session in the pool.
+
+        Args:
+            session: Session to add; counts towards the size limit.
+        """
+        with self._lock:
+            self._sessions.append(session)
+        self._idle.put(session)
+
+    @property
+    def sessions(self) -> List[requests.Session]:
+        """All sessions of the pool, leased or idle."""
+        with self._lock:
+            return list(self._sessions)
+
+    @contextmanager
+    def lease(self) -> Iterator[requests.Session]:
+        """Lease a session for the duration of a ``with`` block.
+
+        Yields:
+            A session no other caller is using.
+        """
+        session = self._acquire()
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+    def _acquire(self) -> requests.Session:
+        try:
+            session = self._idle.get_nowait()
+        except queue.Empty:
+            session = None
+
+        if session is None:
+            with self._lock:
+                if len(self._sessions) < self.size:
+                    session = self._create_session()
+                    self._sessions.append(session)
+                else:
+                    self._stats['waits'] += 1
+        if session is None:
+            session = self._idle.get()
+
+        with self._lock:
+            self._stats['leases'] += 1
+        return session
+
+    def close(self) -> None:
+        """Close every session of the pool."""
+        for session in self.sessions:
+            session.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session pool statistics.
+
+        Returns:
+            Dictionary with the pool size, sessions created, idle sessions,
+            leases and leases that had to wait.
+        """
+        with self._lock:
+            return {'size': self.size, 'sessions': len(self._sessions), 'idle': self._idle.qsize(), **self._stats}
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+DNS Cache
+
+This module implements a process-wide DNS resolution cache. Once installed it
+wraps ``socket.getaddrinfo``, so every engine built on the standard socket
+layer (Requests, CloudScraper, HTTPX) and the proxy health checker resolve
+each host once per TTL instead of on every new connection.
+
+The system resolver does not report record TTLs, so answers are kept for a
+configured TTL. With ``record_ttl`` set and dnspython installed, the record's
+own TTL is looked up on a miss and used if it is shorter; that costs a second
+DNS query per miss, so it is off by default.
+"""
+
+import importlib.util
+import ipaddress
+import logging
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# The real resolver, captured before any patching
+_system_getaddrinfo = socket.getaddrinfo
+
+_installed: Optional['DnsCache'] = None
+_install_lock = threading.Lock()
+
+
+class _Entry:
+    """Resolved addresses of a host, or the error resolving it raised."""
+
+    __slots__ = ('addresses', 'error', 'expires')
+
+    def __init__(self, addresses: Optional[List[tuple]], error: Optional[socket.gaierror], expires: float):
+        self.addresses = addresses
+        self.error = error
+        self.expires = expires
+
+
+class DnsCache:
+    """TTL cache in front of ``socket.getaddrinfo``.
+
+    Hosts are resolved once for all families and socket types with port 0;
+    each lookup filters the cached answers and fills in the requested port.
+    """
+
+    def __init__(self, ttl: float = 300, negative_ttl: float = 30, max_entries: int = 4096,
+                 record_ttl: bool = False, prefetch_workers: int = 4):
+        """Initialize the DNS cache.
+
+        Args:
+            ttl: Maximum time in seconds to keep an answer.
+            negative_ttl: Time in seconds to remember a failed lookup.
+            max_entries: Maximum number of hosts kept.
+            record_ttl: Use the record's TTL when shorter (needs dnspython).
+                Makes a second DNS query on every miss.
+            prefetch_workers: Number of threads resolving prefetched hosts.
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.record_ttl = record_ttl and importlib.util.find_spec('dns') is not None
+        self.prefetch_workers = prefetch_workers
+        self._entries: 'OrderedDict[Tuple[str, int], _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+        self._stats = {'hits': 0, 'misses': 0, 'negative_hits': 0, 'prefetched': 0}
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0) -> List[tuple]:
+        """Drop-in replacement for ``socket.getaddrinfo``."""
+        # Only plain host names with numeric ports are cached
+        if not isinstance(host, str) or not (port is None or isinstance(port, int)) or _is_ip(host):
+            return _system_getaddrinfo(host, port, family, type, proto, flags)
+
+        key = (host.lower(), flags)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > now:
+                self._entries.move_to_end(key)
+                self._stats['negative_hits' if entry.error else 'hits'] += 1
+            else:
+                entry = None
+                self._stats['misses'] += 1
+
+        if entry is None:
+            entry = self._resolve(key)
+
+        if entry.error is not None:
+            raise entry.error
+        return _select(entry.addresses, port or 0, family, type, proto)
+
+    def _resolve(self, key: Tuple[str, int]) -> _Entry:
+        """Resolve a host with the system resolver and cache the answer."""
+        host, flags = key
+        try:
+            addresses = _system_getaddrinfo(host, None, 0, 0, 0, flags)
+        except socket.gaierror as e:
+            entry = _Entry(None, e, time.monotonic() + self.negative_ttl)
+        else:
+            ttl = self.ttl
+            if self.record_ttl:
+                record_ttl = _lookup_record_ttl(host)
+                if record_ttl is not None:
+                    ttl = min(ttl, record_ttl)
+            entry = _Entry(addresses, None, time.monotonic() + ttl)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def prefetch(self, hosts: Iterable[str]) -> List[Future]:
+        """Resolve hosts in the background so the first connection hits the cache.
+
+        Hosts that are already cached and fresh are skipped, and nothing is
+        prefetched once the cache is closed.
+
+        Args:
+            hosts: Host names to resolve.
+
+        Returns:
+            Futures for the lookups that were started.
+        """
+        now = time.monotonic()
+        pending = []
+        with self._lock:
+            if self._closed:
+                return []
+            for host in set(h.lower() for h in hosts if h and not _is_ip(h)):
+                entry = self._entries.get((host, 0))
+                if entry is None or entry.expires <= now:
+                    pending.append(host)
+            if pending and self._executor is None:
+                self._executor = ThreadPoolExecutor(self.prefetch_workers, thread_name_prefix='dns-prefetch')
+            self._stats['prefetched'] += len(pending)
+            # Submitted under the lock so close() can't shut the executor down in between
+            return [self._executor.submit(self._resolve, (host, 0)) for host in pending]
+
+    def clear(self) -> None:
+        """Forget all cached answers."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit, miss and prefetch counts and the hit rate.
+        """
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['negative_hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'hit_rate': (self._stats['hits'] + self._stats['negative_hits']) / lookups if lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        """Stop the prefetch threads."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False)
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.split('%', 1)[0])
+    except ValueError:
+        return False
+    return True
+
+
+def _select(addresses: List[tuple], port: int, family: int, type: int, proto: int) -> List[tuple]:
+    """Filter cached answers like getaddrinfo would and set the port."""
+    selected = []
+    for af, socktype, protocol, canonname, sockaddr in addresses:
+        if (family and af != family) or (type and socktype != type) or (proto and protocol != proto):
+            continue
+        selected.append((af, socktype, protocol, canonname, (sockaddr[0], port) + tuple(sockaddr[2:])))
+    if not selected:
+        raise socket.gaierror(socket.EAI_FAMILY if family else socket.EAI_SOCKTYPE, "No matching address")
+    return selected
+
+
+def _lookup_record_ttl(host: str) -> Optional[float]:
+    """Get the TTL of a host's address record with dnspython, if possible."""
+    try:
+        import dns.resolver
+
+        answer = dns.resolver.resolve(host, 'A', raise_on_no_answer=False, lifetime=2)
+        if answer.rrset is None:
+            answer = dns.resolver.resolve(host, 'AAAA', lifetime=2)
+        return float(answer.rrset.ttl)
+    except Exception as e:
+        logger.debug("Could not get the DNS record TTL of %s: %s", host, e)
+        return None
+
+
+def install(**options) -> DnsCache:
+    """Install a process-wide DNS cache in place of ``socket.getaddrinfo``.
+
+    If a cache is already installed it is returned unchanged.
+
+    Args:
+        **options: Options for DnsCache.
+
+    Returns:
+        The installed cache.
+    """
+    global _installed
+
+    with _install_lock:
+        if _installed is None:
+            _installed = DnsCache(**options)
+            socket.getaddrinfo = _installed.getaddrinfo
+            logger.info("Installed DNS cache (ttl %ss)", _installed.ttl)
+        return _installed
+
+
+def uninstall() -> None:
+    """Restore the system resolver and drop the installed cache."""
+    global _installed
+
+    with _install_lock:
+        if _installed is not None:
+            socket.getaddrinfo = _system_getaddrinfo
+            _installed.close()
+            _installed = None
+
+
+def get_dns_cache() -> Optional[DnsCache]:
+    """Get the installed DNS cache, if any."""
+    return _installed
+
+
+def install_from_config(setting: Any) -> Optional[DnsCache]:
+    """Install the DNS cache as requested by a ``dns_cache`` config value.
+
+    Args:
+        setting: False/None to leave resolution alone, True for the default
+            options, or a dict of DnsCache options.
+
+    Returns:
+        The installed cache, or None if the setting is off.
+    """
+    if not setting:
+        return None
+    return install(**(setting if isinstance(setting, dict) else {}))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+HTML Parser Backends
+
+This module selects the HTML parser used by the scrapers. BeautifulSoup is
+used with lxml when it is installed, falling back to the pure-Python
+``html.parser``. The selectolax (lexbor) backend is much faster still and is
+exposed through a small adapter offering the CSS-select surface the
+extractors use: ``select``, ``select_one``, ``get_text`` and ``get``.
+"""
+
+import importlib.util
+import logging
+from typing import Any, Dict, List, Optional
+
+from scrapers.base_scraper import ScraperException
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('lxml', 'html.parser', 'selectolax')
+
+
+def _installed(module: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    return importlib.util.find_spec(module) is not None
+
+
+def resolve_backend(backend: str = 'auto') -> str:
+    """Resolve a parser backend name.
+
+    ``auto`` picks BeautifulSoup with lxml if installed, else ``html.parser``.
+    A backend that is not installed falls back to ``html.parser`` with a
+    warning.
+
+    Args:
+        backend: One of 'auto', 'lxml', 'html.parser' or 'selectolax'.
+
+    Returns:
+        Name of the backend that will be used.
+
+    Raises:
+        ScraperException: If the backend name is unknown.
+    """
+    if backend == 'auto':
+        return 'lxml' if _installed('lxml') else 'html.parser'
+    if backend not in BACKENDS:
+        raise ScraperException(f"Unknown HTML parser backend '{backend}'")
+    if backend != 'html.parser' and not _installed(backend):
+        logger.warning("HTML parser backend '%s' is not installed, using html.parser", backend)
+        return 'html.parser'
+    return backend
+
+
+class SelectolaxNode:
+    """Adapter giving a selectolax node the BeautifulSoup select API.
+
+    Unlike BeautifulSoup, multi-valued attributes such as ``class`` are
+    returned as plain strings.
+    """
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node: Any):
+        self._node = node
+
+    def select(self, selector: str) -> List['SelectolaxNode']:
+        """Get all descendants matching a CSS selector."""
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector: str) -> Optional['SelectolaxNode']:
+        """Get the first descendant matching a CSS selector, or None."""
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        """Get the text of the node and its descendants."""
+        return self._node.text(deep=True, separator=separator, strip=strip)
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    @property
+    def name(self) -> Optional[str]:
+        return getattr(self._node, 'tag', None)
+
+    @property
+    def attrs(self) -> Dict[str, Optional[str]]:
+        return dict(getattr(self._node, 'attributes', {}))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get an attribute value, or ``default`` if it is missing."""
+        value = self.attrs.get(key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Optional[str]:
+        return self.attrs[key]
+
+    def __repr__(self) -> str:
+        return f"<SelectolaxNode {self.name}>"
+
+
+def parse_html(html: str, backend: str = 'auto') -> Any:
+    """Parse HTML with the given backend.
+
+    Args:
+        html: HTML content to parse.
+        backend: Backend name, see ``resolve_backend``.
+
+    Returns:
+        BeautifulSoup object, or a SelectolaxNode for the selectolax backend.
+    """
+    backend = resolve_backend(backend)
+    if backend == 'selectolax':
+        from selectolax.lexbor import LexborHTMLParser
+        return SelectolaxNode(LexborHTMLParser(html))
+
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, backend)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+HTTP Validator Cache
+
+This module implements a response cache that revalidates with the origin
+instead of trusting freshness. Pages are stored with their ``ETag`` and
+``Last-Modified`` validators; a refetch sends ``If-None-Match`` /
+``If-Modified-Since`` and a ``304 Not Modified`` reply is served from the
+local store without downloading the body again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Mapping
+
+from scrapers.url_utils import normalize_url
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class CachedPage:
+    """A cached page body with its validators."""
+
+    __slots__ = ('url', 'body', 'etag', 'last_modified', 'stored_at')
+
+    def __init__(self, url: str, body: str, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None, stored_at: float = 0):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at or time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the cached page to a dictionary."""
+        return {
+            'url': self.url,
+            'body': self.body,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'stored_at': self.stored_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CachedPage':
+        """Create a cached page from a dictionary."""
+        return cls(data['url'], data['body'], data.get('etag'), data.get('last_modified'), data.get('stored_at', 0))
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get the headers that make a refetch conditional on this copy.
+
+        Returns:
+            Dictionary with If-None-Match and/or If-Modified-Since.
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpValidatorCache:
+    """LRU store of pages keyed on the normalized URL, optionally persisted to disk."""
+
+    def __init__(self, max_entries: int = 1024, directory: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of pages kept in memory.
+            directory: Optional directory to persist pages in across runs.
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries: 'OrderedDict[str, CachedPage]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'lookups': 0, 'revalidated': 0, 'stored': 0}
+
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Look up the cached copy of a URL.
+
+        Args:
+            url: URL to look up (normalized before lookup).
+
+        Returns:
+            Cached page, or None if there is no copy.
+        """
+        key = normalize_url(url)
+        with self._lock:
+            self._stats['lookups'] += 1
+            page = self._entries.get(key)
+            if page is not None:
+                self._entries.move_to_end(key)
+                return page
+
+        if not self.directory:
+            return None
+
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                page = CachedPage.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Error reading cached page for %s: %s", key, e)
+            return None
+
+        self._remember(key, page)
+        return page
+
+    def store(self, url: str, body: str, headers: Mapping[str, str]) -> Optional[CachedPage]:
+        """Store a page if the response carries validators.
+
+        Args:
+            url: URL the page was fetched from.
+            body: Decoded page body.
+            headers: Response headers (case-insensitive mapping).
+
+        Returns:
+            The cached page, or None if the response had no validators.
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        cache_control = headers.get('Cache-Control', '').lower()
+        if not (etag or last_modified) or 'no-store' in cache_control:
+            return None
+
+        key = normalize_url(url)
+        page = CachedPage(key, body, etag, last_modified)
+        self._remember(key, page)
+        with self._lock:
+            self._stats['stored'] += 1
+
+        if self.directory:
+            self._persist(key, page)
+        return page
+
+    def _persist(self, key: str, page: CachedPage) -> None:
+        # Write to a file of our own and swap it in, so a crash or a
+        # concurrent store of the same URL never leaves a truncated entry
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(page.to_dict(), f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("Error persisting cached page for %s: %s", key, e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def mark_revalidated(self, page: CachedPage) -> None:
+        """Record that the origin confirmed a cached copy (304 Not Modified).
+
+        Args:
+            page: Cached page that was served.
+        """
+        with self._lock:
+            self._stats['revalidated'] += 1
+
+    def _remember(self, key: str, page: CachedPage) -> None:
+        with self._lock:
+            self._entries[key] = page
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with lookup, revalidation (304) and store counts.
+        """
+        with self._lock:
+            lookups = self._stats['lookups']
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'revalidation_rate': self._stats['revalidated'] / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+HTTPX Scraper
+
+This module implements a scraper using HTTPX over HTTP/2. Concurrent requests
+to the same host are multiplexed as streams over one connection instead of
+each opening its own TCP/TLS connection, as they do with Requests.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import Counter
+from typing import Dict, Any
+
+import httpx
+
+from scrapers.base_scraper import BaseScraper, ScraperException
+from scrapers.response_policy import retry_delay
+from scrapers.url_utils import get_host
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class HttpxScraper(BaseScraper):
+    """Scraper implementation using HTTPX with HTTP/2 multiplexing.
+
+    A single fixed proxy can be set with the ``proxy`` config option. Proxy
+    rotation is not supported: switching proxies per request would give up
+    the shared connection this engine exists for.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """Initialize the HTTPX scraper.
+
+        Args:
+            config: Configuration dictionary for the scraper.
+        """
+        super().__init__(config)
+        self.config = config or {}
+        self.timeout = self.config.get('timeout', 30)
+        self.verify_ssl = self.config.get('verify_ssl', True)
+        self.follow_redirects = self.config.get('allow_redirects', True)
+        self.proxy = self.config.get('proxy', None)
+        self.limits = httpx.Limits(
+            max_connections=self.config.get('max_connections', 100),
+            max_keepalive_connections=self.config.get('max_keepalive_connections', 20),
+        )
+
+        # HTTP/2 needs the optional h2 package (pip install httpx[http2])
+        self.http2 = self.config.get('http2', True)
+        if self.http2 and importlib.util.find_spec('h2') is None:
+            logger.warning("h2 is not installed, HTTPX scraper falls back to HTTP/1.1")
+            self.http2 = False
+
+        self.session = self._create_client(httpx.Client)
+
+        # Async clients are bound to the event loop they were created on
+        self._async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]' = \
+            weakref.WeakKeyDictionary()
+        self._async_clients_lock = threading.Lock()
+
+        self._http_versions = Counter()
+        self._http_versions_lock = threading.Lock()
+
+        logger.info("Initialized HTTPX scraper (HTTP/2 %s)", 'enabled' if self.http2 else 'disabled')
+
+    def _create_client(self, client_class: type) -> Any:
+        """Create a sync or async HTTPX client with the scraper's settings."""
+        return client_class(
+            http2=self.http2,
+            headers=self.headers,
+            timeout=self.timeout,
+            verify=self.verify_ssl,
+            follow_redirects=self.follow_redirects,
+            limits=self.limits,
+            proxy=self.proxy,
+        )
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the async client for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._async_clients[loop] = self._create_client(httpx.AsyncClient)
+            return client
+
+    def _request_headers(self, kwargs: Dict[str, Any]) -> Dict[str, str]:
+        """Get the per-request headers, carrying the current user agent."""
+        headers = {'User-Agent': self.current_user_agent}
+        if 'referer' in kwargs:
+            headers['Referer'] = kwargs['referer']
+        return headers
+
+    def _count_version(self, response: httpx.Response) -> None:
+        with self._http_versions_lock:
+            self._http_versions[response.http_version] += 1
+
+    def get_page(self, url: str, **kwargs) -> str:
+        """Get page content using HTTPX.
+
+        Args:
+            url: URL to fetch.
+            **kwargs: Additional keyword arguments (method, params, data,
+                timeout, referer).
+
+        Returns:
+            Page content as HTML string.
+
+        Raises:
+            ScraperException: If the page could not be retrieved after retries,
+                or the non-retryable error that ended the first attempt.
+        """
+        # Once per call, before the retry scheduler books a rate limiter slot
+        self._check_robots(url)
+        return self.retry_with_backoff(self._fetch_page, url, host=get_host(url), **kwargs)
+
+    def _fetch_page(self, url: str, **kwargs) -> str:
+        """Make a single fetch attempt."""
+        request_start = time.time()
+        with self.session.stream(
+            kwargs.get('method', 'GET').upper(),
+            url,
+            params=kwargs.get('params'),
+            data=kwargs.get('data'),
+            headers=self._request_headers(kwargs),
+            timeout=kwargs.get('timeout', self.timeout),
+        ) as response:
+            ttfb = time.time() - request_start
+            response.read()
+
+        self._record_timings(get_host(url), ttfb=ttfb, body=max(0.0, time.time() - request_start - ttfb))
+        self._count_version(response)
+        self._check_response(url, response.status_code, response.headers)
+        return response.text
+
+    async def aget_page(self, url: str, **kwargs) -> str:
+        """Get page content natively on the running event loop.
+
+        Concurrent calls share the loop's client, so requests to one host
+        are multiplexed over a single HTTP/2 connection. Backoff between
+        attempts is an ``asyncio.sleep``, as long as the server's Retry-After
+        when it sends one.
+
+        Args:
+            url: URL to fetch.
+            **kwargs: Additional keyword arguments (see ``get_page``).
+
+        Returns:
+            Page content as HTML string.
+
+        Raises:
+            ScraperException: If the page could not be retrieved after retries,
+                or the non-retryable error that ended the first attempt.
+        """
+        await self._acheck_robots(url)
+        client = self._get_async_client()
+        host = get_host(url)
+
+        for attempt in range(1, self.max_retries + 1):
+            await self._athrottle(host)
+            start_time = time.time()
+            try:
+                html = await self._afetch_page(client, url, **kwargs)
+            except Exception as e:
+                self._record_attempt(host, time.time() - start_time, success=False)
+                if not getattr(e, 'retryable', True):
+                    raise
+                if attempt >= self.max_retries:
+                    raise ScraperException(f"Failed after {self.max_retries} retries") from e
+
+                wait_time = retry_delay(e, self.retry_delay * (2 ** (attempt - 1)) + random.uniform(0, 1))
+                logger.warning("Attempt %s/%s failed: %s. Retrying in %.2f seconds...",
+                               attempt, self.max_retries, e, wait_time)
+                self.rotate_user_agent()
+                await asyncio.sleep(wait_time)
+            else:
+                self._record_attempt(host, time.time() - start_time, success=True)
+                return html
+
+    async def _afetch_page(self, client: httpx.AsyncClient, url: str, **kwargs) -> str:
+        """Make a single async fetch attempt."""
+        request_start = time.time()
+        async with client.stream(
+            kwargs.get('method', 'GET').upper(),
+            url,
+            params=kwargs.get('params'),
+            data=kwargs.get('data'),
+            headers=self._request_headers(kwargs),
+            timeout=kwargs.get('timeout', self.timeout),
+        ) as response:
+            ttfb = time.time() - request_start
+            await response.aread()
+
+        self._record_timings(get_host(url), ttfb=ttfb, body=max(0.0, time.time() - request_start - ttfb))
+        self._count_version(response)
+        self._check_response(url, response.status_code, response.headers)
+        return response.text
+
+    async def aclose(self) -> None:
+        """Close the async client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self) -> None:
+        """Close the scraper and clean up resources.
+
+        Async clients are closed if their event loop is idle; call
+        ``aclose`` from a loop that is still running.
+        """
+        try:
+            self._close_retry_scheduler()
+            self.session.close()
+            with self._async_clients_lock:
+                clients = list(self._async_clients.items())
+                self._async_clients.clear()
+            for loop, client in clients:
+                if not loop.is_closed() and not loop.is_running():
+                    loop.run_until_complete(client.aclose())
+            logger.info("Closed HTTPX scraper")
+        except Exception as e:
+            logger.error("Error closing HTTPX scraper: %s", e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scraper statistics.
+
+        Returns:
+            Dictionary of scraper statistics, including response counts per
+            HTTP version.
+        """
+        stats = super().get_stats()
+        with self._http_versions_lock:
+            stats['http_versions'] = dict(self._http_versions)
+        return stats
+
+    def extract_data(self, html: str) -> Any:
+        """Extract data from HTML using the configured parser backend.
+
+        Args:
+            html: HTML content to parse.
+
+        Returns:
+            Parsed document; a BeautifulSoup object unless the selectolax
+            backend is configured.
+        """
+        return self.parse_html(html)
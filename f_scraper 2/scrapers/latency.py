@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Latency Histograms
+
+This module implements compact, HDR-style latency histograms. Values are
+bucketed on a log-linear scale (about 3% relative precision), so memory is
+bounded by the number of buckets regardless of how many samples are recorded,
+and percentiles can be read without keeping the samples.
+"""
+
+from typing import Dict, Any, Optional
+
+# Each power-of-two range is split into 2 ** (SUB_BUCKET_BITS - 1) linear buckets
+SUB_BUCKET_BITS = 6
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+
+# Values are tracked in microseconds up to ~38 hours
+MAX_TRACKABLE_US = (1 << 37) - 1
+
+# Hosts beyond the first MAX_HOSTS share one entry, so a crawl over many
+# domains doesn't grow the stats without bound
+DEFAULT_MAX_HOSTS = 100
+OTHER_HOSTS = '(other)'
+
+
+def _bucket_index(value_us: int) -> int:
+    """Get the bucket index for a value in microseconds."""
+    if value_us < SUB_BUCKET_COUNT:
+        return value_us
+    exponent = value_us.bit_length() - SUB_BUCKET_BITS
+    mantissa = value_us >> exponent
+    return SUB_BUCKET_COUNT + (exponent - 1) * SUB_BUCKET_HALF + (mantissa - SUB_BUCKET_HALF)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Get the highest value in microseconds that maps to a bucket."""
+    if index < SUB_BUCKET_COUNT:
+        return index
+    exponent = (index - SUB_BUCKET_COUNT) // SUB_BUCKET_HALF + 1
+    mantissa = (index - SUB_BUCKET_COUNT) % SUB_BUCKET_HALF + SUB_BUCKET_HALF
+    return ((mantissa + 1) << exponent) - 1
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations with percentile queries."""
+
+    __slots__ = ('counts', 'count', 'total_us', 'max_us')
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        """Record a duration.
+
+        Args:
+            seconds: Duration in seconds. Negative values are ignored.
+        """
+        if seconds < 0:
+            return
+        value_us = min(int(seconds * 1_000_000), MAX_TRACKABLE_US)
+        index = _bucket_index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add the samples of another histogram to this one.
+
+        Args:
+            other: Histogram to merge in.
+        """
+        for index, count in list(other.counts.items()):
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, percent: float) -> float:
+        """Get the value at a percentile.
+
+        Args:
+            percent: Percentile between 0 and 100.
+
+        Returns:
+            Duration in seconds at or below which ``percent`` of samples fall.
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(_bucket_upper_bound(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a summary of the histogram.
+
+        Returns:
+            Dictionary with the sample count and mean/p50/p90/p99/max in milliseconds.
+        """
+        mean_ms = self.total_us / self.count / 1000 if self.count else 0.0
+        return {
+            'count': self.count,
+            'mean_ms': round(mean_ms, 3),
+            'p50_ms': round(self.percentile(50) * 1000, 3),
+            'p90_ms': round(self.percentile(90) * 1000, 3),
+            'p99_ms': round(self.percentile(99) * 1000, 3),
+            'max_ms': round(self.max_us / 1000, 3),
+        }
+
+
+class LatencyStats:
+    """Request latency histograms for an engine, overall and per host.
+
+    Three phases are tracked: ``total`` (whole fetch), ``ttfb`` (time to
+    first byte / response headers) and ``body`` (body download). Hosts seen
+    after the first ``max_hosts`` are folded into ``OTHER_HOSTS``.
+    """
+
+    PHASES = ('total', 'ttfb', 'body')
+
+    def __init__(self, max_hosts: Optional[int] = DEFAULT_MAX_HOSTS):
+        """Initialize empty latency stats.
+
+        Args:
+            max_hosts: Number of hosts tracked on their own; None for no
+                limit, 0 to keep only the overall histograms.
+        """
+        self.max_hosts = max_hosts
+        self.overall = self._new_phases()
+        self.hosts: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+    @classmethod
+    def _new_phases(cls) -> Dict[str, LatencyHistogram]:
+        return {phase: LatencyHistogram() for phase in cls.PHASES}
+
+    def _host_phases(self, host: str) -> Optional[Dict[str, LatencyHistogram]]:
+        """Get the histograms a host's samples go to, creating them if needed."""
+        host_phases = self.hosts.get(host)
+        if host_phases is not None:
+            return host_phases
+        if self.max_hosts == 0:
+            return None
+        if self.max_hosts is not None and len(self.hosts) >= self.max_hosts:
+            host = OTHER_HOSTS
+        return self.hosts.setdefault(host, self._new_phases())
+
+    def record(self, host: str, total: Optional[float] = None, ttfb: Optional[float] = None,
+               body: Optional[float] = None) -> None:
+        """Record the timings of one request. Phases left as None are skipped.
+
+        Args:
+            host: Host the request went to.
+            total: Whole request duration in seconds.
+            ttfb: Time to first byte in seconds.
+            body: Body download time in seconds.
+        """
+        host_phases = self._host_phases(host)
+
+        for phase, value in (('total', total), ('ttfb', ttfb), ('body', body)):
+            if value is not None:
+                self.overall[phase].record(value)
+                if host_phases is not None:
+                    host_phases[phase].record(value)
+
+    def merge(self, other: 'LatencyStats') -> None:
+        """Add the samples of another LatencyStats to this one.
+
+        Args:
+            other: Stats to merge in.
+        """
+        for phase in self.PHASES:
+            self.overall[phase].merge(other.overall[phase])
+        for host, phases in list(other.hosts.items()):
+            host_phases = self._host_phases(host)
+            if host_phases is None:
+                break
+            for phase in self.PHASES:
+                host_phases[phase].merge(phases[phase])
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a summary of all histograms.
+
+        Returns:
+            Dictionary with one summary per phase, plus the same per host.
+        """
+        return {
+            **{phase: histogram.snapshot() for phase, histogram in self.overall.items()},
+            'hosts': {
+                host: {phase: histogram.snapshot() for phase, histogram in phases.items()}
+                for host, phases in sorted(self.hosts.items())
+            },
+        }
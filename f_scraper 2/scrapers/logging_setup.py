@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Logging Setup
+
+This module provides an opt-in logging pipeline for applications using the
+scrapers package. The package itself never configures logging; call
+``configure_logging`` once at startup. Records are put on an in-memory queue
+by the calling thread and formatted and written by a background
+``QueueListener``, so fetch threads never wait on disk I/O.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import List, Optional
+
+# Argument types that are safe to hand to another thread unformatted
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, type(None), bytes)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatter producing one compact JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'msg': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry['stack'] = self.formatStack(record.stack_info)
+        return json.dumps(entry, separators=(',', ':'), default=str)
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers %-formatting to the listener thread.
+
+    The stock QueueHandler formats every record in the logging thread. When a
+    record's arguments are immutable, they cannot change before the listener
+    formats them, so the record is queued as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args and not (isinstance(args, tuple) and all(isinstance(a, _IMMUTABLE_ARG_TYPES) for a in args)):
+            # Mutable arguments could change before the listener runs
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def configure_logging(level: int = logging.INFO, log_file: Optional[str] = 'scraper.log',
+                      json_lines: bool = True, console: bool = True,
+                      logger_name: Optional[str] = None) -> logging.handlers.QueueListener:
+    """Route log records through a queue to background handlers.
+
+    Calling this again replaces the previous configuration.
+
+    Args:
+        level: Level to set on the configured logger.
+        log_file: File to append records to, or None for no file.
+        json_lines: Write the file as JSON lines instead of plain text.
+        console: Also write plain-text records to stderr.
+        logger_name: Logger to configure. Defaults to the root logger.
+
+    Returns:
+        The running QueueListener.
+    """
+    global _listener, _queue_handler
+
+    stop_logging()
+
+    text_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+    handlers: List[logging.Handler] = []
+    if log_file:
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(JsonLinesFormatter() if json_lines else text_formatter)
+        handlers.append(file_handler)
+    if console:
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(text_formatter)
+        handlers.append(stream_handler)
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = LazyQueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    target = logging.getLogger(logger_name)
+    target.addHandler(_queue_handler)
+    target.setLevel(level)
+
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and remove the handler installed by ``configure_logging``."""
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        for logger in [logging.getLogger()] + list(logging.Logger.manager.loggerDict.values()):
+            if isinstance(logger, logging.Logger) and _queue_handler in logger.handlers:
+                logger.removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
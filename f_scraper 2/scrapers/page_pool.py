@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Browser Page Pool
+
+This module provides a pool of browser pages, each in its own context, so
+one browser process can render several URLs at once. A render leases a page
+for its duration and returns it afterwards. Contexts are recycled after a
+number of navigations, which keeps their memory (caches, detached DOM,
+service workers) from growing without bound.
+
+The pool only depends on the page and context objects having async
+``close()`` methods and ``page.is_closed()``, so it does not import
+Playwright itself.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class PooledPage:
+    """A page of the pool together with the context it lives in."""
+
+    __slots__ = ('context', 'page', 'owns_context', 'navigations', 'state')
+
+    def __init__(self, context: Any, page: Any, owns_context: bool = True):
+        """Initialize the pooled page.
+
+        Args:
+            context: Browser context of the page.
+            page: Browser page.
+            owns_context: Whether retiring the page also closes its context.
+                False for pages sharing one persistent context.
+        """
+        self.context = context
+        self.page = page
+        self.owns_context = owns_context
+        self.navigations = 0
+        # Per-page state of the owner, such as route handlers
+        self.state: Dict[str, Any] = {}
+
+
+class PagePool:
+    """Pages leased to one render at a time, created on demand up to a limit.
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(self, create_page: Callable[[], Awaitable[PooledPage]], size: int = 4,
+                 max_navigations: int = 50):
+        """Initialize the page pool.
+
+        Args:
+            create_page: Coroutine function building a new, ready to use page.
+            size: Maximum number of pages; renders wait for a free page once
+                they all are leased.
+            max_navigations: Number of renders after which a page's context
+                is closed and replaced. 0 never recycles.
+        """
+        self.size = max(1, size)
+        self.max_navigations = max_navigations
+        self._create_page = create_page
+        self._idle: List[PooledPage] = []
+        self._pages: List[PooledPage] = []
+        # Created on first use so it binds to the loop the pool runs on
+        self._semaphore = None
+        self._closed = False
+        self._stats = {'leases': 0, 'waits': 0, 'recycled': 0}
+
+    def add(self, pooled: PooledPage) -> None:
+        """Put an existing page in the pool.
+
+        Args:
+            pooled: Page to add; counts towards the size limit.
+        """
+        self._pages.append(pooled)
+        self._idle.append(pooled)
+
+    @property
+    def contexts(self) -> List[Any]:
+        """Distinct contexts of the pages in the pool."""
+        contexts = []
+        for pooled in self._pages:
+            if not any(context is pooled.context for context in contexts):
+                contexts.append(pooled.context)
+        return contexts
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[PooledPage]:
+        """Lease a page for the duration of an ``async with`` block.
+
+        Yields:
+            A page no other render is using.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+        """
+        if self._closed:
+            raise RuntimeError("Page pool is closed")
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.size)
+        if self._semaphore.locked():
+            self._stats['waits'] += 1
+
+        async with self._semaphore:
+            pooled = self._idle.pop() if self._idle else await self._new_page()
+            self._stats['leases'] += 1
+            try:
+                yield pooled
+            finally:
+                pooled.navigations += 1
+                if self._should_retire(pooled):
+                    await self._retire(pooled)
+                else:
+                    self._idle.append(pooled)
+
+    async def _new_page(self) -> PooledPage:
+        pooled = await self._create_page()
+        self._pages.append(pooled)
+        return pooled
+
+    def _should_retire(self, pooled: PooledPage) -> bool:
+        if self._closed:
+            return True
+        if self.max_navigations and pooled.navigations >= self.max_navigations:
+            return True
+        try:
+            return pooled.page.is_closed()
+        except Exception:
+            return True
+
+    async def _retire(self, pooled: PooledPage) -> None:
+        if pooled in self._pages:
+            self._pages.remove(pooled)
+        if not self._closed:
+            self._stats['recycled'] += 1
+            logger.debug("Recycling browser context after %s navigations", pooled.navigations)
+        try:
+            if pooled.owns_context:
+                await pooled.context.close()
+            else:
+                await pooled.page.close()
+        except Exception as e:
+            logger.debug("Error closing pooled page: %s", e)
+
+    async def close(self) -> None:
+        """Close all idle pages; leased pages are closed when returned."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._retire(pooled)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get page pool statistics.
+
+        Returns:
+            Dictionary with the pool size, open pages, idle pages, leases,
+            leases that had to wait and recycled contexts.
+        """
+        return {'size': self.size, 'pages': len(self._pages), 'idle': len(self._idle), **self._stats}
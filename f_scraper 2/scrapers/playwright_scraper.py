@@ -9,17 +9,25 @@ import logging
 import asyncio
 import random
 import time
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Tuple, AsyncIterator, Iterable
 import os
 import json
 from pathlib import Path
 import re
+import threading
+from functools import partial
 
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Response
-from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 
 from scrapers.base_scraper import BaseScraper, ScraperException
+from scrapers.page_pool import PagePool, PooledPage
+from scrapers.readiness import (CHALLENGE_CLEARED, NetworkQuietWatcher, wait_until_ready,
+                                create_from_config as create_readiness_profiles)
+from scrapers.resource_policy import ResourceBlocker, create_from_config as create_resource_policy
+from scrapers.response_capture import RenderResult, ResponseCapture
+from scrapers.snapshots import create_from_config as create_snapshot_sink
+from scrapers.url_utils import get_host
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -41,21 +49,87 @@ class PlaywrightScraper(BaseScraper):
         self.viewport = self.config.get('viewport', {'width': 1920, 'height': 1080})
         self.timeout = self.config.get('timeout', 30000)  # 30 seconds
         self.user_data_dir = self.config.get('user_data_dir', None)
+        # Scrolling, mouse moves and pauses before the readiness wait; they add
+        # seconds to every render, so they are off unless asked for
+        self.simulate_human = self.config.get('simulate_human', False)
+        
+        # Pages rendering concurrently in the one browser, and the number of
+        # renders after which a page's context is replaced
+        self.page_pool_size = self.config.get('page_pool_size', 4)
+        self.max_navigations = self.config.get('max_navigations', 50)
+        
+        # Subresources to skip during renders (images, fonts, media, trackers)
+        self.resource_policy = create_resource_policy(self.config.get('block_resources', True))
+        # Updated on the loop thread and read by get_stats on callers' threads
+        self._blocking_stats = {'renders': 0, 'blocked': 0, 'bytes_saved': 0, 'by_type': {}}
+        self._blocking_lock = threading.Lock()
+        
+        # What to wait for before a page counts as rendered, per URL pattern
+        self.readiness = create_readiness_profiles(self.config.get('readiness_profiles'),
+                                                   self.config.get('default_readiness'))
+        
+        # Optional copies of rendered pages for debugging; off unless configured
+        self.snapshots = create_snapshot_sink(self.config.get('debug_snapshots'))
         
         # Playwright objects (to be initialized)
         self.playwright = None
         self.browser = None
+        # Only set for a persistent context (user_data_dir), shared by all pages
         self.context = None
-        self.page = None
+        self.page_pool = None
         
         # Initialize logger
         self.logger = logging.getLogger(__name__)
         
-        # Initialize Playwright asynchronously
-        self.loop = asyncio.get_event_loop()
-        self.loop.run_until_complete(self._initialize())
+        # Playwright runs on an event loop in a dedicated thread. Callers on any
+        # thread (or on another event loop) submit work to it, so their renders
+        # overlap in the one browser instead of queueing behind each other.
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._run_loop, name='playwright-loop', daemon=True)
+        self._loop_thread.start()
+        try:
+            self._run(self._initialize())
+        except Exception:
+            self._stop_loop()
+            raise
         
-        self.logger.info(f"Initialized Playwright scraper with {self.browser_type} browser")
+        self.logger.info("Initialized Playwright scraper with %s browser", self.browser_type)
+
+    def _run_loop(self) -> None:
+        """Run the scraper's event loop until ``_stop_loop`` is called."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _run(self, coro: Any) -> Any:
+        """Run a coroutine on the scraper's loop and wait for its result.
+
+        Safe to call from any thread except the loop's own.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            The coroutine's result.
+
+        Raises:
+            RuntimeError: If called from the loop thread, where waiting would
+                deadlock.
+        """
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("PlaywrightScraper sync methods cannot be called from its event loop; "
+                               "await the async methods instead")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def _stop_loop(self) -> None:
+        """Stop the loop thread and close the loop."""
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if threading.current_thread() is not self._loop_thread:
+            self._loop_thread.join(10)
+        if not self.loop.is_running():
+            self.loop.close()
 
     async def _initialize(self) -> None:
         """Initialize Playwright browser and context."""
@@ -90,60 +164,90 @@ class PlaywrightScraper(BaseScraper):
                     locale='en-US',
                     timezone_id='America/New_York',
                 )
-                self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
-            else:
-                # Create a new context
-                self.context = await self.browser.new_context(
-                    viewport={'width': random.randint(1050, 1920), 'height': random.randint(800, 1080)},
-                    user_agent=UserAgent().random,
-                    locale='en-US',
-                    timezone_id='America/New_York',
-                    geolocation={'longitude': random.uniform(-122.0, -73.0), 'latitude': random.uniform(30.0, 45.0)},
-                    permissions=['geolocation'],
-                    java_script_enabled=True,
-                    bypass_csp=True,
-                    extra_http_headers={
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Cache-Control': 'max-age=0',
-                        'Connection': 'keep-alive',
-                        'Sec-Ch-Ua': '"Chromium";v="116", "Not)A;Brand";v="24", "Google Chrome";v="116"',
-                        'Sec-Ch-Ua-Mobile': '?0',
-                        'Sec-Ch-Ua-Platform': '"macOS"',
-                        'Sec-Fetch-Dest': 'document',
-                        'Sec-Fetch-Mode': 'navigate',
-                        'Sec-Fetch-Site': 'none',
-                        'Sec-Fetch-User': '?1',
-                        'Upgrade-Insecure-Requests': '1',
-                    },
-                )
-                self.page = await self.context.new_page()
             
-            # Set default timeout
-            self.page.set_default_timeout(self.timeout)
+            # Open the first page now so launch problems surface here; a
+            # persistent context starts with a blank page we can use
+            first_page = self.context.pages[0] if self.context and self.context.pages else None
+            self.page_pool = PagePool(self._create_pooled_page, self.page_pool_size, self.max_navigations)
+            self.page_pool.add(await self._create_pooled_page(first_page))
             
-            # Set up event listeners
-            self.page.on("response", self._handle_response)
+        except Exception as e:
+            self.logger.error("Error initializing Playwright: %s", e)
+            raise ScraperException(f"Failed to initialize Playwright: {e}")
+
+    async def _create_pooled_page(self, page: Page = None) -> PooledPage:
+        """Create a page for the page pool.
+
+        Each page gets its own context, seeded with the cookies collected so
+        far, unless all pages share the persistent context.
+
+        Args:
+            page: Existing page of the persistent context to use.
+
+        Returns:
+            The new page and its context.
+        """
+        if self.context is not None:
+            pooled = PooledPage(self.context, page or await self.context.new_page(), owns_context=False)
+        else:
+            context = await self.browser.new_context(
+                viewport={'width': random.randint(1050, 1920), 'height': random.randint(800, 1080)},
+                user_agent=UserAgent().random,
+                locale='en-US',
+                timezone_id='America/New_York',
+                geolocation={'longitude': random.uniform(-122.0, -73.0), 'latitude': random.uniform(30.0, 45.0)},
+                permissions=['geolocation'],
+                java_script_enabled=True,
+                bypass_csp=True,
+                extra_http_headers={
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+                    'Accept-Encoding': 'gzip, deflate, br',
+                    'Accept-Language': 'en-US,en;q=0.9',
+                    'Cache-Control': 'max-age=0',
+                    'Connection': 'keep-alive',
+                    'Sec-Ch-Ua': '"Chromium";v="116", "Not)A;Brand";v="24", "Google Chrome";v="116"',
+                    'Sec-Ch-Ua-Mobile': '?0',
+                    'Sec-Ch-Ua-Platform': '"macOS"',
+                    'Sec-Fetch-Dest': 'document',
+                    'Sec-Fetch-Mode': 'navigate',
+                    'Sec-Fetch-Site': 'none',
+                    'Sec-Fetch-User': '?1',
+                    'Upgrade-Insecure-Requests': '1',
+                },
+            )
             
             # Add initial cookies if any
             if self.cookies:
-                await self.context.add_cookies([
+                await context.add_cookies([
                     {"name": name, "value": value, "domain": "filmfreeway.com", "path": "/"}
                     for name, value in self.cookies.items()
                 ])
-            
-            # Apply stealth techniques
-            await self._apply_stealth_techniques()
-            
-        except Exception as e:
-            self.logger.error(f"Error initializing Playwright: {e}")
-            raise ScraperException(f"Failed to initialize Playwright: {e}")
+            pooled = PooledPage(context, await context.new_page())
+        
+        # Set default timeout
+        pooled.page.set_default_timeout(self.timeout)
+        
+        # Set up event listeners
+        pooled.page.on("response", partial(self._handle_response, context=pooled.context))
+        
+        # Abort the requests the resource policy blocks
+        if self.resource_policy:
+            blocker = ResourceBlocker(self.resource_policy)
+            await pooled.page.route("**/*", blocker.handle)
+            pooled.state['blocker'] = blocker
+        
+        # Apply stealth techniques
+        await self._apply_stealth_techniques(pooled.page)
+        return pooled
+
+    async def _apply_stealth_techniques(self, page: Page):
+        """Apply various stealth techniques to avoid detection.
 
-    async def _apply_stealth_techniques(self):
-        """Apply various stealth techniques to avoid detection."""
+        Args:
+            page: Page to apply them to.
+        """
         # Override navigator properties to appear more like a real browser
-        await self.page.add_init_script("""
+        await page.add_init_script("""
         () => {
             // Override properties
             Object.defineProperty(navigator, 'webdriver', {
@@ -206,134 +310,355 @@ class PlaywrightScraper(BaseScraper):
         }
         """)
 
-    async def _handle_response(self, response: Response) -> None:
+    async def _handle_response(self, response: Response, context: BrowserContext = None) -> None:
         """Handle response events from the browser.
 
         Args:
             response: Playwright response object.
+            context: Context of the page that received the response.
         """
         # Log response status for debugging
         if response.status >= 400:
-            self.logger.warning(f"Error response: {response.status} for {response.url}")
+            self.logger.warning("Error response: %s for %s", response.status, response.url)
         
         # Extract and store cookies from responses
         if response.status < 400:
             try:
-                cookies = await self.context.cookies()
+                cookies = await (context or self.context).cookies()
                 cookie_dict = {cookie["name"]: cookie["value"] for cookie in cookies}
                 self.update_cookies(cookie_dict)
             except Exception as e:
-                self.logger.debug(f"Error extracting cookies: {e}")
+                self.logger.debug("Error extracting cookies: %s", e)
+
+    async def _get_page_async(self, page: Page, url: str, serialize: bool = True, **kwargs) -> Optional[str]:
+        """Get page content asynchronously.
+
+        Args:
+            page: Leased page to render the URL in.
+            url: URL to fetch.
+            serialize: Whether to serialize the rendered DOM.
+            **kwargs: Additional keyword arguments. ``readiness`` overrides
+                the URL's readiness profile and ``simulate_human`` the config
+                option of the same name.
 
-    async def _get_page_async(self, url: str, **kwargs) -> str:
-        """Get page content asynchronously."""
+        Returns:
+            Page content as HTML string, or None if ``serialize`` is False.
+        """
+        await self._acheck_robots(url)
+        await self._athrottle(get_host(url))
+        start_time = time.time()
+        profile = kwargs.get('readiness') or self.readiness.match(url)
+        watcher = NetworkQuietWatcher(page) if profile.network_idle is not None else None
         try:
             # Set default timeout
             timeout = kwargs.get('timeout', 15000)
             
+            # Count requests from the start of the navigation for the quiet window
+            if watcher:
+                watcher.attach()
+            
             # First try with a shorter timeout to detect Cloudflare quickly
-            await self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+            response = await page.goto(url, wait_until=profile.wait_until, timeout=timeout)
             
             # Check for Cloudflare challenge
-            cf_challenge = await self.page.query_selector('#challenge-running, #cf-challenge-running, .cf-browser-verification, .cf-error-code')
+            cf_challenge = await page.query_selector('#challenge-running, #cf-challenge-running, .cf-browser-verification, .cf-error-code')
             if cf_challenge:
                 logger.warning("Cloudflare challenge detected, waiting longer...")
                 
                 # Wait for challenge to complete (up to 30 seconds)
                 try:
-                    await self.page.wait_for_selector('#challenge-running, #cf-challenge-running, .cf-browser-verification, .cf-error-code', state='detached', timeout=30000)
+                    await page.wait_for_selector('#challenge-running, #cf-challenge-running, .cf-browser-verification, .cf-error-code', state='detached', timeout=30000)
                     logger.info("Cloudflare challenge appears to be solved")
                 except Exception as e:
-                    logger.warning(f"Timeout waiting for Cloudflare challenge to be solved: {e}")
+                    logger.warning("Timeout waiting for Cloudflare challenge to be solved: %s", e)
             
-            # Add human-like behavior
-            await self._simulate_human_behavior()
+            # Back off from a host that throttles us; challenge pages (403/503)
+            # are handled above
+            if response is not None and response.status == 429:
+                self._check_response(url, response.status, response.headers)
             
-            # Wait for content to load
-            try:
-                # Wait for festival-specific selectors
-                await self.page.wait_for_selector("div[class*='festival'], div[class*='Festival'], .CuratedSectionTile, a[href^='/festivals/curated/']", timeout=10000)
-                logger.info("Found festival-specific content")
-            except Exception as e:
-                logger.warning(f"Timeout waiting for festival selectors: {e}")
-                # Try more general content selectors
+            # Add human-like behavior, within the profile's budget
+            if kwargs.get('simulate_human', self.simulate_human):
                 try:
-                    await self.page.wait_for_selector(".Content, .container, main, #layout", state='visible', timeout=5000)
-                    logger.info("Found general content")
-                except Exception as e2:
-                    logger.warning(f"Timeout waiting for general content selectors: {e2}")
+                    await asyncio.wait_for(self._simulate_human_behavior(page), timeout=profile.budget)
+                except asyncio.TimeoutError:
+                    logger.debug("Human simulation cut short after %.1f seconds", profile.budget)
+            
+            # Wait until the profile's conditions hold, within its budget
+            wait_start = time.time()
+            ready = await wait_until_ready(page, profile, watcher)
+            self.readiness.record(profile, time.time() - wait_start, ready)
+            if ready:
+                logger.debug("Page ready (profile %s) after %.2f seconds", profile.name, time.time() - wait_start)
+            else:
+                logger.warning("Page not ready within %.1f seconds (profile %s): %s", profile.budget, profile.name, url)
+            
+            ttfb, body = self._navigation_timings(response)
+            
+            # Callers that only want captured responses skip serializing the DOM
+            if not serialize:
+                self._record_attempt(get_host(url), time.time() - start_time, success=True, ttfb=ttfb, body=body)
+                return None
             
             # Get the page content
-            content = await self.page.content()
+            content = await page.content()
             
             # Check if content is too small (likely blocked)
             if len(content) < 1000:
-                logger.warning(f"Content size is suspiciously small: {len(content)} bytes")
+                logger.warning("Content size is suspiciously small: %s bytes", len(content))
                 
                 # Get the page title to check if we're blocked
-                title = await self.page.title()
-                logger.info(f"Page title: {title}")
+                title = await page.title()
+                logger.info("Page title: %s", title)
                 
-                # If we're getting a Cloudflare page, wait longer
+                # If we're getting a Cloudflare page, wait (up to 10 seconds) for it to clear
                 if "Cloudflare" in content or "cloudflare" in content.lower() or "challenge" in content.lower() or "checking your browser" in content.lower():
                     logger.warning("Cloudflare page detected, waiting longer...")
-                    await asyncio.sleep(10)  # Wait 10 seconds
-                    content = await self.page.content()
+                    try:
+                        await page.wait_for_function(CHALLENGE_CLEARED, timeout=10000)
+                    except Exception as e:
+                        logger.warning("Timeout waiting for Cloudflare page to clear: %s", e)
+                    content = await page.content()
+            
+            self._record_attempt(get_host(url), time.time() - start_time, success=True, ttfb=ttfb, body=body)
             
             return content
             
         except Exception as e:
-            logger.error(f"Error in _get_page_async: {e}")
+            logger.error("Error in _get_page_async: %s", e)
+            self._record_attempt(get_host(url), time.time() - start_time, success=False)
             raise e
+        finally:
+            if watcher:
+                watcher.detach()
+
+    @staticmethod
+    def _navigation_timings(response: Optional[Response]) -> Tuple[Optional[float], Optional[float]]:
+        """Get time to first byte and body download time of a navigation.
+
+        Args:
+            response: Main document response returned by ``page.goto``.
+
+        Returns:
+            Tuple of (ttfb, body) in seconds; either may be None if the
+            browser did not report it.
+        """
+        if response is None:
+            return None, None
+        try:
+            # Resource timing values are in milliseconds relative to startTime, -1 if unavailable
+            timing = response.request.timing
+            response_start = timing.get('responseStart', -1)
+            response_end = timing.get('responseEnd', -1)
+        except Exception:
+            return None, None
+        ttfb = response_start / 1000 if response_start >= 0 else None
+        body = (response_end - response_start) / 1000 if response_start >= 0 and response_end >= response_start else None
+        return ttfb, body
+
+    async def _simulate_human_behavior(self, page: Page) -> None:
+        """Simulate human-like behavior to avoid detection.
 
-    async def _simulate_human_behavior(self) -> None:
-        """Simulate human-like behavior to avoid detection."""
+        Args:
+            page: Page to act on.
+        """
         # Random scrolling
         for _ in range(random.randint(1, 3)):
-            await self.page.mouse.wheel(0, random.randint(300, 700))
+            await page.mouse.wheel(0, random.randint(300, 700))
             await asyncio.sleep(random.uniform(0.5, 2.0))
         
         # Random mouse movements
         for _ in range(random.randint(2, 5)):
             x = random.randint(100, 800)
             y = random.randint(100, 600)
-            await self.page.mouse.move(x, y)
+            await page.mouse.move(x, y)
             await asyncio.sleep(random.uniform(0.1, 0.5))
         
         # Sometimes click on a random element
         if random.random() < 0.3:  # 30% chance
             try:
-                elements = await self.page.query_selector_all('a, button, input, select')
+                elements = await page.query_selector_all('a, button, input, select')
                 if elements and len(elements) > 0:
                     random_element = elements[random.randint(0, min(5, len(elements)-1))]
                     await random_element.hover()
                     # Don't actually click to avoid navigating away
             except Exception as e:
-                logger.debug(f"Error during human simulation: {e}")
+                logger.debug("Error during human simulation: %s", e)
         
         # Add a random pause
         await asyncio.sleep(random.uniform(1.0, 3.0))
 
+    async def aget_page(self, url: str, **kwargs) -> str:
+        """Get page content using Playwright without blocking the event loop.
+
+        May be awaited on any event loop; the render itself runs on the
+        scraper's loop.
+
+        Args:
+            url: URL to fetch.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Page content as HTML string.
+        """
+        return (await self.arender(url, **kwargs)).html
+
+    async def arender(self, url: str, capture: Any = None, content: bool = True, **kwargs) -> RenderResult:
+        """Render a URL, capturing the JSON responses the page loads.
+
+        May be awaited on any event loop; the render itself runs on the
+        scraper's loop.
+
+        Args:
+            url: URL to fetch.
+            capture: Regular expression(s) for the URLs of JSON responses to
+                capture.
+            content: Whether to also return the rendered HTML. Pass False
+                when the captured responses hold all the data needed.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RenderResult with the HTML (None if ``content`` is False) and the
+            captured responses.
+        """
+        if asyncio.get_running_loop() is self.loop:
+            return await self._render(url, capture, content, **kwargs)
+        future = asyncio.run_coroutine_threadsafe(self._render(url, capture, content, **kwargs), self.loop)
+        return await asyncio.wrap_future(future)
+
+    def render(self, url: str, capture: Any = None, content: bool = True, **kwargs) -> RenderResult:
+        """Render a URL, capturing the JSON responses the page loads.
+
+        Args:
+            url: URL to fetch.
+            capture: Regular expression(s) for the URLs of JSON responses to
+                capture.
+            content: Whether to also return the rendered HTML.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RenderResult with the HTML (None if ``content`` is False) and the
+            captured responses.
+        """
+        return self._run(self._render(url, capture, content, **kwargs))
+
+    async def _render(self, url: str, capture: Any = None, content: bool = True, **kwargs) -> RenderResult:
+        """Render a URL on a leased page. Runs on the scraper's loop.
+
+        Each render leases a page from the page pool, so up to
+        ``page_pool_size`` renders run at once.
+
+        Args:
+            url: URL to fetch.
+            capture: Regular expression(s) for the URLs of JSON responses to
+                capture.
+            content: Whether to serialize the rendered DOM.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RenderResult with the HTML and the captured responses.
+        """
+        async with self.page_pool.lease() as pooled:
+            blocker = pooled.state.get('blocker')
+            if blocker:
+                blocker.start(url)
+            recorder = ResponseCapture(capture) if capture else None
+            if recorder:
+                recorder.attach(pooled.page)
+            try:
+                html = await self._get_page_async(pooled.page, url, serialize=content, **kwargs)
+                responses = await recorder.finish() if recorder else []
+            except Exception:
+                if self.snapshots and self.snapshots.sample(failed=True):
+                    await self._snapshot_failure(pooled.page, url)
+                raise
+            finally:
+                if blocker:
+                    self._record_blocking(url, blocker.finish())
+                if recorder:
+                    # Finished renders have nothing left; failed ones drop pending reads
+                    recorder.cancel()
+            if html is not None and self.snapshots and self.snapshots.sample():
+                self.snapshots.write(url, html)
+            return RenderResult(url, html, responses)
+
+    async def _snapshot_failure(self, page: Page, url: str) -> None:
+        """Keep a snapshot of whatever a failed render left on the page.
+
+        Args:
+            page: Page the render ran in.
+            url: URL that failed.
+        """
+        try:
+            self.snapshots.write(url, await page.content(), failed=True)
+        except Exception as e:
+            self.logger.debug("Could not snapshot failed render of %s: %s", url, e)
+
+    def _record_blocking(self, url: str, blocked: Dict[str, Any]) -> None:
+        """Add the requests blocked during one render to the stats.
+
+        Args:
+            url: URL that was rendered.
+            blocked: Summary returned by ``ResourceBlocker.finish``.
+        """
+        with self._blocking_lock:
+            stats = self._blocking_stats
+            stats['renders'] += 1
+            stats['blocked'] += blocked['blocked']
+            stats['bytes_saved'] += blocked['bytes_saved']
+            for resource_type, count in blocked['by_type'].items():
+                stats['by_type'][resource_type] = stats['by_type'].get(resource_type, 0) + count
+        self.logger.debug("Blocked %s requests (~%.0f KB) rendering %s",
+                          blocked['blocked'], blocked['bytes_saved'] / 1024, url)
+
+    async def aget_pages(self, urls: Iterable[str],
+                         **kwargs) -> AsyncIterator[Tuple[str, Union[str, Exception]]]:
+        """Render many URLs concurrently in the one browser.
+
+        May be iterated on any event loop.
+
+        Args:
+            urls: URLs to fetch.
+            **kwargs: Additional keyword arguments passed to ``aget_page``.
+
+        Yields:
+            Tuples of (url, content) or (url, exception), in completion order.
+        """
+        async for result in self.afetch_many(urls, concurrency=self.page_pool.size, **kwargs):
+            yield result
+
+    def get_pages(self, urls: Iterable[str], **kwargs) -> List[Tuple[str, Union[str, Exception]]]:
+        """Render many URLs concurrently in the one browser.
+
+        Args:
+            urls: URLs to fetch.
+            **kwargs: Additional keyword arguments passed to ``aget_page``.
+
+        Returns:
+            List of (url, content) or (url, exception), in completion order.
+        """
+        async def _collect() -> List[Tuple[str, Union[str, Exception]]]:
+            return [result async for result in self.aget_pages(urls, **kwargs)]
+        return self._run(_collect())
+
     def get_page(self, url: str, **kwargs) -> str:
-        """Get page content using Playwright."""
+        """Get page content using Playwright.
+
+        Safe to call from many threads at once; the renders overlap on the
+        scraper's loop.
+        """
         try:
-            self.logger.info(f"Getting page with Playwright: {url}")
-            
-            # Run the async method in the event loop
-            content = self.loop.run_until_complete(self._get_page_async(url, **kwargs))
+            self.logger.debug("Getting page with Playwright: %s", url)
             
-            # Save content for inspection
-            with open("playwright_content.html", "w", encoding="utf-8") as f:
-                f.write(content)
-                
-            return content
+            # Run the render on the scraper's loop thread
+            return self._run(self._render(url, **kwargs)).html
         except Exception as e:
-            self.logger.error(f"Error fetching page with Playwright: {e}")
+            self.logger.error("Error fetching page with Playwright: %s", e)
             raise e
             
     def extract_festival_links(self, html_content: str) -> List[Dict[str, str]]:
         """Extract festival links from the page content."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self.parse_html(html_content)
         festivals = []
         
         # Try different selectors for curated sections
@@ -353,7 +678,7 @@ class PlaywrightScraper(BaseScraper):
 
     def extract_festival_details(self, html_content: str) -> Dict[str, Any]:
         """Extract festival details from the festival page."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self.parse_html(html_content)
         details = {}
         
         # Try to find the festival name
@@ -544,14 +869,23 @@ class PlaywrightScraper(BaseScraper):
     def close(self) -> None:
         """Close the scraper and clean up resources."""
         try:
-            self.loop.run_until_complete(self._close_async())
+            if self.loop.is_closed():
+                return
+            try:
+                self._run(self._close_async())
+            finally:
+                self._stop_loop()
+            if self.snapshots:
+                self.snapshots.close()
             self.logger.info("Closed Playwright scraper")
         except Exception as e:
-            self.logger.error(f"Error closing Playwright scraper: {e}")
+            self.logger.error("Error closing Playwright scraper: %s", e)
 
     async def _close_async(self) -> None:
         """Close Playwright resources asynchronously."""
         try:
+            if self.page_pool:
+                await self.page_pool.close()
             if self.context:
                 await self.context.close()
             if self.browser:
@@ -559,7 +893,7 @@ class PlaywrightScraper(BaseScraper):
             if self.playwright:
                 await self.playwright.stop()
         except Exception as e:
-            self.logger.error(f"Error closing Playwright resources: {e}")
+            self.logger.error("Error closing Playwright resources: %s", e)
 
     async def _get_cookies_async(self) -> Dict[str, str]:
         """Get cookies from the browser context asynchronously.
@@ -568,20 +902,23 @@ class PlaywrightScraper(BaseScraper):
             Dictionary of cookies.
         """
         try:
-            if self.context:
-                # Get all cookies from the browser context
-                cookies = await self.context.cookies()
+            contexts = self.page_pool.contexts if self.page_pool else []
+            if contexts:
+                # Get all cookies from the browser contexts
+                cookie_dict = {}
+                for context in contexts:
+                    cookies = await context.cookies()
+                    
+                    # Convert to a simple dictionary format
+                    cookie_dict.update({cookie['name']: cookie['value'] for cookie in cookies})
                 
-                # Convert to a simple dictionary format
-                cookie_dict = {cookie['name']: cookie['value'] for cookie in cookies}
-                
-                self.logger.info(f"Retrieved {len(cookie_dict)} cookies from Playwright browser")
+                self.logger.info("Retrieved %s cookies from Playwright browser", len(cookie_dict))
                 return cookie_dict
             else:
                 self.logger.warning("No active browser context to get cookies from")
                 return {}
         except Exception as e:
-            self.logger.error(f"Error getting cookies from Playwright browser: {e}")
+            self.logger.error("Error getting cookies from Playwright browser: %s", e)
             return {}
 
     def get_cookies(self) -> Dict[str, str]:
@@ -591,29 +928,51 @@ class PlaywrightScraper(BaseScraper):
             Dictionary of cookies.
         """
         try:
-            # Run the async method in the event loop
-            return self.loop.run_until_complete(self._get_cookies_async())
+            # Run the async method on the scraper's loop thread
+            return self._run(self._get_cookies_async())
         except Exception as e:
-            self.logger.error(f"Error getting cookies from PlaywrightScraper: {e}")
+            self.logger.error("Error getting cookies from PlaywrightScraper: %s", e)
             return {}
 
-    def extract_data(self, html: str) -> BeautifulSoup:
-        """Extract data from HTML using BeautifulSoup.
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scraper statistics.
+
+        Returns:
+            Dictionary of scraper statistics, including readiness wait times
+            per profile, page pool usage and the (estimated) bytes saved by
+            resource blocking.
+        """
+        stats = super().get_stats()
+        stats['readiness'] = self.readiness.get_stats()
+        if self.page_pool:
+            stats['page_pool'] = self.page_pool.get_stats()
+        if self.resource_policy:
+            with self._blocking_lock:
+                blocking = {**self._blocking_stats, 'by_type': dict(self._blocking_stats['by_type'])}
+            stats['resource_blocking'] = {
+                **blocking,
+                'bytes_saved_per_render': blocking['bytes_saved'] / blocking['renders'] if blocking['renders'] else 0.0,
+            }
+        if self.snapshots:
+            stats['snapshots'] = self.snapshots.get_stats()
+        return stats
+
+    def extract_data(self, html: str) -> Any:
+        """Extract data from HTML using the configured parser backend.
 
         Args:
             html: HTML content to parse.
 
         Returns:
-            BeautifulSoup object.
+            Parsed document; a BeautifulSoup object unless the selectolax
+            backend is configured.
         """
-        return BeautifulSoup(html, 'html.parser')
+        return self.parse_html(html)
 
     def __del__(self):
         """Destructor to ensure resources are cleaned up."""
         try:
-            if hasattr(self, 'loop') and self.loop.is_running():
-                self.loop.create_task(self._close_async())
-            else:
+            if hasattr(self, '_loop_thread'):
                 self.close()
         except Exception:
             pass  # Ignore errors during cleanup
@@ -14,19 +14,13 @@ import json
 import threading
 from datetime import datetime, timedelta
 import re
+from urllib.parse import urlparse
+
 import requests
 
-from requests_ip_rotator import ApiGateway
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("proxy.log"),
-        logging.StreamHandler()
-    ]
-)
+from scrapers import dns_cache
+
+# Configure logging (handlers are set up by the application, see logging_setup)
 logger = logging.getLogger(__name__)
 
 
@@ -79,6 +73,14 @@ class Proxy:
             return f"{self.protocol}://{self.username}:{self.password}@{self.host}:{self.port}"
         return f"{self.protocol}://{self.host}:{self.port}"
 
+    def as_dict(self) -> Dict[str, str]:
+        """Get the proxy in the format expected by requests.
+
+        Returns:
+            Dictionary mapping URL scheme to proxy URL.
+        """
+        return {'http': self.url, 'https': self.url}
+
     @property
     def is_banned(self) -> bool:
         """Check if the proxy is currently banned.
@@ -174,6 +176,9 @@ class ProxyManager:
         # Lock for thread safety
         self.lock = threading.RLock()
         
+        # Optional process-wide DNS cache for proxy and test hosts
+        dns_cache.install_from_config(self.config.get('dns_cache'))
+        
         # Load proxies from file
         self._load_proxies()
         
@@ -181,7 +186,7 @@ class ProxyManager:
         if self.use_aws_gateway:
             self._initialize_aws_gateways()
         
-        logger.info(f"Initialized proxy manager with {len(self.proxies)} proxies")
+        logger.info("Initialized proxy manager with %s proxies", len(self.proxies))
 
     def _load_proxies(self) -> None:
         """Load proxies from file."""
@@ -192,20 +197,20 @@ class ProxyManager:
                     
                     if isinstance(proxy_data, list):
                         self.proxies = [Proxy.from_dict(p) for p in proxy_data]
-                        logger.info(f"Loaded {len(self.proxies)} proxies from {self.proxy_file}")
+                        logger.info("Loaded %s proxies from %s", len(self.proxies), self.proxy_file)
                     else:
-                        logger.warning(f"Invalid proxy data format in {self.proxy_file}")
+                        logger.warning("Invalid proxy data format in %s", self.proxy_file)
         except Exception as e:
-            logger.error(f"Error loading proxies from {self.proxy_file}: {e}")
+            logger.error("Error loading proxies from %s: %s", self.proxy_file, e)
 
     def _save_proxies(self) -> None:
         """Save proxies to file."""
         try:
             with open(self.proxy_file, 'w') as f:
                 json.dump([p.to_dict() for p in self.proxies], f, indent=2)
-            logger.debug(f"Saved {len(self.proxies)} proxies to {self.proxy_file}")
+            logger.debug("Saved %s proxies to %s", len(self.proxies), self.proxy_file)
         except Exception as e:
-            logger.error(f"Error saving proxies to {self.proxy_file}: {e}")
+            logger.error("Error saving proxies to %s: %s", self.proxy_file, e)
 
     def _initialize_aws_gateways(self) -> None:
         """Initialize AWS API Gateways for IP rotation."""
@@ -213,8 +218,11 @@ class ProxyManager:
             return
             
         try:
+            # Imported here so requests_ip_rotator (and boto3) only load when AWS rotation is enabled
+            from requests_ip_rotator import ApiGateway
+            
             for domain in self.target_domains:
-                logger.info(f"Initializing AWS API Gateway for {domain}")
+                logger.info("Initializing AWS API Gateway for %s", domain)
                 self.aws_gateways[domain] = ApiGateway(
                     domain,
                     regions=[self.aws_region],
@@ -222,9 +230,9 @@ class ProxyManager:
                     access_key_secret=os.environ.get('AWS_SECRET_ACCESS_KEY')
                 )
                 self.aws_gateways[domain].start()
-                logger.info(f"AWS API Gateway for {domain} initialized successfully")
+                logger.info("AWS API Gateway for %s initialized successfully", domain)
         except Exception as e:
-            logger.error(f"Error initializing AWS API Gateway: {e}")
+            logger.error("Error initializing AWS API Gateway: %s", e)
             self.use_aws_gateway = False
 
     def add_proxy(self, proxy: Proxy) -> None:
@@ -237,11 +245,11 @@ class ProxyManager:
             # Check if the proxy already exists
             for existing_proxy in self.proxies:
                 if existing_proxy.host == proxy.host and existing_proxy.port == proxy.port:
-                    logger.debug(f"Proxy {proxy.host}:{proxy.port} already exists")
+                    logger.debug("Proxy %s:%s already exists", proxy.host, proxy.port)
                     return
                     
             self.proxies.append(proxy)
-            logger.info(f"Added proxy {proxy.host}:{proxy.port}")
+            logger.info("Added proxy %s:%s", proxy.host, proxy.port)
             self._save_proxies()
 
     def remove_proxy(self, proxy: Proxy) -> None:
@@ -252,7 +260,7 @@ class ProxyManager:
         """
         with self.lock:
             self.proxies = [p for p in self.proxies if p.host != proxy.host or p.port != proxy.port]
-            logger.info(f"Removed proxy {proxy.host}:{proxy.port}")
+            logger.info("Removed proxy %s:%s", proxy.host, proxy.port)
             self._save_proxies()
 
     def ban_proxy(self, proxy: Proxy, duration: int = None) -> None:
@@ -267,7 +275,7 @@ class ProxyManager:
             proxy.banned_until = time.time() + ban_duration
             proxy.fail_count += 1
             self.banned_proxies.add(f"{proxy.host}:{proxy.port}")
-            logger.info(f"Banned proxy {proxy.host}:{proxy.port} for {ban_duration} seconds")
+            logger.info("Banned proxy %s:%s for %s seconds", proxy.host, proxy.port, ban_duration)
             self._save_proxies()
 
     def unban_proxy(self, proxy: Proxy) -> None:
@@ -281,7 +289,7 @@ class ProxyManager:
             proxy_key = f"{proxy.host}:{proxy.port}"
             if proxy_key in self.banned_proxies:
                 self.banned_proxies.remove(proxy_key)
-            logger.info(f"Unbanned proxy {proxy.host}:{proxy.port}")
+            logger.info("Unbanned proxy %s:%s", proxy.host, proxy.port)
             self._save_proxies()
 
     def get_proxy(self, country: str = None) -> Optional[Proxy]:
@@ -313,7 +321,7 @@ class ProxyManager:
             proxy = available_proxies[0]
             proxy.in_use = True
             proxy.last_used = time.time()
-            logger.debug(f"Selected proxy {proxy.host}:{proxy.port}")
+            logger.debug("Selected proxy %s:%s", proxy.host, proxy.port)
             return proxy
 
     def release_proxy(self, proxy: Proxy, success: bool = True) -> None:
@@ -362,11 +370,11 @@ class ProxyManager:
                     gateway.attach_session(session)
                     return session
                     
-            logger.warning(f"No AWS API Gateway available for {domain}")
+            logger.warning("No AWS API Gateway available for %s", domain)
             return None
             
         except Exception as e:
-            logger.error(f"Error getting AWS API Gateway session: {e}")
+            logger.error("Error getting AWS API Gateway session: %s", e)
             return None
 
     def test_proxy(self, proxy: Proxy) -> bool:
@@ -392,20 +400,24 @@ class ProxyManager:
             
             if response.status_code == 200:
                 proxy.last_response_time = elapsed
-                logger.debug(f"Proxy {proxy.host}:{proxy.port} is working (response time: {elapsed:.2f}s)")
+                logger.debug("Proxy %s:%s is working (response time: %.2fs)", proxy.host, proxy.port, elapsed)
                 return True
             else:
-                logger.warning(f"Proxy {proxy.host}:{proxy.port} returned status code {response.status_code}")
+                logger.warning("Proxy %s:%s returned status code %s", proxy.host, proxy.port, response.status_code)
                 return False
                 
         except Exception as e:
-            logger.warning(f"Proxy {proxy.host}:{proxy.port} test failed: {e}")
+            logger.warning("Proxy %s:%s test failed: %s", proxy.host, proxy.port, e)
             return False
 
     def test_all_proxies(self) -> None:
         """Test all proxies in the pool."""
         logger.info("Testing all proxies...")
         
+        cache = dns_cache.get_dns_cache()
+        if cache:
+            cache.prefetch([urlparse(self.proxy_test_url).hostname] + [p.host for p in self.proxies])
+        
         with self.lock:
             working_proxies = []
             
@@ -415,7 +427,7 @@ class ProxyManager:
                 else:
                     self.ban_proxy(proxy)
             
-            logger.info(f"Proxy test completed: {len(working_proxies)}/{len(self.proxies)} proxies working")
+            logger.info("Proxy test completed: %s/%s proxies working", len(working_proxies), len(self.proxies))
 
     def add_proxies_from_url(self, url: str) -> int:
         """Add proxies from a URL.
@@ -453,11 +465,11 @@ class ProxyManager:
                 self.add_proxy(proxy)
                 added_count += 1
                 
-            logger.info(f"Added {added_count} proxies from {url}")
+            logger.info("Added %s proxies from %s", added_count, url)
             return added_count
             
         except Exception as e:
-            logger.error(f"Error adding proxies from {url}: {e}")
+            logger.error("Error adding proxies from %s: %s", url, e)
             return 0
 
     def add_proxies_from_file(self, file_path: str) -> int:
@@ -471,7 +483,7 @@ class ProxyManager:
         """
         try:
             if not os.path.exists(file_path):
-                logger.error(f"File {file_path} does not exist")
+                logger.error("File %s does not exist", file_path)
                 return 0
                 
             with open(file_path, 'r') as f:
@@ -497,11 +509,11 @@ class ProxyManager:
                 self.add_proxy(proxy)
                 added_count += 1
                 
-            logger.info(f"Added {added_count} proxies from {file_path}")
+            logger.info("Added %s proxies from %s", added_count, file_path)
             return added_count
             
         except Exception as e:
-            logger.error(f"Error adding proxies from {file_path}: {e}")
+            logger.error("Error adding proxies from %s: %s", file_path, e)
             return 0
 
     def get_stats(self) -> Dict[str, Any]:
@@ -530,7 +542,8 @@ class ProxyManager:
                 'avg_success_rate': avg_success_rate,
                 'avg_response_time': avg_response_time,
                 'aws_gateway_enabled': self.use_aws_gateway,
-                'aws_gateways': list(self.aws_gateways.keys()) if self.aws_gateways else []
+                'aws_gateways': list(self.aws_gateways.keys()) if self.aws_gateways else [],
+                **({'dns_cache': dns_cache.get_dns_cache().get_stats()} if dns_cache.get_dns_cache() else {}),
             }
 
     def close(self) -> None:
@@ -544,13 +557,13 @@ class ProxyManager:
                 for domain, gateway in self.aws_gateways.items():
                     try:
                         gateway.shutdown()
-                        logger.info(f"Closed AWS API Gateway for {domain}")
+                        logger.info("Closed AWS API Gateway for %s", domain)
                     except Exception as e:
-                        logger.error(f"Error closing AWS API Gateway for {domain}: {e}")
+                        logger.error("Error closing AWS API Gateway for %s: %s", domain, e)
             
             logger.info("Closed proxy manager")
         except Exception as e:
-            logger.error(f"Error closing proxy manager: {e}")
+            logger.error("Error closing proxy manager: %s", e)
 
     def __del__(self):
         """Destructor to ensure resources are cleaned up."""
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter
+
+This module implements a per-host rate limiter shared by the scraper engines.
+It replaces fixed sleeps between requests: a request only waits when its host
+is over budget, and then only as long as needed to stay at the allowed rate.
+
+The limiter uses the generic cell rate algorithm (GCRA), a token bucket that
+stores a single timestamp per host: the theoretical arrival time (TAT) of the
+next request if the host were fetched at exactly its rate. A request may go
+ahead once ``TAT - burst_allowance`` has passed.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 1.0
+DEFAULT_BURST = 2
+
+# Default ``rate_limit`` setting: no per-host rate, so throughput is not
+# limited, but Retry-After pauses and robots.txt Crawl-delay still apply
+DEFAULT_SETTING = {'rate': None}
+
+
+class RateLimiter:
+    """Per-host GCRA rate limiter, safe to share between threads and event loops."""
+
+    def __init__(self, rate: Optional[float] = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 hosts: Dict[str, Any] = None):
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Requests per second allowed per host. None means unlimited.
+            burst: Number of requests a host may receive back to back when it
+                has been idle.
+            hosts: Per-host overrides, mapping a host to a rate or to a dict
+                with ``rate`` and ``burst``.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._host_limits: Dict[str, Tuple[Optional[float], int]] = {}
+        self._tat: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'delayed': 0, 'wait_time': 0.0}
+
+        for host, limit in (hosts or {}).items():
+            if isinstance(limit, dict):
+                self.set_host_rate(host, limit.get('rate'), limit.get('burst'))
+            else:
+                self.set_host_rate(host, limit)
+
+    def set_host_rate(self, host: str, rate: Optional[float], burst: int = None) -> None:
+        """Override the rate of one host.
+
+        Args:
+            host: Host name.
+            rate: Requests per second for the host. None means unlimited.
+            burst: Burst size for the host. Defaults to the limiter's burst.
+        """
+        with self._lock:
+            self._host_limits[host.lower()] = (rate, burst or self.burst)
+
+    def cap_host_rate(self, host: str, rate: float) -> None:
+        """Lower the rate of one host to at most ``rate``, without bursts.
+
+        Used for robots.txt Crawl-delay; a host already limited to a lower
+        rate keeps it.
+
+        Args:
+            host: Host name.
+            rate: Maximum requests per second for the host.
+        """
+        host = host.lower()
+        with self._lock:
+            current, burst = self._limits(host)
+            if current and 0 < current <= rate and burst == 1:
+                return
+            self._host_limits[host] = (min(current, rate) if current and current > 0 else rate, 1)
+
+    def _limits(self, host: str) -> Tuple[Optional[float], int]:
+        return self._host_limits.get(host, (self.rate, self.burst))
+
+    def reserve(self, host: str) -> float:
+        """Book the next request slot of a host.
+
+        The slot is taken even if the caller has to wait for it, so callers
+        must go ahead after waiting the returned delay.
+
+        Args:
+            host: Host the request targets.
+
+        Returns:
+            Seconds to wait before sending the request.
+        """
+        host = host.lower()
+        now = time.monotonic()
+        with self._lock:
+            rate, burst = self._limits(host)
+            self._stats['requests'] += 1
+            tat = max(self._tat.get(host, now), now)
+            if rate and rate > 0:
+                interval = 1.0 / rate
+                delay = max(0.0, tat - interval * (burst - 1) - now)
+                self._tat[host] = tat + interval
+            else:
+                # Unlimited hosts only wait out a pause
+                delay = tat - now
+
+            if delay > 0:
+                self._stats['delayed'] += 1
+                self._stats['wait_time'] += delay
+            return delay
+
+    def acquire(self, host: str) -> float:
+        """Wait until a request to a host is allowed.
+
+        Args:
+            host: Host the request targets.
+
+        Returns:
+            Seconds waited.
+        """
+        delay = self.reserve(host)
+        if delay > 0:
+            logger.debug("Rate limiting %s: waiting %.2f seconds", host, delay)
+            time.sleep(delay)
+        return delay
+
+    async def aacquire(self, host: str) -> float:
+        """Wait until a request to a host is allowed, without blocking the event loop.
+
+        Args:
+            host: Host the request targets.
+
+        Returns:
+            Seconds waited.
+        """
+        delay = self.reserve(host)
+        if delay > 0:
+            logger.debug("Rate limiting %s: waiting %.2f seconds", host, delay)
+            await asyncio.sleep(delay)
+        return delay
+
+    def pause(self, host: str, seconds: float) -> None:
+        """Hold back all requests to a host for a while.
+
+        Args:
+            host: Host to pause.
+            seconds: Time in seconds before the next request may be sent.
+        """
+        host = host.lower()
+        with self._lock:
+            rate, burst = self._limits(host)
+            # Push the TAT out so the earliest allowed request is `seconds` away
+            allowance = (burst - 1) / rate if rate and rate > 0 else 0.0
+            resume = time.monotonic() + seconds + allowance
+            self._tat[host] = max(self._tat.get(host, 0.0), resume)
+        logger.info("Paused requests to %s for %.1f seconds", host, seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limiter statistics.
+
+        Returns:
+            Dictionary with request, delayed request and total wait counts.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+def create_from_config(setting: Any) -> Optional[RateLimiter]:
+    """Build a rate limiter as requested by a ``rate_limit`` config value.
+
+    Args:
+        setting: False/None to disable rate limiting, True for the default
+            rate of 1 request/second per host, or a dict of RateLimiter
+            options (``DEFAULT_SETTING`` when the option is not set).
+
+    Returns:
+        The rate limiter, or None if the setting is off.
+    """
+    if not setting:
+        return None
+    return RateLimiter(**(setting if isinstance(setting, dict) else {}))
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Page Readiness Profiles
+
+This module decides when a rendered page holds the data we want. A
+readiness profile, chosen by URL pattern, names the condition to wait for:
+a selector, a quiet network window, a JavaScript predicate, or any mix of
+them. It also sets the navigation's ``wait_until`` level and a hard budget
+for the wait. A page is returned as soon as its conditions hold rather than
+after fixed timeouts and sleeps, and the time spent waiting is recorded per
+profile.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from scrapers.latency import LatencyHistogram
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+FESTIVAL_SELECTOR = ("div[class*='festival'], div[class*='Festival'], .CuratedSectionTile, "
+                     "a[href^='/festivals/curated/']")
+CONTENT_SELECTOR = ".Content, .container, main, #layout"
+
+# True once a small page is no longer a Cloudflare interstitial
+CHALLENGE_CLEARED = """() => {
+    const html = document.documentElement.outerHTML;
+    return html.length >= 1000 || !/cloudflare|challenge|checking your browser/i.test(html);
+}"""
+
+
+class ReadinessProfile:
+    """What to wait for before a page counts as rendered."""
+
+    def __init__(self, name: str, pattern: str = '', selector: str = None, state: str = 'attached',
+                 network_idle: float = None, predicate: str = None,
+                 wait_until: str = 'domcontentloaded', budget: float = 10.0):
+        """Initialize the profile.
+
+        Args:
+            name: Name used in logs and stats.
+            pattern: Regular expression searched in the URL; empty matches
+                every URL.
+            selector: CSS selector that must be present.
+            state: State the selector must reach (``attached`` or ``visible``).
+            network_idle: Seconds without requests in flight that count as a
+                quiet network.
+            predicate: JavaScript function that must return a truthy value.
+            wait_until: Load state ``page.goto`` waits for.
+            budget: Longest time in seconds to wait for the conditions.
+        """
+        self.name = name
+        self.pattern = re.compile(pattern)
+        self.selector = selector
+        self.state = state
+        self.network_idle = network_idle
+        self.predicate = predicate
+        self.wait_until = wait_until
+        self.budget = budget
+
+    def matches(self, url: str) -> bool:
+        """Check whether the profile applies to a URL.
+
+        Args:
+            url: URL being rendered.
+
+        Returns:
+            True if the URL matches the profile's pattern.
+        """
+        return bool(self.pattern.search(url))
+
+
+# Festival pages of the site this scraper targets, then any other page
+DEFAULT_PROFILES = (
+    ReadinessProfile('festival', pattern=r'filmfreeway\.com', selector=FESTIVAL_SELECTOR, budget=10.0),
+)
+DEFAULT_PROFILE = ReadinessProfile('default', selector=CONTENT_SELECTOR, state='visible', budget=5.0)
+
+
+class NetworkQuietWatcher:
+    """Tracks the requests a page has in flight.
+
+    Attach it before navigating so the page's requests are all seen.
+    """
+
+    def __init__(self, page: Any):
+        """Initialize the watcher.
+
+        Args:
+            page: Page to watch.
+        """
+        self.page = page
+        self.in_flight = 0
+        self._last_change = 0.0
+
+    def attach(self) -> None:
+        """Start listening to the page's request events."""
+        self._last_change = asyncio.get_running_loop().time()
+        self.page.on('request', self._on_request)
+        self.page.on('requestfinished', self._on_done)
+        self.page.on('requestfailed', self._on_done)
+
+    def detach(self) -> None:
+        """Stop listening to the page's request events."""
+        for event, handler in (('request', self._on_request), ('requestfinished', self._on_done),
+                               ('requestfailed', self._on_done)):
+            try:
+                self.page.remove_listener(event, handler)
+            except Exception as e:
+                logger.debug("Error removing %s listener: %s", event, e)
+
+    def _on_request(self, request: Any) -> None:
+        self.in_flight += 1
+        self._last_change = asyncio.get_running_loop().time()
+
+    def _on_done(self, request: Any) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+        self._last_change = asyncio.get_running_loop().time()
+
+    async def wait(self, quiet: float) -> None:
+        """Wait until no request has been in flight for ``quiet`` seconds.
+
+        Args:
+            quiet: Length of the quiet window in seconds.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            idle_for = loop.time() - self._last_change
+            if self.in_flight == 0 and idle_for >= quiet:
+                return
+            await asyncio.sleep(max(0.01, quiet - idle_for) if self.in_flight == 0 else 0.05)
+
+
+async def wait_until_ready(page: Any, profile: ReadinessProfile,
+                           watcher: NetworkQuietWatcher = None) -> bool:
+    """Wait for all of a profile's conditions, within its budget.
+
+    Args:
+        page: Page being rendered.
+        profile: Profile naming the conditions.
+        watcher: Network watcher attached before the navigation; required
+            for the network-quiet condition.
+
+    Returns:
+        True if every condition held within the budget, False otherwise.
+    """
+    timeout_ms = profile.budget * 1000
+    waits = []
+    if profile.selector:
+        waits.append(page.wait_for_selector(profile.selector, state=profile.state, timeout=timeout_ms))
+    if profile.predicate:
+        waits.append(page.wait_for_function(profile.predicate, timeout=timeout_ms))
+    if profile.network_idle is not None and watcher is not None:
+        waits.append(watcher.wait(profile.network_idle))
+    if not waits:
+        return True
+
+    tasks = [asyncio.ensure_future(wait) for wait in waits]
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=profile.budget,
+                                           return_when=asyncio.FIRST_EXCEPTION)
+        errors = [task.exception() for task in done if task.exception() is not None]
+        for error in errors:
+            logger.debug("Readiness condition of profile %s failed: %s", profile.name, error)
+        return not pending and not errors
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+class ReadinessProfiles:
+    """Picks the readiness profile of a URL and records wait times per profile."""
+
+    def __init__(self, profiles: Iterable[ReadinessProfile] = DEFAULT_PROFILES,
+                 default: ReadinessProfile = DEFAULT_PROFILE):
+        """Initialize the profiles.
+
+        Args:
+            profiles: Profiles tried in order; the first match wins.
+            default: Profile for URLs no other profile matches.
+        """
+        self.profiles: List[ReadinessProfile] = list(profiles)
+        self.default = default
+        self._lock = threading.Lock()
+        self._wait_times: Dict[str, LatencyHistogram] = {}
+        self._timeouts: Dict[str, int] = {}
+
+    def match(self, url: str) -> ReadinessProfile:
+        """Get the profile for a URL.
+
+        Args:
+            url: URL being rendered.
+
+        Returns:
+            The first matching profile, or the default one.
+        """
+        return next((profile for profile in self.profiles if profile.matches(url)), self.default)
+
+    def record(self, profile: ReadinessProfile, seconds: float, ready: bool) -> None:
+        """Record the time spent waiting for a page.
+
+        Args:
+            profile: Profile that was waited for.
+            seconds: Time spent waiting.
+            ready: Whether the conditions held within the budget.
+        """
+        with self._lock:
+            self._wait_times.setdefault(profile.name, LatencyHistogram()).record(seconds)
+            if not ready:
+                self._timeouts[profile.name] = self._timeouts.get(profile.name, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get wait time statistics.
+
+        Returns:
+            Dictionary mapping each profile name to its wait time summary and
+            number of timeouts.
+        """
+        with self._lock:
+            return {name: {**histogram.snapshot(), 'timeouts': self._timeouts.get(name, 0)}
+                    for name, histogram in self._wait_times.items()}
+
+
+def create_from_config(profiles: Optional[List[Dict[str, Any]]] = None,
+                       default: Optional[Dict[str, Any]] = None) -> ReadinessProfiles:
+    """Build readiness profiles from ``readiness_profiles``/``default_readiness`` config values.
+
+    Args:
+        profiles: Dicts of ReadinessProfile options, tried before the
+            built-in profiles.
+        default: Dict of ReadinessProfile options replacing the default
+            profile.
+
+    Returns:
+        The readiness profiles.
+    """
+    configured = [ReadinessProfile(**options) for options in (profiles or [])]
+    return ReadinessProfiles(configured + list(DEFAULT_PROFILES),
+                             ReadinessProfile(**{'name': 'default', **default}) if default else DEFAULT_PROFILE)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Engine Registry
+
+This module implements the registry of named scraper engine factories used by
+the ScraperFactory. Engines can be registered with the ``register_engine``
+decorator or by third-party packages through the ``scrapers.engines`` entry
+point group. Built-in engines are registered by import path, so nothing is
+imported until an engine is first built.
+"""
+
+import importlib
+import inspect
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Union
+
+from scrapers.base_scraper import BaseScraper, ScraperException
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = 'scrapers.engines'
+
+# Built-in engines, as 'module:attribute' import paths
+BUILTIN_ENGINES = {
+    'requests': 'scrapers.requests_scraper:RequestsScraper',
+    'cloudscraper': 'scrapers.cloudscraper_engine:CloudScraperEngine',
+    'playwright': 'scrapers.playwright_scraper:PlaywrightScraper',
+    'httpx': 'scrapers.httpx_scraper:HttpxScraper',
+}
+
+EngineFactory = Callable[..., BaseScraper]
+
+
+def _import_target(target: str) -> EngineFactory:
+    """Import a 'module:attribute' path."""
+    module_name, _, attribute = target.partition(':')
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class EngineRegistry:
+    """Registry mapping engine names to factories that build scrapers."""
+
+    def __init__(self):
+        """Initialize the registry with the built-in engines."""
+        self._factories: Dict[str, Union[str, EngineFactory]] = dict(BUILTIN_ENGINES)
+        self._entry_points_loaded = False
+        self._lock = threading.Lock()
+
+    def register(self, name: str, factory: Union[str, EngineFactory] = None):
+        """Register an engine factory.
+
+        Can be used directly or as a class/function decorator::
+
+            @register_engine('my_engine')
+            class MyScraper(BaseScraper):
+                ...
+
+        Args:
+            name: Engine name, as used in ``fallback_order``.
+            factory: Scraper class, callable taking ``(config, proxy_manager)``,
+                or a 'module:attribute' import path to either.
+
+        Returns:
+            The factory when called directly, or a decorator.
+        """
+        if factory is None:
+            def decorator(func: EngineFactory) -> EngineFactory:
+                self.register(name, func)
+                return func
+            return decorator
+
+        with self._lock:
+            if name in self._factories and self._factories[name] is not factory:
+                logger.info("Replacing scraper engine '%s'", name)
+            self._factories[name] = factory
+        return factory
+
+    def _load_entry_points(self) -> None:
+        """Register engines advertised by installed packages."""
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+
+        try:
+            from importlib.metadata import entry_points
+            eps = entry_points()
+            if hasattr(eps, 'select'):
+                group = eps.select(group=ENTRY_POINT_GROUP)
+            else:
+                group = eps.get(ENTRY_POINT_GROUP, [])
+        except Exception as e:
+            logger.warning("Error reading scraper engine entry points: %s", e)
+            return
+
+        for ep in group:
+            with self._lock:
+                # Explicit registrations take precedence over entry points
+                self._factories.setdefault(ep.name, ep.value)
+
+    def names(self) -> List[str]:
+        """Get the names of all registered engines.
+
+        Returns:
+            Sorted list of engine names.
+        """
+        self._load_entry_points()
+        with self._lock:
+            return sorted(self._factories)
+
+    def get_factory(self, name: str) -> EngineFactory:
+        """Get the factory for an engine, importing it if needed.
+
+        Args:
+            name: Engine name.
+
+        Returns:
+            Scraper class or factory callable.
+
+        Raises:
+            ScraperException: If no engine is registered under ``name``.
+        """
+        self._load_entry_points()
+        with self._lock:
+            factory = self._factories.get(name)
+        if factory is None:
+            raise ScraperException(f"Unknown scraper engine '{name}'")
+
+        if isinstance(factory, str):
+            factory = _import_target(factory)
+            with self._lock:
+                self._factories[name] = factory
+        return factory
+
+    def create(self, name: str, config: Dict[str, Any] = None, proxy_manager: Any = None) -> BaseScraper:
+        """Build a scraper for an engine.
+
+        Args:
+            name: Engine name.
+            config: Engine configuration dictionary.
+            proxy_manager: Optional proxy manager, passed to factories that accept one.
+
+        Returns:
+            New scraper instance.
+        """
+        factory = self.get_factory(name)
+        if self._accepts_proxy_manager(factory):
+            return factory(config or {}, proxy_manager)
+        return factory(config or {})
+
+    @staticmethod
+    def _accepts_proxy_manager(factory: EngineFactory) -> bool:
+        """Check whether a factory takes a second (proxy_manager) argument."""
+        try:
+            parameters = list(inspect.signature(factory).parameters.values())
+        except (TypeError, ValueError):
+            return False
+        if any(p.kind == inspect.Parameter.VAR_POSITIONAL for p in parameters):
+            return True
+        positional = [p for p in parameters
+                      if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        return len(positional) >= 2
+
+
+# Process-wide registry used by ScraperFactory
+registry = EngineRegistry()
+
+
+def register_engine(name: str, factory: Union[str, EngineFactory] = None):
+    """Register an engine factory in the process-wide registry.
+
+    See ``EngineRegistry.register``.
+    """
+    return registry.register(name, factory)
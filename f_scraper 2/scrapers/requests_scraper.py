@@ -5,23 +5,27 @@ Requests Scraper
 This module implements a scraper using Requests with rotating proxies for basic pages.
 """
 
+import asyncio
 import logging
 import random
 import time
 import json
 import re
+import threading
+from concurrent.futures import Future
 from typing import Dict, Any, Optional, List, Union
 import os
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
-from random_user_agent.user_agent import UserAgent
-from random_user_agent.params import SoftwareName, OperatingSystem
 
 from scrapers.base_scraper import BaseScraper, ScraperException
+from scrapers.connection_pool import PooledHTTPAdapter, SessionPool, summarize_pool_counts
 from scrapers.proxy_manager import ProxyManager, Proxy
-from .cloudscraper_engine import CloudScraperEngine  # Import CloudScraperEngine for fallback
+from scrapers.http_cache import HttpValidatorCache
+from scrapers.response_policy import retry_delay
+from scrapers.streaming import read_body, DEFAULT_CHUNK_SIZE
+from scrapers.url_utils import get_host
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -44,6 +48,19 @@ class RequestsScraper(BaseScraper):
         self.allow_redirects = self.config.get('allow_redirects', True)
         self.use_proxies = self.config.get('use_proxies', True)
         
+        # Connection pool sizing; host_pools maps a host to overrides of these options
+        self.pool_options = {
+            'pool_connections': self.config.get('pool_connections', 10),
+            'pool_maxsize': self.config.get('pool_maxsize', 10),
+            'pool_block': self.config.get('pool_block', False),
+        }
+        self.host_pools = self.config.get('host_pools', {})
+        
+        # Streaming downloads with an optional cap on the decompressed body size
+        self.stream = self.config.get('stream', False)
+        self.max_body_size = self.config.get('max_body_size', None)
+        self.stream_chunk_size = self.config.get('stream_chunk_size', DEFAULT_CHUNK_SIZE)
+        
         # Initialize proxy manager if provided
         self.proxy_manager = proxy_manager
         
@@ -56,41 +73,113 @@ class RequestsScraper(BaseScraper):
         # Initialize cloudflare bypass settings
         self._setup_cloudflare_bypass()
         
-        # CloudScraperEngine for fallback
+        # CloudScraperEngine for fallback, built once on first use
         self.cloud_scraper = None
+        self._cloud_scraper_lock = threading.Lock()
+        
+        # Optional ETag/Last-Modified cache; True or a dict of HttpValidatorCache options
+        cache_config = self.config.get('http_cache', False)
+        self.http_cache = None
+        if cache_config:
+            self.http_cache = HttpValidatorCache(**(cache_config if isinstance(cache_config, dict) else {}))
         
         logger.info("Initialized Requests scraper")
 
     def _initialize_session(self) -> None:
-        """Initialize the requests session."""
+        """Initialize the session pool and its first session (``self.session``).
+
+        Each fetch attempt leases a session from the pool, so one scraper can
+        be shared by many threads. All sessions use the same adapters.
+        """
         try:
-            # Create a session
-            self.session = requests.Session()
-            
-            # Set default headers
-            self.session.headers.update(self.headers)
-            
-            # Set cookies if any
-            if self.cookies:
-                for name, value in self.cookies.items():
-                    self.session.cookies.set(name, value)
-            
-            # Set common cookies that help with scraping
-            self.session.cookies.set('visited', '1')
-            self.session.cookies.set('locale', 'en')
-            self.session.cookies.set('timezone', 'America/New_York')
-            
-            # Add common browser cookies to appear more legitimate
-            self.session.cookies.set('_ga', f"GA1.2.{random.randint(1000000, 9999999)}.{int(time.time())}")
-            self.session.cookies.set('_gid', f"GA1.2.{random.randint(1000000, 9999999)}.{int(time.time())}")
-            
+            self._create_adapters()
+            self.session = self._new_session()
+            self.session_pool = SessionPool(self._new_session,
+                                            self.config.get('session_pool_size', self.retry_workers))
+            self.session_pool.add(self.session)
         except Exception as e:
-            logger.error(f"Error initializing Requests session: {e}")
+            logger.error("Error initializing Requests session: %s", e)
             raise ScraperException(f"Failed to initialize Requests session: {e}")
 
+    def _create_adapters(self) -> None:
+        """Create the pooled transport adapters, with dedicated pools for configured hosts."""
+        self._adapters = [PooledHTTPAdapter(**self.pool_options)]
+        self._host_adapters = {}
+        for host, options in self.host_pools.items():
+            adapter = PooledHTTPAdapter(**{**self.pool_options, **options})
+            self._adapters.append(adapter)
+            self._host_adapters[host] = adapter
+
+    def _new_session(self) -> requests.Session:
+        """Create a session on the shared adapters with the default headers and cookies."""
+        session = requests.Session()
+        self._mount_adapters(session)
+        self._seed_session_state(session)
+        return session
+
+    def _mount_adapters(self, session: requests.Session) -> None:
+        """Mount the shared adapters on a session."""
+        session.mount('http://', self._adapters[0])
+        session.mount('https://', self._adapters[0])
+        for host, adapter in self._host_adapters.items():
+            # Requests picks the longest matching prefix
+            session.mount(f"http://{host}/", adapter)
+            session.mount(f"https://{host}/", adapter)
+
+    def _seed_session_state(self, session: requests.Session = None) -> None:
+        """Set a session's default headers and cookies.
+
+        Args:
+            session: Session to seed. Defaults to ``self.session``.
+        """
+        session = session or self.session
+        
+        # Set default headers
+        session.headers.update(self.headers)
+        
+        # Set cookies if any
+        if self.cookies:
+            for name, value in list(self.cookies.items()):
+                session.cookies.set(name, value)
+        
+        # Set common cookies that help with scraping
+        session.cookies.set('visited', '1')
+        session.cookies.set('locale', 'en')
+        session.cookies.set('timezone', 'America/New_York')
+        
+        # Add common browser cookies to appear more legitimate
+        session.cookies.set('_ga', f"GA1.2.{random.randint(1000000, 9999999)}.{int(time.time())}")
+        session.cookies.set('_gid', f"GA1.2.{random.randint(1000000, 9999999)}.{int(time.time())}")
+
+    def _reset_session_state(self, session: requests.Session = None) -> None:
+        """Start over with fresh cookies while keeping pooled connections open.
+
+        Args:
+            session: Session to reset. Defaults to ``self.session``.
+        """
+        session = session or self.session
+        session.cookies.clear()
+        self._seed_session_state(session)
+
+    def update_cookies(self, cookies: Dict[str, str]) -> None:
+        """Update the cookies of every session in the pool.
+
+        Args:
+            cookies: Dictionary of cookies to update.
+        """
+        self.cookies.update(cookies)
+        for session in self.session_pool.sessions:
+            for key, value in cookies.items():
+                session.cookies.set(key, value)
+        logger.debug("Updated cookies: %s", cookies)
+
     def _setup_user_agent_rotator(self) -> None:
         """Set up the user agent rotator for more realistic browser fingerprinting."""
         try:
+            # Imported here so the dependency is only loaded when the rotator is used
+            from random_user_agent.user_agent import UserAgent
+            from random_user_agent.params import SoftwareName, OperatingSystem
+            
             # Define the software names and operating systems you want to emulate
             software_names = [SoftwareName.CHROME.value, SoftwareName.FIREFOX.value, 
                              SoftwareName.EDGE.value, SoftwareName.SAFARI.value]
@@ -106,10 +195,10 @@ class RequestsScraper(BaseScraper):
             additional_agents = self.user_agent_rotator.get_user_agents()
             self.user_agents.extend([ua['user_agent'] for ua in additional_agents])
             
-            logger.debug(f"Added {len(additional_agents)} additional user agents")
+            logger.debug("Added %s additional user agents", len(additional_agents))
             
         except Exception as e:
-            logger.warning(f"Error setting up user agent rotator: {e}")
+            logger.warning("Error setting up user agent rotator: %s", e)
             # Not critical, we can continue with the default user agents
 
     def _setup_cloudflare_bypass(self) -> None:
@@ -137,8 +226,8 @@ class RequestsScraper(BaseScraper):
             'AES256-SHA'
         ]
         
-        # HTTP/2 settings
-        self.http2 = True
+        # Requests only speaks HTTP/1.1; use the 'httpx' engine for HTTP/2
+        self.http2 = False
         
         # Browser-like headers that help bypass Cloudflare
         self.cloudflare_headers = {
@@ -158,6 +247,31 @@ class RequestsScraper(BaseScraper):
             'Cache-Control': 'max-age=0',
         }
 
+    def _get_random_proxy(self) -> Optional[Dict[str, str]]:
+        """Pick a proxy from the ``proxies`` config list when no proxy manager is set.
+
+        Returns:
+            Proxies dictionary for requests, or None to connect directly.
+        """
+        proxies = self.config.get('proxies') if self.use_proxies else None
+        if not proxies:
+            return None
+        proxy_url = random.choice(proxies)
+        return {'http': proxy_url, 'https': proxy_url}
+
+    def detect_cloudflare_challenge(self, html: str) -> bool:
+        """Check whether HTML is a Cloudflare challenge page.
+
+        Args:
+            html: HTML content to inspect.
+
+        Returns:
+            True if the page looks like a Cloudflare challenge.
+        """
+        markers = ('cf-browser-verification', 'cf_chl_opt', 'jschl_vc', 'Just a moment...',
+                   'Checking your browser before accessing')
+        return any(marker in html for marker in markers)
+
     def _generate_browser_fingerprint(self) -> Dict[str, str]:
         """Generate a realistic browser fingerprint.
         
@@ -248,22 +362,30 @@ class RequestsScraper(BaseScraper):
             
         return params
 
-    def _handle_cloudflare_challenge(self, response: requests.Response, url: str) -> Optional[str]:
+    def _handle_cloudflare_challenge(self, response: requests.Response, url: str,
+                                     html: Optional[str] = None,
+                                     session: requests.Session = None) -> Optional[str]:
         """Handle Cloudflare challenge if detected.
         
         Args:
             response: Response object that might contain a Cloudflare challenge.
             url: Original URL being accessed.
+            html: Body of the response if it was already read (streamed).
+            session: Session that received the response. Defaults to ``self.session``.
             
         Returns:
             HTML content if challenge is solved, None otherwise.
         """
+        if html is None:
+            html = response.text
+        session = session or self.session
+        
         # Check if this is a Cloudflare challenge
-        if response.status_code == 403 and 'cloudflare' in response.text.lower():
+        if response.status_code == 403 and 'cloudflare' in html.lower():
             logger.info("Cloudflare challenge detected, attempting to solve")
             
             # Extract challenge parameters
-            params = self._extract_cloudflare_params(response.text)
+            params = self._extract_cloudflare_params(html)
             if not params:
                 logger.warning("Could not extract Cloudflare parameters")
                 return None
@@ -280,11 +402,11 @@ class RequestsScraper(BaseScraper):
             
             # Submit the challenge
             try:
-                challenge_response = self.session.get(
+                challenge_response = session.get(
                     challenge_url,
                     params=params,
-                    headers=self.session.headers,
-                    cookies=self.session.cookies,
+                    headers=session.headers,
+                    cookies=session.cookies,
                     allow_redirects=True,
                     timeout=self.timeout
                 )
@@ -303,183 +425,341 @@ class RequestsScraper(BaseScraper):
                         
                     return challenge_response.text
                 else:
-                    logger.warning(f"Failed to solve Cloudflare challenge: {challenge_response.status_code}")
+                    logger.warning("Failed to solve Cloudflare challenge: %s", challenge_response.status_code)
                     
             except Exception as e:
-                logger.error(f"Error during Cloudflare challenge: {e}")
+                logger.error("Error during Cloudflare challenge: %s", e)
                 
         return None
 
     def _init_cloud_scraper(self) -> None:
         """Initialize CloudScraperEngine for fallback."""
-        if self.cloud_scraper is None:
-            logger.info("Initializing CloudScraperEngine for fallback...")
-            self.cloud_scraper = CloudScraperEngine()
+        if self.cloud_scraper is not None:
+            return
+        with self._cloud_scraper_lock:
+            if self.cloud_scraper is None:
+                logger.info("Initializing CloudScraperEngine for fallback...")
+                # Imported here so cloudscraper is only loaded if the fallback is needed
+                from scrapers.cloudscraper_engine import CloudScraperEngine
+                cloud_scraper = CloudScraperEngine()
+                # Count its requests against the same per-host budget and rules
+                cloud_scraper.rate_limiter = self.rate_limiter
+                cloud_scraper.robots = self.robots
+                self.cloud_scraper = cloud_scraper
 
     def get_page(self, url: str, **kwargs) -> str:
         """Get page content using Requests with proxy rotation.
 
         Args:
             url: URL to get.
-            **kwargs: Additional arguments to pass to requests.
+            **kwargs: Additional arguments to pass to requests. ``stream``,
+                ``max_body_size`` and ``stop_when`` override the streaming
+                settings for this call (see ``scrapers.streaming.read_body``).
 
         Returns:
             HTML content of the page.
 
         Raises:
-            Exception: If the page could not be retrieved after retries.
+            ScraperException: If the page could not be retrieved after retries,
+                or the non-retryable error that ended the first attempt.
         """
         max_retries = kwargs.get('max_retries', 5)
-        retry_delay = kwargs.get('retry_delay', 2)
+        try:
+            return self.submit_page(url, **kwargs).result()
+        except Exception as e:
+            if not getattr(e, 'retryable', True):
+                raise
+            raise ScraperException(f"Failed after {max_retries} retries: {e}") from e
+
+    def submit_page(self, url: str, **kwargs) -> Future:
+        """Schedule a page fetch without blocking the calling thread.
+
+        Failed attempts are parked on the retry scheduler until their backoff
+        expires, and attempts waiting for the host's rate limit slot until it
+        is due, leaving worker threads free for other URLs.
+
+        Args:
+            url: URL to get.
+            **kwargs: Additional arguments to pass to requests.
+
+        Returns:
+            Future resolved with the HTML content of the page.
+        """
+        max_retries = kwargs.pop('max_retries', 5)
+        base_delay = kwargs.pop('retry_delay', 2)
+        
+        if self.http_cache and kwargs.get('method', 'GET').upper() == 'GET':
+            # Revalidate against our cached copy instead of busting intermediate caches
+            request_url = url
+        else:
+            # Add cache buster to avoid caching
+            cache_buster = f"_cb={random.randint(1000000, 9999999)}"
+            request_url = f"{url}{'&' if '?' in url else '?'}{cache_buster}"
+        
+        host = get_host(url)
+        
+        # Crawl-delay caps the host's rate, so check robots.txt once before
+        # the first slot is booked rather than before every attempt
+        try:
+            self._check_robots(url)
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+            return future
+        
+        def _attempt(attempt: int) -> str:
+            start_time = time.time()
+            try:
+                with self.session_pool.lease() as session:
+                    html = self._fetch_attempt(session, url, request_url, attempt, max_retries, **kwargs)
+            except Exception:
+                self._record_attempt(host, time.time() - start_time, success=False)
+                raise
+            self._record_attempt(host, time.time() - start_time, success=True)
+            return html
+        
+        def _backoff(attempt: int, error: Exception) -> float:
+            # The server's Retry-After if it sent one, else exponential backoff with jitter
+            return retry_delay(error, base_delay * (1.5 ** (attempt - 1)) * (0.5 + random.random()))
+        
+        def _on_retry(attempt: int, error: Exception, delay: float) -> None:
+            logger.warning("Retrying %s in %.2f seconds...", url, delay)
+        
+        return self.retry_scheduler.submit(_attempt, host=host, max_retries=max_retries,
+                                           backoff=_backoff, on_retry=_on_retry,
+                                           throttle=lambda: self._reserve(host))
+
+    def _fetch_attempt(self, session: requests.Session, url: str, request_url: str, attempt: int,
+                       max_retries: int, **kwargs) -> str:
+        """Make a single fetch attempt.
+
+        Headers that vary per request (user agent, fingerprint, validators)
+        are passed with the request, so the leased session is never shared
+        state between threads.
+
+        Args:
+            session: Session leased for this attempt.
+            url: Original URL being fetched.
+            request_url: URL to request, including the cache buster if any.
+            attempt: 1-based attempt number.
+            max_retries: Total number of attempts that will be made.
+            **kwargs: Additional arguments to pass to requests.
+
+        Returns:
+            HTML content of the page.
+
+        Raises:
+            Exception: If this attempt failed.
+        """
         method = kwargs.get('method', 'GET')
         data = kwargs.get('data', None)
         params = kwargs.get('params', None)
         timeout = kwargs.get('timeout', 30)
-        
-        # Add cache buster to avoid caching
-        cache_buster = f"_cb={random.randint(1000000, 9999999)}"
-        request_url = f"{url}{'&' if '?' in url else '?'}{cache_buster}"
+        stream = kwargs.get('stream', self.stream)
+        stop_when = kwargs.get('stop_when', None)
         
         # Try CloudScraperEngine first for known Cloudflare-protected sites
-        if 'filmfreeway.com' in url:
+        if attempt == 1 and 'filmfreeway.com' in url:
             logger.info("Using CloudScraperEngine for Filmfreeway (known Cloudflare-protected site)")
             self._init_cloud_scraper()
-            html = self.cloud_scraper.get_page(url)
+            try:
+                html = self.cloud_scraper.get_page(url)
+            except Exception as e:
+                logger.warning("CloudScraperEngine error: %s", e)
+                html = None
             if html and len(html) > 1000:
                 logger.info("Successfully fetched page using CloudScraperEngine")
                 return html
             else:
                 logger.warning("CloudScraperEngine failed, falling back to regular flow")
         
-        # Regular request flow with retries
-        for attempt in range(1, max_retries + 1):
-            current_proxy = None
-            try:
-                # Get a proxy if available
-                if self.proxy_manager:
-                    current_proxy = self.proxy_manager.get_proxy()
-                    proxies = current_proxy.as_dict() if current_proxy else None
-                else:
-                    proxies = self._get_random_proxy()
-                
-                # Rotate user agent for each retry
-                if attempt > 1:
-                    self.rotate_user_agent()
-                    self.session.headers.update({"User-Agent": self.current_user_agent})
-                
-                # Add browser fingerprinting headers
-                self._add_browser_fingerprinting()
-                
-                # Make the request
-                if method.upper() == 'POST':
-                    response = self.session.post(
-                        request_url,
-                        data=data,
-                        params=params,
-                        proxies=proxies,
-                        timeout=timeout
-                    )
-                else:
-                    response = self.session.get(
-                        request_url,
-                        params=params,
-                        proxies=proxies,
-                        timeout=timeout
-                    )
-                
-                # Check for Cloudflare challenge
-                if response.status_code == 403 or self.detect_cloudflare_challenge(response.text):
-                    logger.warning(f"Cloudflare protection detected (status code: {response.status_code})")
-                    
-                    # Try to solve Cloudflare challenge
-                    cf_content = self.solve_cloudflare_challenge(url)
-                    if cf_content:
-                        logger.info("Successfully solved Cloudflare challenge")
-                        # Release proxy if it was successful
-                        if current_proxy and self.proxy_manager:
-                            self.proxy_manager.release_proxy(current_proxy, success=True)
-                        return cf_content
-                    
-                    # If solving challenge failed, use CloudScraperEngine as fallback
-                    logger.info("Falling back to CloudScraperEngine")
-                    self._init_cloud_scraper()
+        current_proxy = None
+        try:
+            # Get a proxy if available
+            if self.proxy_manager:
+                current_proxy = self.proxy_manager.get_proxy()
+                proxies = current_proxy.as_dict() if current_proxy else None
+            else:
+                proxies = self._get_random_proxy()
+
+            # Fresh browser fingerprint for each attempt, and a new user agent on retries
+            headers = self._generate_browser_fingerprint()
+            headers['User-Agent'] = self._get_random_user_agent() if attempt > 1 else self.current_user_agent
+
+            # Look up the cached copy of this page for a conditional request
+            cached = None
+            cache_key = None
+            if self.http_cache and method.upper() == 'GET':
+                cache_key = requests.Request('GET', request_url, params=params).prepare().url
+                cached = self.http_cache.get(cache_key)
+                if cached:
+                    headers.update(cached.conditional_headers())
+
+            # Make the request
+            request_start = time.time()
+            if method.upper() == 'POST':
+                response = session.post(
+                    request_url,
+                    data=data,
+                    params=params,
+                    headers=headers,
+                    proxies=proxies,
+                    timeout=timeout,
+                    verify=self.verify_ssl,
+                    stream=stream
+                )
+            else:
+                response = session.get(
+                    request_url,
+                    params=params,
+                    headers=headers,
+                    proxies=proxies,
+                    timeout=timeout,
+                    verify=self.verify_ssl,
+                    stream=stream
+                )
+            
+            if stream:
+                html = read_body(response, max_bytes=kwargs.get('max_body_size', self.max_body_size),
+                                 stop_when=stop_when, chunk_size=self.stream_chunk_size)
+            else:
+                html = response.text
+            
+            # response.elapsed stops once the headers are parsed; the rest is the body
+            ttfb = response.elapsed.total_seconds()
+            self._record_timings(get_host(url), ttfb=ttfb, body=max(0.0, time.time() - request_start - ttfb))
+
+            # Not modified since we cached it: serve the stored body
+            if response.status_code == 304 and cached:
+                logger.debug("Cached copy of %s is still valid", url)
+                self.http_cache.mark_revalidated(cached)
+                if current_proxy and self.proxy_manager:
+                    self.proxy_manager.release_proxy(current_proxy, success=True)
+                return cached.body
+
+            # Check for Cloudflare challenge
+            if response.status_code == 403 or self.detect_cloudflare_challenge(html):
+                logger.warning("Cloudflare protection detected (status code: %s)", response.status_code)
+
+                # Try to solve Cloudflare challenge
+                cf_content = self._handle_cloudflare_challenge(response, url, html, session=session)
+                if cf_content:
+                    logger.info("Successfully solved Cloudflare challenge")
+                    # Release proxy if it was successful
+                    if current_proxy and self.proxy_manager:
+                        self.proxy_manager.release_proxy(current_proxy, success=True)
+                    return cf_content
+
+                # If solving challenge failed, use CloudScraperEngine as fallback
+                logger.info("Falling back to CloudScraperEngine")
+                self._init_cloud_scraper()
+                html = self.cloud_scraper.get_page(url)
+                if html and len(html) > 1000:
+                    logger.info("Successfully bypassed Cloudflare using CloudScraperEngine")
+                    # Release proxy if it was successful
+                    if current_proxy and self.proxy_manager:
+                        self.proxy_manager.release_proxy(current_proxy, success=True)
+                    return html
+
+                # If CloudScraperEngine also failed, continue with retries
+                logger.warning("CloudScraperEngine fallback failed, continuing with retries")
+                raise Exception("CloudScraperEngine fallback failed")
+
+            # If not a Cloudflare challenge or if challenge handling failed, proceed normally;
+            # a throttled host is paused for its Retry-After
+            self._check_response(url, response.status_code, response.headers)
+
+            # A body cut short by stop_when must not be served as the full page
+            if cache_key and not stop_when:
+                self.http_cache.store(cache_key, html, response.headers)
+
+            # Release proxy if it was successful
+            if current_proxy and self.proxy_manager:
+                self.proxy_manager.release_proxy(current_proxy, success=True)
+
+            return html
+
+        except Exception as e:
+            # Release proxy with failure status; errors that won't go away on
+            # retry (oversized body, 404, ...) are not the proxy's fault
+            if current_proxy and self.proxy_manager:
+                self.proxy_manager.release_proxy(current_proxy, success=not getattr(e, 'retryable', True))
+
+            logger.warning("Attempt %s/%s failed: %s", attempt, max_retries, e)
+
+            # Clear cookies and try again with fresh state if we've had multiple failures
+            if attempt % 3 == 0:
+                logger.info("Clearing cookies for fresh session")
+                self._reset_session_state(session)
+
+            # If this is the last attempt, try CloudScraperEngine as a last resort
+            if attempt == max_retries and getattr(e, 'retryable', True):
+                logger.info("Last attempt failed, trying CloudScraperEngine as last resort")
+                self._init_cloud_scraper()
+                try:
                     html = self.cloud_scraper.get_page(url)
                     if html and len(html) > 1000:
-                        logger.info("Successfully bypassed Cloudflare using CloudScraperEngine")
-                        # Release proxy if it was successful
-                        if current_proxy and self.proxy_manager:
-                            self.proxy_manager.release_proxy(current_proxy, success=True)
+                        logger.info("Successfully bypassed using CloudScraperEngine on last attempt")
                         return html
-                    
-                    # If CloudScraperEngine also failed, continue with retries
-                    logger.warning("CloudScraperEngine fallback failed, continuing with retries")
-                    raise Exception("CloudScraperEngine fallback failed")
-                
-                # If not a Cloudflare challenge or if challenge handling failed, proceed normally
-                response.raise_for_status()
-                
-                # Release proxy if it was successful
-                if current_proxy and self.proxy_manager:
-                    self.proxy_manager.release_proxy(current_proxy, success=True)
-                
-                return response.text
-                
-            except Exception as e:
-                # Release proxy with failure status
-                if current_proxy and self.proxy_manager:
-                    self.proxy_manager.release_proxy(current_proxy, success=False)
-                
-                logger.warning(f"Attempt {attempt}/{max_retries} failed: {e}")
-                
-                # Clear cookies and try again with a fresh session if we've had multiple failures
-                if attempt % 3 == 0:
-                    logger.info("Clearing cookies for fresh session")
-                    self.session.cookies.clear()
-                    self._initialize_session()
-                
-                # If this is the last attempt, try CloudScraperEngine as a last resort
-                if attempt == max_retries:
-                    logger.info("Last attempt failed, trying CloudScraperEngine as last resort")
-                    self._init_cloud_scraper()
-                    try:
-                        html = self.cloud_scraper.get_page(url)
-                        if html and len(html) > 1000:
-                            logger.info("Successfully bypassed using CloudScraperEngine on last attempt")
-                            return html
-                    except Exception as cloud_error:
-                        logger.error(f"CloudScraperEngine last resort failed: {cloud_error}")
-                
-                # If we haven't reached the max retries yet, wait and try again
-                if attempt < max_retries:
-                    # Calculate delay with exponential backoff and jitter
-                    current_delay = retry_delay * (1.5 ** (attempt - 1)) * (0.5 + random.random())
-                    logger.warning(f"Retrying in {current_delay:.2f} seconds...")
-                    time.sleep(current_delay)
-        
-        # If we get here, all retries failed
-        raise Exception(f"Failed after {max_retries} retries")
+                except Exception as cloud_error:
+                    logger.error("CloudScraperEngine last resort failed: %s", cloud_error)
+
+            raise
+
+    async def aget_page(self, url: str, **kwargs) -> str:
+        """Get page content without blocking the event loop.
+
+        The fetch runs on the retry scheduler's worker pool (sized by the
+        ``retry_workers`` config option); backoff between attempts does not
+        occupy a thread.
+
+        Args:
+            url: URL to get.
+            **kwargs: Additional arguments to pass to requests.
+
+        Returns:
+            HTML content of the page.
+        """
+        # Download robots.txt off the event loop; submit_page then finds it cached
+        await self._acheck_robots(url)
+        return await asyncio.wrap_future(self.submit_page(url, **kwargs))
 
     def close(self) -> None:
         """Close the scraper and clean up resources."""
         try:
-            if self.session:
-                self.session.close()
+            self._close_retry_scheduler()
+            self.session_pool.close()
             if self.cloud_scraper:
                 self.cloud_scraper.close()
             logger.info("Closed Requests scraper")
         except Exception as e:
-            logger.error(f"Error closing Requests scraper: {e}")
+            logger.error("Error closing Requests scraper: %s", e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scraper statistics.
 
-    def extract_data(self, html: str) -> BeautifulSoup:
-        """Extract data from HTML using BeautifulSoup.
+        Returns:
+            Dictionary of scraper statistics, including connection pool and
+            HTTP cache counters.
+        """
+        stats = super().get_stats()
+        stats['connection_pool'] = summarize_pool_counts(self._adapters)
+        stats['session_pool'] = self.session_pool.get_stats()
+        if self.http_cache:
+            stats['http_cache'] = self.http_cache.get_stats()
+        return stats
+
+    def extract_data(self, html: str) -> Any:
+        """Extract data from HTML using the configured parser backend.
 
         Args:
             html: HTML content to parse.
 
         Returns:
-            BeautifulSoup object.
+            Parsed document; a BeautifulSoup object unless the selectolax
+            backend is configured.
         """
-        return BeautifulSoup(html, 'html.parser')
+        return self.parse_html(html)
 
     def simulate_human_behavior(self, url: str) -> None:
         """Simulate human-like behavior by making additional requests.
@@ -510,25 +790,26 @@ class RequestsScraper(BaseScraper):
             for resource in resources_to_request:
                 try:
                     resource_url = f"{base_url}{resource}"
-                    logger.debug(f"Simulating human behavior: requesting {resource_url}")
+                    logger.debug("Simulating human behavior: requesting %s", resource_url)
                     
-                    # Make the request with a short timeout
-                    self.session.get(
-                        resource_url,
-                        timeout=5,
-                        allow_redirects=False,
-                        verify=self.verify_ssl
-                    )
+                    # Space the requests out as the host's rate limit allows
+                    self._throttle(get_host(base_url))
                     
-                    # Short delay between requests
-                    time.sleep(random.uniform(0.5, 2.0))
+                    # Make the request with a short timeout
+                    with self.session_pool.lease() as session:
+                        session.get(
+                            resource_url,
+                            timeout=5,
+                            allow_redirects=False,
+                            verify=self.verify_ssl
+                        )
                     
                 except Exception as e:
                     # Ignore errors, this is just for simulation
-                    logger.debug(f"Error during human behavior simulation: {e}")
+                    logger.debug("Error during human behavior simulation: %s", e)
             
         except Exception as e:
-            logger.debug(f"Error simulating human behavior: {e}")
+            logger.debug("Error simulating human behavior: %s", e)
             # Don't raise, this is non-critical
             
     def preload_cookies(self, url: str) -> None:
@@ -541,7 +822,7 @@ class RequestsScraper(BaseScraper):
             parsed_url = urlparse(url)
             base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
             
-            logger.info(f"Preloading cookies from {base_url}")
+            logger.info("Preloading cookies from %s", base_url)
             
             # First visit the homepage with minimal headers to get initial cookies
             initial_headers = {
@@ -555,29 +836,29 @@ class RequestsScraper(BaseScraper):
                 "TE": "Trailers",
             }
             
-            self.session.headers.update(initial_headers)
-            
             # Make a request to the homepage
-            response = self.session.get(
-                base_url,
-                timeout=self.timeout,
-                allow_redirects=True,
-                verify=self.verify_ssl
-            )
-            
-            # Update cookies
-            self.update_cookies(dict(response.cookies))
-            
-            # Check for Cloudflare
-            if 'cloudflare' in response.text.lower():
-                logger.info("Cloudflare detected on homepage, attempting to handle")
-                self._handle_cloudflare_challenge(response, base_url)
-            
-            # Wait a bit before proceeding
-            time.sleep(random.uniform(2.0, 4.0))
+            self._throttle(get_host(base_url))
+            with self.session_pool.lease() as session:
+                response = session.get(
+                    base_url,
+                    headers=initial_headers,
+                    timeout=self.timeout,
+                    allow_redirects=True,
+                    verify=self.verify_ssl
+                )
+                
+                # Check for Cloudflare
+                if 'cloudflare' in response.text.lower():
+                    logger.info("Cloudflare detected on homepage, attempting to handle")
+                    self._handle_cloudflare_challenge(response, base_url, session=session)
+                
+                # Share the cookies with every session in the pool
+                self.update_cookies(dict(session.cookies))
             
-            logger.info(f"Preloaded cookies: {json.dumps(dict(self.session.cookies))}")
+            # Serializing the cookie jar is only worth it when someone will read it
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Preloaded cookies: %s", json.dumps(self.cookies))
             
         except Exception as e:
-            logger.warning(f"Error preloading cookies: {e}")
+            logger.warning("Error preloading cookies: %s", e)
             # Not critical, we can continue
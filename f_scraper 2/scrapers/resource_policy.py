@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Resource Policy
+
+This module decides which subresources a browser render may load. Images,
+fonts, media and analytics/ad trackers are never used by the extractors, so
+blocking them saves their download and decode time on every render.
+
+Requests are allowed or denied by resource type (as reported by the browser:
+``image``, ``font``, ``media``, ``script``, ...) and by domain. Allowed domains
+win over every other rule. The size of a request that was never sent is
+unknown, so bytes saved are estimated from typical transfer sizes per
+resource type.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+from scrapers.url_utils import get_host
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCKED_TYPES = ('image', 'font', 'media')
+
+# Analytics, advertising and session-recording hosts
+DEFAULT_BLOCKED_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'googleadservices.com', 'googlesyndication.com',
+    'doubleclick.net', 'facebook.net', 'hotjar.com', 'segment.com', 'segment.io',
+    'mixpanel.com', 'amplitude.com', 'fullstory.com', 'clarity.ms', 'newrelic.com', 'nr-data.net',
+    'scorecardresearch.com', 'quantserve.com', 'criteo.com', 'taboola.com', 'outbrain.com',
+    'adsrvr.org', 'bat.bing.com', 'ads-twitter.com', 'intercom.io', 'sentry.io',
+)
+
+# Typical transfer sizes in bytes, used to estimate the savings of a blocked request
+ESTIMATED_SIZES = {
+    'image': 25_000,
+    'font': 35_000,
+    'media': 500_000,
+    'script': 25_000,
+    'stylesheet': 10_000,
+}
+DEFAULT_ESTIMATED_SIZE = 5_000
+
+
+def _matches(host: str, domains: Iterable[str]) -> bool:
+    """Check whether a host is one of the domains or a subdomain of one."""
+    return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+
+def _site(host: str) -> str:
+    """Approximate the registrable domain of a host by its last two labels."""
+    return '.'.join(host.rsplit('.', 2)[-2:])
+
+
+class ResourcePolicy:
+    """Allow/deny rules for the subresources of a render."""
+
+    def __init__(self, block_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+                 block_domains: Iterable[str] = DEFAULT_BLOCKED_DOMAINS,
+                 allow_domains: Iterable[str] = (), block_third_party: bool = False,
+                 estimated_sizes: Dict[str, int] = None):
+        """Initialize the policy.
+
+        Args:
+            block_types: Resource types to block.
+            block_domains: Domains whose requests are blocked, with their
+                subdomains.
+            allow_domains: Domains that are always allowed, with their
+                subdomains.
+            block_third_party: Whether to block subresources from other
+                sites than the page's. Frames and navigations are exempt.
+            estimated_sizes: Overrides of the typical transfer size per
+                resource type, used to estimate bytes saved.
+        """
+        self.block_types = frozenset(block_types)
+        self.block_domains = tuple(domain.lower() for domain in block_domains)
+        self.allow_domains = tuple(domain.lower() for domain in allow_domains)
+        self.block_third_party = block_third_party
+        self.estimated_sizes = {**ESTIMATED_SIZES, **(estimated_sizes or {})}
+
+    def should_block(self, resource_type: str, url: str, page_host: str = '') -> bool:
+        """Decide whether a request may be sent.
+
+        Args:
+            resource_type: Resource type reported by the browser.
+            url: URL of the request.
+            page_host: Host of the page being rendered.
+
+        Returns:
+            True if the request should be aborted.
+        """
+        host = get_host(url)
+        if not host or _matches(host, self.allow_domains):
+            return False
+        if _matches(host, self.block_domains):
+            return True
+        if resource_type == 'document':
+            return False
+        if resource_type in self.block_types:
+            return True
+        return self.block_third_party and bool(page_host) and _site(host) != _site(page_host)
+
+    def estimated_size(self, resource_type: str) -> int:
+        """Get the typical transfer size of a resource type.
+
+        Args:
+            resource_type: Resource type reported by the browser.
+
+        Returns:
+            Estimated size in bytes.
+        """
+        return self.estimated_sizes.get(resource_type, DEFAULT_ESTIMATED_SIZE)
+
+
+class ResourceBlocker:
+    """Applies a policy to the requests of one page and counts what it blocked.
+
+    ``handle`` is meant to be installed with ``page.route('**/*', ...)``.
+    The page renders one URL at a time, so counts are kept per render
+    between ``start`` and ``finish``.
+    """
+
+    def __init__(self, policy: ResourcePolicy):
+        """Initialize the blocker.
+
+        Args:
+            policy: Policy deciding which requests to block.
+        """
+        self.policy = policy
+        self.page_host = ''
+        self._blocked: Dict[str, int] = {}
+        self._bytes_saved = 0
+
+    def start(self, url: str) -> None:
+        """Start counting for a render.
+
+        Args:
+            url: URL being rendered.
+        """
+        self.page_host = get_host(url)
+        self._blocked = {}
+        self._bytes_saved = 0
+
+    async def handle(self, route: Any) -> None:
+        """Abort or continue an intercepted request.
+
+        Args:
+            route: Playwright route of the request.
+        """
+        request = route.request
+        resource_type = request.resource_type
+        try:
+            blocked = self.policy.should_block(resource_type, request.url, self.page_host)
+        except Exception as e:
+            logger.debug("Error applying resource policy to %s: %s", request.url, e)
+            blocked = False
+
+        if blocked:
+            self._blocked[resource_type] = self._blocked.get(resource_type, 0) + 1
+            self._bytes_saved += self.policy.estimated_size(resource_type)
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def finish(self) -> Dict[str, Any]:
+        """Get what was blocked during the render.
+
+        Returns:
+            Dictionary with the number of blocked requests, counts per
+            resource type and the estimated bytes saved.
+        """
+        return {
+            'blocked': sum(self._blocked.values()),
+            'by_type': dict(self._blocked),
+            'bytes_saved': self._bytes_saved,
+        }
+
+
+def create_from_config(setting: Any) -> Optional[ResourcePolicy]:
+    """Build a resource policy as requested by a ``block_resources`` config value.
+
+    Args:
+        setting: False/None to load every resource, True for the default
+            policy, or a dict of ResourcePolicy options.
+
+    Returns:
+        The resource policy, or None if the setting is off.
+    """
+    if not setting:
+        return None
+    return ResourcePolicy(**(setting if isinstance(setting, dict) else {}))
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Response Capture
+
+This module collects the JSON responses a page loads while it renders. Many
+pages fetch their listing data from JSON APIs and then build the DOM from
+it; taking the payloads straight from the network gives extractors the data
+in structured form, without parsing the rendered HTML.
+
+Callers pass URL patterns for the responses they want. Matching responses
+with a JSON content type are decoded in the background and collected in the
+order the browser received them.
+"""
+
+import asyncio
+import json
+import logging
+import re
+from typing import Any, Iterable, List, NamedTuple, Optional, Pattern, Union
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+
+
+class CapturedResponse(NamedTuple):
+    """A decoded JSON response."""
+
+    url: str
+    status: int
+    data: Any
+
+
+class RenderResult(NamedTuple):
+    """A rendered page and the responses captured while rendering it."""
+
+    url: str
+    html: Optional[str]
+    responses: List[CapturedResponse]
+
+    def payloads(self, pattern: Union[str, Pattern] = None) -> List[Any]:
+        """Get the decoded payloads, optionally only those from matching URLs.
+
+        Args:
+            pattern: Regular expression searched in the response URLs.
+
+        Returns:
+            List of decoded JSON payloads.
+        """
+        if pattern is None:
+            return [response.data for response in self.responses]
+        regex = re.compile(pattern)
+        return [response.data for response in self.responses if regex.search(response.url)]
+
+
+class ResponseCapture:
+    """Collects the JSON responses of one render whose URLs match patterns."""
+
+    def __init__(self, patterns: Union[str, Pattern, Iterable[Union[str, Pattern]]],
+                 max_bytes: int = DEFAULT_MAX_BYTES, timeout: float = 5.0):
+        """Initialize the capture.
+
+        Args:
+            patterns: Regular expression(s) searched in response URLs.
+            max_bytes: Largest body to decode; bigger responses are skipped.
+            timeout: Longest time in seconds ``finish`` waits for bodies
+                still being read.
+        """
+        if isinstance(patterns, (str, re.Pattern)):
+            patterns = [patterns]
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.skipped = 0
+        self._page = None
+        self._tasks: List[asyncio.Task] = []
+
+    def matches(self, url: str) -> bool:
+        """Check whether a response URL matches any pattern.
+
+        Args:
+            url: Response URL.
+
+        Returns:
+            True if the response should be captured.
+        """
+        return any(pattern.search(url) for pattern in self.patterns)
+
+    def attach(self, page: Any) -> None:
+        """Start capturing the responses of a page.
+
+        Args:
+            page: Page about to render.
+        """
+        self._page = page
+        page.on('response', self._on_response)
+
+    def detach(self) -> None:
+        """Stop capturing responses."""
+        if self._page is None:
+            return
+        try:
+            self._page.remove_listener('response', self._on_response)
+        except Exception as e:
+            logger.debug("Error removing response listener: %s", e)
+        self._page = None
+
+    def cancel(self) -> None:
+        """Stop capturing and cancel the bodies still being read.
+
+        Called when a render fails before ``finish``, so no read keeps using
+        a page that has gone back to the pool.
+        """
+        self.detach()
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+
+    def _on_response(self, response: Any) -> None:
+        # Runs synchronously when the event fires, so finish() sees every read
+        if not self.matches(response.url):
+            return
+        content_type = response.headers.get('content-type', '')
+        if 'json' not in content_type.lower():
+            self.skipped += 1
+            return
+        self._tasks.append(asyncio.ensure_future(self._read(response)))
+
+    async def _read(self, response: Any) -> Optional[CapturedResponse]:
+        try:
+            body = await response.body()
+            if len(body) > self.max_bytes:
+                logger.debug("Skipping %s byte response from %s", len(body), response.url)
+                self.skipped += 1
+                return None
+            return CapturedResponse(response.url, response.status, json.loads(body))
+        except Exception as e:
+            logger.debug("Could not capture response from %s: %s", response.url, e)
+            self.skipped += 1
+            return None
+
+    async def finish(self) -> List[CapturedResponse]:
+        """Wait for the bodies being read and get the captured responses.
+
+        Returns:
+            Captured responses in the order they were received.
+        """
+        self.detach()
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=self.timeout)
+            for task in pending:
+                logger.debug("Gave up waiting for a captured response body")
+                task.cancel()
+        return [task.result() for task in self._tasks
+                if task.done() and not task.cancelled() and task.result() is not None]
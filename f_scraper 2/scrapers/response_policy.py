@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Response Policy
+
+This module decides what an HTTP status means for the scraper, for every
+engine alike: success, a transient failure worth retrying, throttling by the
+server (429, or 503 with ``Retry-After``), or a permanent failure. Throttling
+responses carry the server's ``Retry-After`` delay, so the retry waits exactly
+as long as asked and the host can be paused on the rate limiter while other
+hosts keep going.
+"""
+
+import logging
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, NamedTuple, Optional
+
+from scrapers.base_scraper import ScraperException
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+OK = 'ok'
+RETRY = 'retry'
+THROTTLED = 'throttled'
+FAIL = 'fail'
+
+# Statuses that can succeed on a later attempt
+RETRY_STATUSES = frozenset([403, 408, 425, 500, 502, 503, 504, 520, 521, 522, 523, 524])
+# Statuses the server uses to tell us to slow down
+THROTTLE_STATUSES = frozenset([429, 503])
+
+
+class ResponseClass(NamedTuple):
+    """Classification of a response status."""
+
+    action: str
+    retry_after: Optional[float] = None
+
+
+class HttpStatusError(ScraperException):
+    """Raised for a response whose status is not a success."""
+
+    def __init__(self, message: str, status_code: int, retryable: bool = True,
+                 retry_after: Optional[float] = None):
+        """Initialize the error.
+
+        Args:
+            message: Error message.
+            status_code: HTTP status of the response.
+            retryable: Whether another attempt may succeed.
+            retry_after: Seconds the server asked us to wait, if it did.
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def _get_header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """Look up a header in any mapping, ignoring case."""
+    value = headers.get(name)
+    if value is None:
+        name = name.lower()
+        value = next((v for k, v in headers.items() if k.lower() == name), None)
+    return value
+
+
+def parse_retry_after(value: Optional[str], now: float = None) -> Optional[float]:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date.
+        now: Current Unix time, for testing. Defaults to ``time.time()``.
+
+    Returns:
+        Seconds to wait (never negative), or None if the value is missing or
+        malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        logger.debug("Ignoring malformed Retry-After value %r", value)
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+def classify_response(status_code: int, headers: Mapping[str, str] = None) -> ResponseClass:
+    """Classify a response by its status and headers.
+
+    Args:
+        status_code: HTTP status of the response.
+        headers: Response headers.
+
+    Returns:
+        ResponseClass with the action (OK, RETRY, THROTTLED or FAIL) and the
+        ``Retry-After`` delay for throttled responses.
+    """
+    if status_code < 400:
+        return ResponseClass(OK)
+    retry_after = parse_retry_after(_get_header(headers, 'Retry-After')) if headers else None
+    if status_code == 429 or (status_code in THROTTLE_STATUSES and retry_after is not None):
+        return ResponseClass(THROTTLED, retry_after)
+    if status_code in RETRY_STATUSES:
+        return ResponseClass(RETRY)
+    return ResponseClass(FAIL)
+
+
+def check_response(url: str, status_code: int, headers: Mapping[str, str] = None,
+                   max_retry_after: float = None) -> ResponseClass:
+    """Raise for responses that are not a success.
+
+    Args:
+        url: URL of the response, for the error message.
+        status_code: HTTP status of the response.
+        headers: Response headers.
+        max_retry_after: Longest ``Retry-After`` worth waiting for; longer
+            delays make the error non-retryable.
+
+    Returns:
+        The classification of a successful response.
+
+    Raises:
+        HttpStatusError: If the status is not a success.
+    """
+    result = classify_response(status_code, headers)
+    if result.action == OK:
+        return result
+
+    message = f"HTTP {status_code} for {url}"
+    if result.action == THROTTLED:
+        retryable = result.retry_after is None or max_retry_after is None or result.retry_after <= max_retry_after
+        if result.retry_after is not None:
+            message += f" (Retry-After {result.retry_after:.0f}s)"
+        raise HttpStatusError(message, status_code, retryable=retryable, retry_after=result.retry_after)
+    raise HttpStatusError(message, status_code, retryable=result.action == RETRY)
+
+
+def retry_delay(error: Exception, default: float) -> float:
+    """Get the delay before retrying after an error.
+
+    Args:
+        error: Exception raised by the failed attempt.
+        default: Backoff delay to use when the server didn't ask for one.
+
+    Returns:
+        The server's ``Retry-After`` delay if the error carries one, else
+        ``default``.
+    """
+    retry_after = getattr(error, 'retry_after', None)
+    return default if retry_after is None else retry_after
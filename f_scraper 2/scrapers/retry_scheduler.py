@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Retry Scheduler
+
+This module implements a non-blocking retry scheduler. Work items run on a
+thread pool; when an attempt fails, the item is parked on a timer heap until
+its backoff expires instead of holding a worker thread in ``time.sleep``.
+Attempts that must wait for their host's turn on a rate limiter are parked
+the same way.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class _RetryItem:
+    """A unit of work tracked by the scheduler across attempts."""
+
+    __slots__ = ('func', 'host', 'max_retries', 'backoff', 'on_retry', 'throttle', 'throttled',
+                 'attempt', 'future')
+
+    def __init__(self, func: Callable[[int], Any], host: str, max_retries: int,
+                 backoff: Callable[[int, Exception], float],
+                 on_retry: Optional[Callable[[int, Exception, float], None]],
+                 throttle: Optional[Callable[[], float]]):
+        self.func = func
+        self.host = host
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.on_retry = on_retry
+        self.throttle = throttle
+        # Set while the item waits out a throttle delay; its slot is booked
+        self.throttled = False
+        self.attempt = 0
+        self.future = Future()
+
+
+class RetryScheduler:
+    """Thread pool with a timer heap for parking failed work until it may retry."""
+
+    def __init__(self, max_workers: int = 8, name: str = 'retry'):
+        """Initialize the retry scheduler.
+
+        Args:
+            max_workers: Number of worker threads running attempts.
+            name: Prefix for worker thread names.
+        """
+        self.name = name
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._parked = Counter()
+        self._timer = None
+        self._closed = False
+
+    def submit(self, func: Callable[[int], Any], host: str = '', max_retries: int = 5,
+               backoff: Callable[[int, Exception], float] = None,
+               on_retry: Callable[[int, Exception, float], None] = None,
+               throttle: Callable[[], float] = None) -> Future:
+        """Submit work to be attempted up to ``max_retries`` times.
+
+        Args:
+            func: Callable taking the 1-based attempt number.
+            host: Host the work targets, used for per-host queue depth.
+            max_retries: Maximum number of attempts.
+            backoff: Callable returning the delay in seconds before the next
+                attempt, given the failed attempt number and its exception.
+            on_retry: Optional hook called with (attempt, exception, delay)
+                before a failed item is parked.
+            throttle: Optional callable run before each attempt that books
+                the attempt's slot and returns the seconds to wait for it,
+                such as ``RateLimiter.reserve`` for the host. The item is
+                parked for that long instead of holding a worker. An
+                exception raised by it fails the item.
+
+        Returns:
+            Future resolved with the first successful result, or with the
+            last exception once all attempts have failed or an attempt
+            raised an exception whose ``retryable`` attribute is False.
+        """
+        if self._closed:
+            raise RuntimeError(f"Retry scheduler '{self.name}' is closed")
+
+        item = _RetryItem(func, host, max(1, max_retries), backoff or (lambda attempt, error: 0), on_retry,
+                          throttle)
+        self._executor.submit(self._run, item)
+        return item.future
+
+    def _run(self, item: _RetryItem) -> None:
+        """Run one attempt of a work item and park it on failure."""
+        if not item.future.running() and not item.future.set_running_or_notify_cancel():
+            return
+        if self._closed:
+            item.future.set_exception(RuntimeError(f"Retry scheduler '{self.name}' is closed"))
+            return
+
+        if item.throttle is not None and not item.throttled:
+            try:
+                delay = item.throttle()
+            except Exception as e:
+                item.future.set_exception(e)
+                return
+            if delay > 0:
+                # The slot is booked; come back when it is due
+                item.throttled = True
+                self._park(item, delay)
+                return
+        item.throttled = False
+
+        item.attempt += 1
+        try:
+            result = item.func(item.attempt)
+        except Exception as e:
+            # Errors can opt out of retries by setting retryable = False
+            if item.attempt >= item.max_retries or not getattr(e, 'retryable', True):
+                item.future.set_exception(e)
+                return
+            try:
+                delay = max(0.0, item.backoff(item.attempt, e))
+                if item.on_retry:
+                    item.on_retry(item.attempt, e, delay)
+            except Exception as hook_error:
+                item.future.set_exception(hook_error)
+                return
+            self._park(item, delay)
+        else:
+            item.future.set_result(result)
+
+    def _park(self, item: _RetryItem, delay: float) -> None:
+        """Park a work item until its backoff or throttle delay expires."""
+        with self._cond:
+            if self._closed:
+                item.future.set_exception(RuntimeError(f"Retry scheduler '{self.name}' is closed"))
+                return
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), item))
+            if not item.throttled:
+                self._parked[item.host] += 1
+            if self._timer is None:
+                self._timer = threading.Thread(target=self._timer_loop, name=f"{self.name}-timer", daemon=True)
+                self._timer.start()
+            self._cond.notify()
+
+    def _timer_loop(self) -> None:
+        """Move parked work items back to the thread pool once they are due."""
+        with self._cond:
+            while not self._closed:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+
+                due = self._heap[0][0]
+                now = time.monotonic()
+                if due > now:
+                    self._cond.wait(due - now)
+                    continue
+
+                _, _, item = heapq.heappop(self._heap)
+                if not item.throttled:
+                    self._parked[item.host] -= 1
+                    if self._parked[item.host] <= 0:
+                        del self._parked[item.host]
+                self._executor.submit(self._run, item)
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Get the number of parked work items per host.
+
+        Returns:
+            Dictionary mapping host to the number of items awaiting retry.
+            Items only waiting for their rate limit slot are not counted.
+        """
+        with self._cond:
+            return dict(self._parked)
+
+    def close(self) -> None:
+        """Stop the scheduler and fail any parked work items."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            parked = [item for _, _, item in self._heap]
+            self._heap.clear()
+            self._parked.clear()
+            self._cond.notify_all()
+
+        for item in parked:
+            item.future.set_exception(RuntimeError(f"Retry scheduler '{self.name}' is closed"))
+
+        self._executor.shutdown(wait=False)
+        logger.debug("Closed retry scheduler '%s'", self.name)
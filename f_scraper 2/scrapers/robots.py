@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+robots.txt Cache
+
+This module fetches, parses and caches robots.txt files (RFC 9309). Each
+origin's file is downloaded once per TTL and compiled into a matcher for our
+user agent, so checking a URL is a handful of prefix or regex tests. The cache
+can be persisted to a JSON file to survive restarts.
+
+Status handling follows RFC 9309: a 4xx response means there are no rules, a
+5xx response or a network error means the whole site is disallowed until the
+next attempt (a previously fetched copy is kept in that case).
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from scrapers.base_scraper import ScraperException
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Only the first 500 KiB of a robots.txt file have to be parsed (RFC 9309)
+MAX_ROBOTS_SIZE = 500 * 1024
+
+ALLOW_ALL = 'allow_all'
+DISALLOW_ALL = 'disallow_all'
+
+
+class RobotsDisallowedError(ScraperException):
+    """Raised when robots.txt disallows fetching a URL."""
+
+    # The rules won't change between retries
+    retryable = False
+
+
+class _Rule:
+    """A single Allow/Disallow line compiled for matching."""
+
+    __slots__ = ('allow', 'length', 'prefix', 'regex')
+
+    def __init__(self, allow: bool, pattern: str):
+        self.allow = allow
+        self.length = len(pattern)
+        if '*' in pattern or pattern.endswith('$'):
+            anchored = pattern.endswith('$')
+            body = pattern[:-1] if anchored else pattern
+            self.prefix = None
+            self.regex = re.compile('.*'.join(re.escape(part) for part in body.split('*')) + ('$' if anchored else ''))
+        else:
+            self.prefix = pattern
+            self.regex = None
+
+    def matches(self, path: str) -> bool:
+        if self.prefix is not None:
+            return path.startswith(self.prefix)
+        return self.regex.match(path) is not None
+
+
+class RobotsRules:
+    """The rules of one robots.txt file that apply to our user agent."""
+
+    def __init__(self, rules: List[Tuple[bool, str]] = None, crawl_delay: Optional[float] = None,
+                 status: str = 'ok'):
+        """Initialize the rules.
+
+        Args:
+            rules: (allow, path pattern) pairs.
+            crawl_delay: Crawl-delay in seconds, if the file sets one.
+            status: 'ok' for a parsed file, ALLOW_ALL or DISALLOW_ALL.
+        """
+        self.status = status
+        self.crawl_delay = crawl_delay
+        # Longest pattern wins; on a tie Allow wins (RFC 9309, section 2.2.2)
+        self._rules = sorted((_Rule(allow, pattern) for allow, pattern in rules or []),
+                             key=lambda rule: (-rule.length, not rule.allow))
+
+    @classmethod
+    def parse(cls, text: str, user_agent: str = '*') -> 'RobotsRules':
+        """Parse a robots.txt file.
+
+        Groups naming our product token are combined; if there are none, the
+        ``*`` groups apply.
+
+        Args:
+            text: Contents of the robots.txt file.
+            user_agent: Product token to match, e.g. 'festivalbot'.
+
+        Returns:
+            Rules for the user agent.
+        """
+        token = user_agent.lower()
+        groups: List[Tuple[List[str], List[Tuple[bool, str]], List[float]]] = []
+        agents: List[str] = []
+        in_rules = False
+
+        for line in text[:MAX_ROBOTS_SIZE].splitlines():
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            key, value = (part.strip() for part in line.split(':', 1))
+            key = key.lower()
+
+            if key == 'user-agent':
+                # A user-agent line after rules starts a new group
+                if in_rules or not groups:
+                    agents = []
+                    groups.append((agents, [], []))
+                    in_rules = False
+                agents.append(value.lower())
+            elif key in ('allow', 'disallow') and groups:
+                in_rules = True
+                if value:
+                    groups[-1][1].append((key == 'allow', value))
+            elif key == 'crawl-delay' and groups:
+                in_rules = True
+                try:
+                    groups[-1][2].append(float(value))
+                except ValueError:
+                    pass
+
+        matched = [group for group in groups if token != '*' and token in group[0]]
+        if not matched:
+            matched = [group for group in groups if '*' in group[0]]
+
+        rules = [rule for group in matched for rule in group[1]]
+        delays = [delay for group in matched for delay in group[2]]
+        return cls(rules, crawl_delay=max(delays) if delays else None)
+
+    def allowed(self, path: str) -> bool:
+        """Check whether a path (with query string) may be fetched.
+
+        Args:
+            path: URL path, e.g. '/festivals?page=2'.
+
+        Returns:
+            True if the path is allowed.
+        """
+        if self.status != 'ok':
+            return self.status == ALLOW_ALL
+        if path == '/robots.txt':
+            return True
+        for rule in self._rules:
+            if rule.matches(path):
+                return rule.allow
+        return True
+
+
+class _Entry:
+    """Cached robots.txt of one origin."""
+
+    __slots__ = ('rules', 'body', 'status', 'expires')
+
+    def __init__(self, rules: RobotsRules, body: Optional[str], status: str, expires: float):
+        self.rules = rules
+        self.body = body
+        self.status = status
+        self.expires = expires
+
+
+class RobotsCache:
+    """Per-origin cache of robots.txt rules, safe to share between threads."""
+
+    def __init__(self, user_agent: str = '*', ttl: float = 86400, error_ttl: float = 300,
+                 path: Optional[str] = None, timeout: float = 10, verify_ssl: Any = True):
+        """Initialize the robots.txt cache.
+
+        Args:
+            user_agent: Product token whose rules apply to us.
+            ttl: Time in seconds to keep a fetched file (RFC 9309 caps it at a day).
+            error_ttl: Time in seconds before retrying a site whose robots.txt
+                could not be fetched.
+            path: Optional JSON file the cache is loaded from and saved to.
+            timeout: Timeout in seconds for robots.txt requests.
+            verify_ssl: Passed to requests as ``verify``.
+        """
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.path = path
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._origin_locks: Dict[str, threading.Lock] = {}
+        self._stats = {'fetches': 0, 'hits': 0, 'disallowed': 0}
+        if path:
+            self._load()
+
+    @classmethod
+    def origin(cls, url: str) -> str:
+        """Get the origin (scheme and host) whose robots.txt governs a URL."""
+        return cls._split(url)[0]
+
+    @staticmethod
+    def _split(url: str) -> Tuple[str, str]:
+        """Get the origin and path (with query string) of a URL."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        return origin, path
+
+    def _origin_lock(self, origin: str) -> threading.Lock:
+        with self._lock:
+            return self._origin_locks.setdefault(origin, threading.Lock())
+
+    def is_cached(self, url: str) -> bool:
+        """Check whether fresh rules for the URL's origin are cached.
+
+        Args:
+            url: Any URL on the origin.
+
+        Returns:
+            True if ``rules_for`` won't need to fetch robots.txt.
+        """
+        entry = self._entries.get(self._split(url)[0])
+        return entry is not None and entry.expires > time.time()
+
+    def rules_for(self, url: str) -> RobotsRules:
+        """Get the rules for a URL's origin, fetching robots.txt if needed.
+
+        Concurrent callers for the same origin share one download.
+
+        Args:
+            url: Any URL on the origin.
+
+        Returns:
+            Rules of the origin.
+        """
+        origin = self._split(url)[0]
+        with self._lock:
+            entry = self._entries.get(origin)
+            if entry is not None and entry.expires > time.time():
+                self._stats['hits'] += 1
+                return entry.rules
+
+        with self._origin_lock(origin):
+            entry = self._entries.get(origin)
+            if entry is None or entry.expires <= time.time():
+                entry = self._fetch(origin, entry)
+                with self._lock:
+                    self._entries[origin] = entry
+                if self.path:
+                    self._save()
+            return entry.rules
+
+    def _fetch(self, origin: str, previous: Optional[_Entry]) -> _Entry:
+        """Download and parse the robots.txt of an origin."""
+        # Imported here so importing the scrapers package stays cheap
+        import requests
+
+        with self._lock:
+            self._stats['fetches'] += 1
+        robots_url = origin + '/robots.txt'
+        try:
+            response = requests.get(robots_url, timeout=self.timeout, verify=self.verify_ssl,
+                                    headers={'User-Agent': self.user_agent})
+            status_code = response.status_code
+            body = response.text[:MAX_ROBOTS_SIZE] if 200 <= status_code < 300 else None
+        except requests.RequestException as e:
+            logger.warning("Could not fetch %s: %s", robots_url, e)
+            status_code, body = None, None
+
+        if body is not None:
+            logger.debug("Fetched %s", robots_url)
+            return self._entry(body, 'ok', time.time() + self.ttl)
+        if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+            # No usable robots.txt: no restrictions
+            return self._entry(None, ALLOW_ALL, time.time() + self.ttl)
+
+        # Unreachable: keep the last good copy if we have one, else disallow everything
+        if previous is not None and previous.status == 'ok':
+            logger.info("Keeping the cached %s after a failed refresh", robots_url)
+            return self._entry(previous.body, 'ok', time.time() + self.error_ttl)
+        logger.warning("Treating %s as fully disallowed (robots.txt status %s)", origin, status_code)
+        return self._entry(None, DISALLOW_ALL, time.time() + self.error_ttl)
+
+    def _entry(self, body: Optional[str], status: str, expires: float) -> _Entry:
+        rules = RobotsRules.parse(body, self.user_agent) if status == 'ok' else RobotsRules(status=status)
+        return _Entry(rules, body, status, expires)
+
+    def can_fetch(self, url: str) -> bool:
+        """Check whether robots.txt allows fetching a URL.
+
+        Args:
+            url: URL to check.
+
+        Returns:
+            True if the URL may be fetched.
+        """
+        allowed = self.rules_for(url).allowed(self._split(url)[1])
+        if not allowed:
+            with self._lock:
+                self._stats['disallowed'] += 1
+        return allowed
+
+    def check(self, url: str, rate_limiter: Any = None) -> None:
+        """Make sure a URL may be fetched and apply its origin's Crawl-delay.
+
+        Args:
+            url: URL about to be fetched.
+            rate_limiter: Optional RateLimiter whose rate for the host is
+                capped to one request per Crawl-delay.
+
+        Raises:
+            RobotsDisallowedError: If robots.txt disallows the URL.
+        """
+        rules = self.rules_for(url)
+        if not rules.allowed(self._split(url)[1]):
+            with self._lock:
+                self._stats['disallowed'] += 1
+            raise RobotsDisallowedError(f"robots.txt disallows {url}")
+        if rules.crawl_delay and rate_limiter is not None:
+            rate_limiter.cap_host_rate(urlsplit(url).hostname or '', 1.0 / rules.crawl_delay)
+
+    def crawl_delay(self, url: str) -> Optional[float]:
+        """Get the Crawl-delay of a URL's origin.
+
+        Args:
+            url: Any URL on the origin.
+
+        Returns:
+            Delay in seconds, or None if robots.txt doesn't set one.
+        """
+        return self.rules_for(url).crawl_delay
+
+    def filter(self, urls: Iterable[str]) -> Iterator[str]:
+        """Drop the URLs robots.txt disallows.
+
+        Args:
+            urls: URLs to check.
+
+        Yields:
+            URLs that may be fetched, in their original order.
+        """
+        for url in urls:
+            if self.can_fetch(url):
+                yield url
+            else:
+                logger.info("Skipping %s (disallowed by robots.txt)", url)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with fetch, hit and disallowed counts and the number
+            of cached origins.
+        """
+        with self._lock:
+            return {**self._stats, 'origins': len(self._entries)}
+
+    def _load(self) -> None:
+        """Load cached files from ``self.path``, skipping expired ones."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Could not load the robots.txt cache from %s: %s", self.path, e)
+            return
+
+        now = time.time()
+        for origin, item in data.items():
+            if item.get('expires', 0) > now:
+                self._entries[origin] = self._entry(item.get('body'), item['status'], item['expires'])
+        logger.info("Loaded %s cached robots.txt files from %s", len(self._entries), self.path)
+
+    def _save(self) -> None:
+        """Write the cache to ``self.path`` atomically."""
+        with self._lock:
+            data = {origin: {'status': entry.status, 'body': entry.body, 'expires': entry.expires}
+                    for origin, entry in self._entries.items()}
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning("Could not save the robots.txt cache to %s: %s", self.path, e)
+
+
+def create_from_config(setting: Any) -> Optional[RobotsCache]:
+    """Build a robots.txt cache as requested by a ``respect_robots`` config value.
+
+    Args:
+        setting: False/None to ignore robots.txt, True for the default
+            options, or a dict of RobotsCache options.
+
+    Returns:
+        The robots.txt cache, or None if the setting is off.
+    """
+    if not setting:
+        return None
+    return RobotsCache(**(setting if isinstance(setting, dict) else {}))
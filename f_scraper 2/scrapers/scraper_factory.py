@@ -6,32 +6,30 @@ This module implements a factory for creating and managing different scraper eng
 """
 
 import logging
-import random
+import threading
 import time
-from typing import Dict, Any, Optional, List, Union, Type
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple, Union, Type
 import os
 import json
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
-
+from scrapers import dns_cache
 from scrapers.base_scraper import BaseScraper, ScraperException
-from scrapers.requests_scraper import RequestsScraper
-from scrapers.cloudscraper_engine import CloudScraperEngine
-from scrapers.playwright_scraper import PlaywrightScraper
+from scrapers.html_parser import parse_html, resolve_backend
+from scrapers.latency import DEFAULT_MAX_HOSTS, LatencyStats
 from scrapers.proxy_manager import ProxyManager
+from scrapers.rate_limiter import DEFAULT_SETTING as DEFAULT_RATE_LIMIT, create_from_config as create_rate_limiter
+from scrapers.registry import registry
+from scrapers.robots import RobotsDisallowedError, create_from_config as create_robots_cache
+from scrapers.single_flight import SingleFlight
+from scrapers.stats import ShardedStats
+from scrapers.url_utils import get_host, normalize_url
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("scraper.log"),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
 
+# Configure logging (handlers are set up by the application, see logging_setup)
+logger = logging.getLogger(__name__)
 
 class ScraperFactory:
     """Factory for creating and managing different scraper engines."""
@@ -51,14 +49,46 @@ class ScraperFactory:
         self.retry_delay = self.config.get('retry_delay', 2)
         self.success_threshold = self.config.get('success_threshold', 0.7)  # 70% success rate
         
+        # Defaults for get_pages
+        self.batch_workers = self.config.get('batch_workers', 8)
+        self.per_host_limit = self.config.get('per_host_limit', 2)
+        
+        # HTML parser backend for extract_data and its parse time histograms
+        self.parser = self.config.get('parser', 'auto')
+        self._parser_backend = None
+        self._parse_stats = ShardedStats()
+        
+        # Optional process-wide DNS cache, shared by all engines and the proxy manager
+        dns_cache.install_from_config(self.config.get('dns_cache'))
+        
+        # Per-host rate limiter shared by all engines, so falling back to
+        # another engine doesn't reset a host's budget
+        self.rate_limiter = create_rate_limiter(self.config.get('rate_limit', DEFAULT_RATE_LIMIT))
+        
+        # Shared robots.txt cache, off unless 'respect_robots' is set
+        self.robots = create_robots_cache(self.config.get('respect_robots'))
+        
+        # Concurrent get_page calls for the same URL share one fetch. Keeping
+        # the page for later calls is opt-in through 'coalesce_ttl' (seconds),
+        # so a repeated get_page fetches afresh by default
+        self._single_flight = SingleFlight(ttl=self.config.get('coalesce_ttl', 0.0)) if self.config.get('coalesce', True) else None
+        
+        # Engines are built on first use; one lock per engine so a slow build
+        # (e.g. launching a browser) doesn't block the others
+        self._engine_locks: Dict[str, threading.Lock] = {}
+        self._engine_locks_guard = threading.Lock()
+        self._warmup_threads: List[threading.Thread] = []
+        
         # Initialize proxy manager if enabled
         if self.config.get('use_proxies', True):
             self._initialize_proxy_manager()
         
-        # Initialize scrapers
-        self._initialize_scrapers()
+        # Optionally build some engines ahead of time in the background
+        warmup = self.config.get('warmup', [])
+        if warmup:
+            self.warm_up(warmup)
         
-        logger.info(f"Initialized scraper factory with default engine: {self.default_engine}")
+        logger.info("Initialized scraper factory with default engine: %s", self.default_engine)
 
     def _initialize_proxy_manager(self) -> None:
         """Initialize the proxy manager."""
@@ -67,33 +97,64 @@ class ScraperFactory:
             self.proxy_manager = ProxyManager(proxy_config)
             logger.info("Initialized proxy manager")
         except Exception as e:
-            logger.error(f"Error initializing proxy manager: {e}")
+            logger.error("Error initializing proxy manager: %s", e)
             self.proxy_manager = None
 
-    def _initialize_scrapers(self) -> None:
-        """Initialize all scraper engines."""
-        try:
-            # Initialize Requests scraper
-            if 'requests' in self.fallback_order:
-                requests_config = self.config.get('requests_config', {})
-                self.scrapers['requests'] = RequestsScraper(requests_config, self.proxy_manager)
-                logger.info("Initialized Requests scraper")
-            
-            # Initialize CloudScraper engine
-            if 'cloudscraper' in self.fallback_order:
-                cloudscraper_config = self.config.get('cloudscraper_config', {})
-                self.scrapers['cloudscraper'] = CloudScraperEngine(cloudscraper_config)
-                logger.info("Initialized CloudScraper engine")
-            
-            # Initialize Playwright scraper
-            if 'playwright' in self.fallback_order:
-                playwright_config = self.config.get('playwright_config', {})
-                self.scrapers['playwright'] = PlaywrightScraper(playwright_config)
-                logger.info("Initialized Playwright scraper")
-            
-        except Exception as e:
-            logger.error(f"Error initializing scrapers: {e}")
-            raise
+    def _engine_lock(self, engine: str) -> threading.Lock:
+        """Get the lock guarding the construction of an engine."""
+        with self._engine_locks_guard:
+            return self._engine_locks.setdefault(engine, threading.Lock())
+
+    def _get_engine(self, engine: str) -> BaseScraper:
+        """Get an engine, building it on first use.
+
+        Args:
+            engine: Name of the scraper engine.
+
+        Returns:
+            Scraper engine.
+        """
+        scraper = self.scrapers.get(engine)
+        if scraper is not None:
+            return scraper
+
+        with self._engine_lock(engine):
+            scraper = self.scrapers.get(engine)
+            if scraper is None:
+                engine_config = self.config.get(f'{engine}_config', {})
+                start_time = time.time()
+                scraper = registry.create(engine, engine_config, self.proxy_manager)
+                if 'rate_limit' not in engine_config:
+                    scraper.rate_limiter = self.rate_limiter
+                if 'respect_robots' not in engine_config:
+                    scraper.robots = self.robots
+                self.scrapers[engine] = scraper
+                logger.info("Initialized %s engine in %.2fs", engine, time.time() - start_time)
+        return scraper
+
+    def warm_up(self, engines: List[str] = None, background: bool = True) -> None:
+        """Build engines ahead of their first use.
+
+        Args:
+            engines: Names of the engines to build. Defaults to the fallback order.
+            background: Build in a background thread instead of blocking.
+        """
+        engines = engines or self.fallback_order
+
+        def _warm_up() -> None:
+            for engine in engines:
+                try:
+                    self._get_engine(engine)
+                except Exception as e:
+                    logger.warning("Error warming up %s engine: %s", engine, e)
+
+        if not background:
+            _warm_up()
+            return
+
+        thread = threading.Thread(target=_warm_up, name='scraper-warmup', daemon=True)
+        self._warmup_threads.append(thread)
+        thread.start()
 
     def get_scraper(self, engine: str = None) -> BaseScraper:
         """Get a scraper engine.
@@ -109,10 +170,15 @@ class ScraperFactory:
         """
         engine = engine or self.default_engine
         
-        if engine not in self.scrapers:
+        if engine not in self.scrapers and engine not in registry.names():
             raise ScraperException(f"Scraper engine '{engine}' not available")
         
-        return self.scrapers[engine]
+        try:
+            return self._get_engine(engine)
+        except ScraperException:
+            raise
+        except Exception as e:
+            raise ScraperException(f"Scraper engine '{engine}' failed to initialize: {e}") from e
 
     def get_best_scraper(self) -> BaseScraper:
         """Get the best performing scraper based on success rate.
@@ -123,7 +189,8 @@ class ScraperFactory:
         best_scraper = None
         best_success_rate = -1
         
-        for name, scraper in self.scrapers.items():
+        # Only engines that have been built have a track record
+        for name, scraper in list(self.scrapers.items()):
             success_rate = scraper.success_rate
             
             if success_rate > best_success_rate:
@@ -139,6 +206,11 @@ class ScraperFactory:
     def get_page(self, url: str, **kwargs) -> str:
         """Get page content using the best scraper with fallback.
 
+        Concurrent calls for the same URL (after normalization) and arguments
+        share one fetch; set ``coalesce`` to False to turn this off. Setting
+        ``coalesce_ttl`` also serves later calls the page for that many
+        seconds instead of fetching it again.
+
         Args:
             url: URL to fetch.
             **kwargs: Additional keyword arguments.
@@ -147,8 +219,39 @@ class ScraperFactory:
             Page content as HTML string.
 
         Raises:
-            ScraperException: If all scrapers fail.
+            RobotsDisallowedError: If robots.txt disallows the URL.
+            ScraperException: If all scrapers fail, or the first error that
+                is not retryable, which no other engine is tried for.
         """
+        key = self._coalesce_key(url, kwargs)
+        if key is None:
+            return self._get_page(url, **kwargs)
+        return self._single_flight.do(key, lambda: self._get_page(url, **kwargs))
+
+    def _coalesce_key(self, url: str, kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """Get the key under which a get_page call may be shared, if any.
+
+        Only GET requests without a body are shared.
+
+        Args:
+            url: URL to fetch.
+            kwargs: Keyword arguments of the call.
+
+        Returns:
+            Hashable key, or None if the call must not be shared.
+        """
+        if self._single_flight is None:
+            return None
+        if kwargs.get('method', 'GET').upper() != 'GET' or kwargs.get('data') or kwargs.get('json'):
+            return None
+        return (normalize_url(url),) + tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
+
+    def _get_page(self, url: str, **kwargs) -> str:
+        """Fetch a page, trying the engines in order until one succeeds."""
+        # No engine may fetch a disallowed URL, so don't try them one by one
+        if self.robots:
+            self.robots.check(url, self.rate_limiter)
+        
         # Get the preferred engine from kwargs or use the best scraper
         preferred_engine = kwargs.pop('engine', None)
         
@@ -157,7 +260,7 @@ class ScraperFactory:
         else:
             # Start with the best scraper and then try others in fallback order
             best_scraper = self.get_best_scraper()
-            for name, scraper in self.scrapers.items():
+            for name, scraper in list(self.scrapers.items()):
                 if scraper == best_scraper:
                     scrapers_to_try = [name] + [e for e in self.fallback_order if e != name]
                     break
@@ -168,28 +271,32 @@ class ScraperFactory:
         last_exception = None
         
         for engine_name in scrapers_to_try:
-            if engine_name not in self.scrapers:
+            try:
+                scraper = self.get_scraper(engine_name)
+            except ScraperException as e:
+                logger.warning("Skipping %s engine: %s", engine_name, e)
+                last_exception = e
                 continue
-                
-            scraper = self.scrapers[engine_name]
             
             try:
-                logger.info(f"Trying to fetch {url} with {engine_name} engine")
+                logger.debug("Trying to fetch %s with %s engine", url, engine_name)
                 content = scraper.get_page(url, **kwargs)
                 
                 # Check if the content is valid
                 if content and len(content) > 100:  # Arbitrary minimum length
-                    logger.info(f"Successfully fetched {url} with {engine_name} engine")
+                    logger.debug("Successfully fetched %s with %s engine", url, engine_name)
                     return content
                 else:
-                    logger.warning(f"Empty or very short content from {engine_name} engine")
+                    logger.warning("Empty or very short content from %s engine", engine_name)
                     
             except Exception as e:
-                logger.warning(f"Error fetching {url} with {engine_name} engine: {e}")
+                # A definitive answer (404, robots.txt, an over-long Retry-After)
+                # would be the same from every engine
+                if not getattr(e, 'retryable', True):
+                    logger.warning("Not retrying %s with other engines: %s", url, e)
+                    raise
+                logger.warning("Error fetching %s with %s engine: %s", url, engine_name, e)
                 last_exception = e
-                
-                # Wait before trying the next engine
-                time.sleep(random.uniform(1, 3))
         
         # If we get here, all scrapers failed
         error_msg = f"All scrapers failed to fetch {url}"
@@ -199,33 +306,138 @@ class ScraperFactory:
         logger.error(error_msg)
         raise ScraperException(error_msg)
 
-    def extract_data(self, html: str) -> BeautifulSoup:
-        """Extract data from HTML using BeautifulSoup.
+    def get_pages(self, urls: Iterable[str], max_workers: int = None, per_host_limit: int = None,
+                  **kwargs) -> Iterator[Tuple[str, Union[str, Exception]]]:
+        """Fetch many pages concurrently, limiting the requests in flight per host.
+
+        Each URL goes through get_page, so engine fallback works as usual. A URL
+        is only handed to a worker while its host is below ``per_host_limit``;
+        URLs for other hosts go ahead in the meantime. When robots.txt is
+        respected, disallowed URLs are reported up front and never queued.
+
+        Args:
+            urls: URLs to fetch.
+            max_workers: Maximum number of pages fetched at once. Defaults to
+                the ``batch_workers`` config (8).
+            per_host_limit: Maximum number of pages fetched at once from one
+                host. Defaults to the ``per_host_limit`` config (2).
+            **kwargs: Additional keyword arguments for get_page.
+
+        Yields:
+            (url, result) tuples in completion order, where result is the page
+            content or the exception fetching it raised.
+        """
+        max_workers = max_workers or self.batch_workers
+        per_host_limit = per_host_limit or self.per_host_limit
+
+        urls = list(urls)
+        if not urls:
+            return
+        self.prefetch_dns(urls)
+
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(urls)), thread_name_prefix='get-pages')
+        running: Dict[Future, Tuple[str, str]] = {}
+        try:
+            if self.robots:
+                # Fetch each origin's robots.txt in parallel, then drop disallowed URLs
+                origins = {self.robots.origin(url): url for url in urls}
+                list(executor.map(self.robots.rules_for, origins.values()))
+                allowed = []
+                for url in urls:
+                    if self.robots.can_fetch(url):
+                        allowed.append(url)
+                    else:
+                        yield url, RobotsDisallowedError(f"robots.txt disallows {url}")
+                urls = allowed
+
+            # Queued URLs and in-flight counts by host, in order of first appearance
+            queued: 'OrderedDict[str, deque]' = OrderedDict()
+            for url in urls:
+                queued.setdefault(get_host(url), deque()).append(url)
+            active: Dict[str, int] = {host: 0 for host in queued}
+
+            while queued or running:
+                # Take URLs round-robin over the hosts with spare capacity
+                dispatched = True
+                while dispatched and len(running) < max_workers:
+                    dispatched = False
+                    for host in list(queued):
+                        if len(running) >= max_workers:
+                            break
+                        if active[host] >= per_host_limit:
+                            continue
+                        url = queued[host].popleft()
+                        if not queued[host]:
+                            del queued[host]
+                        active[host] += 1
+                        running[executor.submit(self.get_page, url, **kwargs)] = (url, host)
+                        dispatched = True
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, host = running.pop(future)
+                    active[host] -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = e
+                    yield url, result
+        finally:
+            # Stop handing out URLs if the caller stops iterating early
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def prefetch_dns(self, urls: List[str]) -> None:
+        """Resolve the hosts of queued URLs in the background.
+
+        Does nothing unless the DNS cache is enabled (``dns_cache`` config).
+
+        Args:
+            urls: URLs about to be fetched.
+        """
+        cache = dns_cache.get_dns_cache()
+        if cache:
+            cache.prefetch(get_host(url) for url in urls)
+
+    def extract_data(self, html: str) -> Any:
+        """Extract data from HTML using the configured parser backend.
 
         Args:
             html: HTML content to parse.
 
         Returns:
-            BeautifulSoup object.
+            Parsed document; a BeautifulSoup object unless the selectolax
+            backend is configured.
         """
-        return BeautifulSoup(html, 'html.parser')
+        if self._parser_backend is None:
+            self._parser_backend = resolve_backend(self.parser)
+        start_time = time.perf_counter()
+        document = parse_html(html, self._parser_backend)
+        self._parse_stats.record_parse(self._parser_backend, time.perf_counter() - start_time)
+        return document
 
     def close(self) -> None:
         """Close all scrapers and clean up resources."""
         try:
-            for name, scraper in self.scrapers.items():
+            # Let in-progress warm-ups finish so their engines get closed too
+            for thread in self._warmup_threads:
+                thread.join()
+            self._warmup_threads = []
+            
+            for name, scraper in list(self.scrapers.items()):
                 try:
                     scraper.close()
-                    logger.info(f"Closed {name} scraper")
+                    logger.info("Closed %s scraper", name)
                 except Exception as e:
-                    logger.error(f"Error closing {name} scraper: {e}")
+                    logger.error("Error closing %s scraper: %s", name, e)
             
             if self.proxy_manager:
                 self.proxy_manager.close()
                 
             logger.info("Closed scraper factory")
         except Exception as e:
-            logger.error(f"Error closing scraper factory: {e}")
+            logger.error("Error closing scraper factory: %s", e)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about all scrapers.
@@ -234,13 +446,32 @@ class ScraperFactory:
             Dictionary with scraper statistics.
         """
         stats = {}
+        latency = LatencyStats(self.config.get('latency_hosts', DEFAULT_MAX_HOSTS))
         
-        for name, scraper in self.scrapers.items():
+        for name, scraper in list(self.scrapers.items()):
             stats[name] = scraper.get_stats()
+            latency.merge(scraper.latency)
+        
+        # Latency across all engines
+        stats['latency'] = latency.snapshot()
+        stats['parse'] = {backend: histogram.snapshot()
+                          for backend, histogram in self._parse_stats.parse_latency().items()}
+        
+        if self.rate_limiter:
+            stats['rate_limiter'] = self.rate_limiter.get_stats()
+        
+        if self.robots:
+            stats['robots'] = self.robots.get_stats()
+        
+        if self._single_flight:
+            stats['coalescing'] = self._single_flight.get_stats()
         
         if self.proxy_manager:
             stats['proxy_manager'] = self.proxy_manager.get_stats()
         
+        if dns_cache.get_dns_cache():
+            stats['dns_cache'] = dns_cache.get_dns_cache().get_stats()
+        
         return stats
 
     def __del__(self):
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Single-Flight Coalescing
+
+This module lets concurrent callers asking for the same thing share one
+in-flight call: the first caller runs it, the others wait for its result.
+Successful results can also be kept for a short time, so callers arriving
+just after the call finished don't repeat it. Failures are shared with the
+callers that were waiting but never kept.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """An in-flight call and, once it finishes, its outcome."""
+
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls by key, with an optional short-lived result memo."""
+
+    def __init__(self, ttl: float = 0.0, max_entries: int = 1024):
+        """Initialize the coalescer.
+
+        Args:
+            ttl: Time in seconds to keep a successful result; 0 only shares
+                calls that are in flight.
+            max_entries: Maximum number of results kept.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._calls: Dict[Hashable, _Call] = {}
+        self._memo: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'coalesced': 0, 'memo_hits': 0}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Run ``func`` unless a call for ``key`` is in flight or memoized.
+
+        Args:
+            key: Identifies calls that produce the same result.
+            func: Callable producing the result.
+
+        Returns:
+            The result of ``func``, possibly from another caller's call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        with self._lock:
+            memo = self._memo.get(key)
+            if memo is not None:
+                if memo[0] > time.monotonic():
+                    self._stats['memo_hits'] += 1
+                    return memo[1]
+                del self._memo[key]
+
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._stats['coalesced'] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._stats['calls'] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None and self.ttl > 0:
+                    self._memo[key] = (time.monotonic() + self.ttl, call.result)
+                    self._memo.move_to_end(key)
+                    while len(self._memo) > self.max_entries:
+                        self._memo.popitem(last=False)
+            if call.waiters:
+                logger.debug("Shared the result for %s with %s waiting callers", key, call.waiters)
+            call.done.set()
+        return call.result
+
+    def forget(self, key: Hashable) -> None:
+        """Drop the memoized result for a key.
+
+        Args:
+            key: Key to forget.
+        """
+        with self._lock:
+            self._memo.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all memoized results."""
+        with self._lock:
+            self._memo.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            Dictionary with the number of calls made, calls that joined one in
+            flight, and memo hits.
+        """
+        with self._lock:
+            return {**self._stats, 'in_flight': len(self._calls), 'memoized': len(self._memo)}
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Debug Snapshots
+
+This module keeps copies of fetched pages for debugging without slowing the
+fetches down. Only a sample of pages is kept (one in every N, and/or every
+failed page), and the files are compressed and written by a background
+thread, so the fetch path only pays for handing the content to a queue.
+When the writer falls behind, snapshots are dropped rather than queued
+without bound.
+"""
+
+import gzip
+import itertools
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from scrapers.url_utils import get_host
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+_UNSAFE_CHARS = re.compile(r'[^A-Za-z0-9._-]+')
+
+
+class SnapshotSink:
+    """Sampled, compressed page snapshots written by a background thread."""
+
+    def __init__(self, directory: str = 'debug_snapshots', every: int = 0, failures: bool = True,
+                 compress: bool = True, max_pending: int = 100):
+        """Initialize the snapshot sink.
+
+        Args:
+            directory: Directory the snapshots are written to.
+            every: Keep one in every ``every`` successful pages; 0 keeps none.
+            failures: Whether to keep the page of every failed fetch.
+            compress: Whether to gzip the files.
+            max_pending: Maximum number of snapshots waiting to be written;
+                further snapshots are dropped.
+        """
+        self.directory = directory
+        self.every = every
+        self.failures = failures
+        self.compress = compress
+        self._queue: 'queue.Queue[Optional[tuple]]' = queue.Queue(maxsize=max_pending)
+        self._seq = itertools.count(1)
+        self._pages = itertools.count(1)
+        self._lock = threading.Lock()
+        self._stats = {'written': 0, 'dropped': 0, 'errors': 0}
+        self._writer = None
+        self._closed = False
+
+    def sample(self, failed: bool = False) -> bool:
+        """Decide whether to keep a snapshot of a page.
+
+        Call once per page, so one-in-N sampling counts every page.
+
+        Args:
+            failed: Whether the fetch of the page failed.
+
+        Returns:
+            True if the page should be passed to ``write``.
+        """
+        if self._closed:
+            return False
+        if failed:
+            return self.failures
+        return bool(self.every) and next(self._pages) % self.every == 0
+
+    def write(self, url: str, content: str, failed: bool = False) -> bool:
+        """Queue a snapshot to be written in the background.
+
+        Args:
+            url: URL of the page.
+            content: Page content.
+            failed: Whether the fetch of the page failed.
+
+        Returns:
+            True if the snapshot was queued, False if it was dropped.
+        """
+        if self._closed:
+            return False
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((url, content, failed, time.time()))
+            return True
+        except queue.Full:
+            with self._lock:
+                self._stats['dropped'] += 1
+            logger.debug("Snapshot writer is behind, dropping snapshot of %s", url)
+            return False
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._lock:
+            if self._writer is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._writer = threading.Thread(target=self._run, name='snapshot-writer', daemon=True)
+                self._writer.start()
+
+    def _run(self) -> None:
+        """Write queued snapshots until ``close`` is called."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            try:
+                path = self._write_file(*item)
+                with self._lock:
+                    self._stats['written'] += 1
+                logger.debug("Wrote snapshot %s", path)
+            except Exception as e:
+                with self._lock:
+                    self._stats['errors'] += 1
+                logger.warning("Error writing snapshot of %s: %s", item[0], e)
+
+    def _write_file(self, url: str, content: str, failed: bool, timestamp: float) -> str:
+        """Write one snapshot to a uniquely named file.
+
+        Returns:
+            Path of the file.
+        """
+        host = _UNSAFE_CHARS.sub('_', get_host(url)) or 'page'
+        name = (f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(timestamp))}-{os.getpid()}"
+                f"-{next(self._seq):06d}-{host}{'-failed' if failed else ''}.html")
+        path = os.path.join(self.directory, name + ('.gz' if self.compress else ''))
+        data = f"<!-- {url} -->\n{content}".encode('utf-8', errors='replace')
+
+        # Write to a temporary name so readers never see a partial file
+        tmp_path = path + '.tmp'
+        if self.compress:
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                f.write(data)
+        else:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+        os.replace(tmp_path, path)
+        return path
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Write the pending snapshots and stop the writer.
+
+        Args:
+            timeout: Seconds to wait for the pending snapshots.
+        """
+        self._closed = True
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get snapshot statistics.
+
+        Returns:
+            Dictionary with written, dropped and failed snapshots and the
+            number waiting to be written.
+        """
+        with self._lock:
+            return {**self._stats, 'pending': self._queue.qsize()}
+
+
+def create_from_config(setting: Any) -> Optional[SnapshotSink]:
+    """Build a snapshot sink as requested by a ``debug_snapshots`` config value.
+
+    Args:
+        setting: False/None to keep no snapshots, True to keep failed pages
+            with the default options, or a dict of SnapshotSink options.
+
+    Returns:
+        The snapshot sink, or None if the setting is off.
+    """
+    if not setting:
+        return None
+    return SnapshotSink(**(setting if isinstance(setting, dict) else {}))
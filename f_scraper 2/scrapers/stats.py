@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Scraper Statistics
+
+This module implements request statistics that stay exact when one scraper
+instance is shared across threads. Each thread writes to its own shard, so
+the hot path takes no lock; shards are merged when the stats are read.
+"""
+
+import threading
+from typing import Dict, Any, List, Optional
+
+from scrapers.latency import DEFAULT_MAX_HOSTS, LatencyHistogram, LatencyStats
+
+
+class _StatsShard:
+    """Counters and latency histograms written by a single thread."""
+
+    __slots__ = ('counters', 'latency', 'parse')
+
+    def __init__(self, max_hosts: Optional[int]):
+        self.counters = dict.fromkeys(ShardedStats.COUNTERS, 0)
+        self.latency = LatencyStats(max_hosts)
+        self.parse: Dict[str, LatencyHistogram] = {}
+
+
+class ShardedStats:
+    """Request statistics with one shard per thread, merged on read."""
+
+    COUNTERS = ('attempts', 'requests', 'success', 'failures', 'retries', 'total_time')
+
+    def __init__(self, max_hosts: Optional[int] = DEFAULT_MAX_HOSTS):
+        """Initialize empty statistics.
+
+        Args:
+            max_hosts: Number of hosts with their own latency histograms (see
+                ``LatencyStats``).
+        """
+        self.max_hosts = max_hosts
+        self._local = threading.local()
+        self._shards: List[_StatsShard] = []
+        # Only taken when a thread creates its shard and when shards are read
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _StatsShard:
+        """Get the calling thread's shard, creating it on first use."""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = _StatsShard(self.max_hosts)
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def record_attempt(self, host: str, elapsed: float, success: bool,
+                       ttfb: Optional[float] = None, body: Optional[float] = None) -> None:
+        """Record the outcome of one attempt.
+
+        Args:
+            host: Host the attempt targeted.
+            elapsed: Duration of the attempt in seconds.
+            success: Whether the attempt succeeded.
+            ttfb: Optional time to first byte in seconds.
+            body: Optional body download time in seconds.
+        """
+        shard = self._shard()
+        counters = shard.counters
+        counters['attempts'] += 1
+        if success:
+            counters['requests'] += 1
+            counters['success'] += 1
+            counters['total_time'] += elapsed
+            shard.latency.record(host, total=elapsed, ttfb=ttfb, body=body)
+        else:
+            counters['failures'] += 1
+            counters['retries'] += 1
+
+    def record_timings(self, host: str, ttfb: Optional[float] = None, body: Optional[float] = None) -> None:
+        """Record response phase timings without counting an attempt.
+
+        Args:
+            host: Host the response came from.
+            ttfb: Time to first byte in seconds.
+            body: Body download time in seconds.
+        """
+        self._shard().latency.record(host, ttfb=ttfb, body=body)
+
+    def record_parse(self, backend: str, elapsed: float) -> None:
+        """Record the time taken to parse one page.
+
+        Args:
+            backend: HTML parser backend used.
+            elapsed: Parse time in seconds.
+        """
+        parse = self._shard().parse
+        histogram = parse.get(backend)
+        if histogram is None:
+            histogram = parse.setdefault(backend, LatencyHistogram())
+        histogram.record(elapsed)
+
+    def _all_shards(self) -> List[_StatsShard]:
+        with self._lock:
+            return list(self._shards)
+
+    def counters(self) -> Dict[str, Any]:
+        """Get the counters summed across all threads.
+
+        Returns:
+            Dictionary of counter name to total.
+        """
+        totals = dict.fromkeys(self.COUNTERS, 0)
+        for shard in self._all_shards():
+            for name, value in list(shard.counters.items()):
+                totals[name] += value
+        return totals
+
+    def latency(self) -> LatencyStats:
+        """Get the latency histograms merged across all threads.
+
+        Returns:
+            A new LatencyStats holding every thread's samples.
+        """
+        merged = LatencyStats(self.max_hosts)
+        for shard in self._all_shards():
+            merged.merge(shard.latency)
+        return merged
+
+    def parse_latency(self) -> Dict[str, LatencyHistogram]:
+        """Get the parse time histograms merged across all threads.
+
+        Returns:
+            Dictionary mapping parser backend to a new LatencyHistogram.
+        """
+        merged: Dict[str, LatencyHistogram] = {}
+        for shard in self._all_shards():
+            for backend, histogram in list(shard.parse.items()):
+                merged.setdefault(backend, LatencyHistogram()).merge(histogram)
+        return merged
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Streaming Body Download
+
+This module reads response bodies incrementally instead of buffering them
+through ``response.text``. Chunks are decompressed and decoded as they
+arrive, the download is aborted once it exceeds a size cap, and an optional
+predicate can end it early once the part of the page we need has arrived.
+"""
+
+import codecs
+import logging
+from typing import Callable, Optional
+
+import requests
+
+from scrapers.base_scraper import ScraperException
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Text from earlier chunks shown to stop_when, so markers split across chunks are found
+DEFAULT_STOP_OVERLAP = 1024
+
+
+class BodyTooLargeError(ScraperException):
+    """Raised when a response body exceeds the configured size cap."""
+
+    # Fetching the same page again will not make it smaller
+    retryable = False
+
+
+def read_body(response: requests.Response, max_bytes: Optional[int] = None,
+              stop_when: Optional[Callable[[str], bool]] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE, stop_overlap: int = DEFAULT_STOP_OVERLAP) -> str:
+    """Read and decode a streamed response body.
+
+    The response should have been requested with ``stream=True``; a response
+    whose body was already read is decoded from memory. The response is
+    closed afterwards, so a body cut short does not go back to the pool.
+
+    Args:
+        response: Response to read.
+        max_bytes: Maximum decompressed body size in bytes, or None for no cap.
+        stop_when: Optional predicate called after each chunk with the
+            chunk's decoded text, prefixed by up to ``stop_overlap``
+            characters of the text before it; the download ends once it
+            returns True, e.g. ``lambda text: '</main>' in text``. It never
+            sees the whole body, so each call costs O(chunk) rather than
+            O(body); markers up to ``stop_overlap`` + 1 characters long
+            are found even when split across chunks.
+        chunk_size: Size of the chunks read from the connection.
+        stop_overlap: Number of characters of earlier text passed to
+            ``stop_when`` along with each chunk.
+
+    Returns:
+        Decoded body text, possibly cut short by ``stop_when``.
+
+    Raises:
+        BodyTooLargeError: If the body is larger than ``max_bytes``.
+    """
+    try:
+        declared = response.headers.get('Content-Length')
+        if (max_bytes is not None and declared and declared.isdigit()
+                and not response.headers.get('Content-Encoding') and int(declared) > max_bytes):
+            raise BodyTooLargeError(f"Body of {response.url} is {declared} bytes, limit is {max_bytes}")
+
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        parts = []
+        tail = ''
+        received = 0
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            received += len(chunk)
+            if max_bytes is not None and received > max_bytes:
+                raise BodyTooLargeError(f"Body of {response.url} exceeds {max_bytes} bytes")
+
+            text = decoder.decode(chunk)
+            if stop_when is not None and stop_when(tail + text):
+                logger.debug("Stopped reading %s after %s bytes", response.url, received)
+                parts.append(text)
+                return ''.join(parts)
+            parts.append(text)
+            if stop_when is not None and stop_overlap:
+                tail = (tail + text)[-stop_overlap:]
+
+        parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts)
+    finally:
+        response.close()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+URL Utilities
+
+This module provides small URL helpers shared by the scraper engines.
+"""
+
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+def get_host(url: str) -> str:
+    """Get the lowercased host of a URL.
+
+    Args:
+        url: URL to inspect.
+
+    Returns:
+        Host name without port, or an empty string if the URL has none.
+    """
+    return (urlparse(url).hostname or '').lower()
+
+
+# Query parameters added only to defeat caches; they never identify content
+CACHE_BUSTER_PARAMS = frozenset(['_cb'])
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for use as a cache key.
+
+    Lowercases the scheme and host, drops default ports, fragments and cache
+    buster parameters, and sorts the query string. Userinfo is kept as it is,
+    and IPv6 hosts keep their brackets.
+
+    Args:
+        url: URL to normalize.
+
+    Returns:
+        Normalized URL.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if ':' in host:
+        host = f"[{host}]"
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+    userinfo, at, _ = parts.netloc.rpartition('@')
+    if at:
+        host = f"{userinfo}@{host}"
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if key not in CACHE_BUSTER_PARAMS)
+    return urlunsplit((scheme, host, parts.path or '/', urlencode(query), ''))
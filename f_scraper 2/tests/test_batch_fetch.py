@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test script for batch fetching with per-host concurrency limits.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.base_scraper import BaseScraper, ScraperException
+from scrapers.registry import register_engine
+from scrapers.scraper_factory import ScraperFactory
+from scrapers.url_utils import get_host
+
+logger = logging.getLogger(__name__)
+
+PAGE = "<html>" + "x" * 200 + "</html>"
+
+
+class ConcurrencyTracker:
+    """Records the most requests seen in flight, overall and per host."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = defaultdict(int)
+        self.peak = defaultdict(int)
+        self.total = 0
+        self.peak_total = 0
+
+    def enter(self, host: str) -> None:
+        with self.lock:
+            self.active[host] += 1
+            self.total += 1
+            self.peak[host] = max(self.peak[host], self.active[host])
+            self.peak_total = max(self.peak_total, self.total)
+
+    def leave(self, host: str) -> None:
+        with self.lock:
+            self.active[host] -= 1
+            self.total -= 1
+
+
+TRACKER = ConcurrencyTracker()
+
+
+@register_engine('test_slow')
+class SlowScraper(BaseScraper):
+    """Engine that takes a while per page and fails URLs containing 'fail'."""
+
+    def get_page(self, url: str, **kwargs) -> str:
+        host = get_host(url)
+        TRACKER.enter(host)
+        try:
+            time.sleep(0.05)
+        finally:
+            TRACKER.leave(host)
+        if 'fail' in url:
+            raise ScraperException(f"cannot fetch {url}")
+        return PAGE
+
+    def close(self) -> None:
+        pass
+
+
+@register_engine('test_fallback')
+class FallbackScraper(BaseScraper):
+    """Engine that serves every page."""
+
+    def get_page(self, url: str, **kwargs) -> str:
+        return PAGE + "<!-- fallback -->"
+
+    def close(self) -> None:
+        pass
+
+
+def _factory(fallback_order):
+    return ScraperFactory({
+        'use_proxies': False,
+        'default_engine': fallback_order[0],
+        'fallback_order': fallback_order,
+    })
+
+
+def test_per_host_limit_is_enforced():
+    """No host ever sees more requests at once than per_host_limit."""
+    global TRACKER
+    TRACKER = ConcurrencyTracker()
+    factory = _factory(['test_slow'])
+    urls = [f"https://{host}.example/{i}" for host in ('a', 'b', 'c') for i in range(6)]
+
+    results = dict(factory.get_pages(urls, max_workers=6, per_host_limit=2))
+    factory.close()
+
+    assert sorted(results) == sorted(urls)
+    assert all(result == PAGE for result in results.values())
+    assert max(TRACKER.peak.values()) == 2
+    # The three hosts were fetched side by side
+    assert TRACKER.peak_total == 6
+
+
+def test_max_workers_is_enforced():
+    """The overall number of requests in flight stays within max_workers."""
+    global TRACKER
+    TRACKER = ConcurrencyTracker()
+    factory = _factory(['test_slow'])
+    urls = [f"https://host{i}.example/" for i in range(10)]
+
+    assert len(list(factory.get_pages(urls, max_workers=3, per_host_limit=5))) == 10
+    factory.close()
+    assert TRACKER.peak_total == 3
+
+
+def test_errors_and_fallback_per_url():
+    """Failed URLs fall back to the next engine; exhausted URLs yield the error."""
+    global TRACKER
+    TRACKER = ConcurrencyTracker()
+    factory = _factory(['test_slow', 'test_fallback'])
+    results = dict(factory.get_pages(["https://a.example/ok", "https://a.example/fail"]))
+    assert results["https://a.example/ok"] == PAGE
+    assert results["https://a.example/fail"].endswith("<!-- fallback -->")
+    factory.close()
+
+    factory = _factory(['test_slow'])
+    results = dict(factory.get_pages(["https://a.example/ok", "https://a.example/fail"]))
+    assert results["https://a.example/ok"] == PAGE
+    assert isinstance(results["https://a.example/fail"], ScraperException)
+    factory.close()
+
+
+def test_results_in_completion_order():
+    """Fast hosts are reported before a slow host's queue drains."""
+    global TRACKER
+    TRACKER = ConcurrencyTracker()
+    factory = _factory(['test_slow'])
+    urls = [f"https://slow.example/{i}" for i in range(4)] + ["https://fast.example/"]
+
+    order = [url for url, _ in factory.get_pages(urls, max_workers=4, per_host_limit=1)]
+    factory.close()
+    assert order.index("https://fast.example/") < order.index("https://slow.example/3")
+
+
+def main():
+    """Run all tests."""
+    test_per_host_limit_is_enforced()
+    test_max_workers_is_enforced()
+    test_errors_and_fallback_per_url()
+    test_results_in_completion_order()
+    logger.info("All batch fetch tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for connection pooling in the Requests scraper.
+"""
+
+import logging
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.requests_scraper import RequestsScraper
+
+logger = logging.getLogger(__name__)
+
+PAGE = b'<html><body>' + b'festival ' * 200 + b'</body></html>'
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Serves a fixed page over persistent HTTP/1.1 connections."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_connections_reused_across_cookie_reset():
+    """Sequential fetches reuse one connection, even after a cookie reset."""
+    server = _start_server()
+    scraper = RequestsScraper({'use_proxies': False, 'pool_maxsize': 4})
+    try:
+        url = f'http://127.0.0.1:{server.server_port}/'
+        scraper.get_page(url, max_retries=1)
+        scraper.get_page(url, max_retries=1)
+        scraper._reset_session_state()
+        scraper.get_page(url, max_retries=1)
+
+        pool = scraper.get_stats()['connection_pool']
+        assert pool['requests'] == 3
+        assert pool['misses'] == 1
+        assert pool['hits'] == 2
+        assert pool['hosts']['127.0.0.1']['hit_rate'] == 2 / 3
+    finally:
+        scraper.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_host_pools_mount_dedicated_adapter():
+    """Hosts listed in host_pools get their own adapter with overridden sizes."""
+    scraper = RequestsScraper({'use_proxies': False, 'pool_maxsize': 4,
+                               'host_pools': {'filmfreeway.com': {'pool_maxsize': 16, 'pool_block': True}}})
+    try:
+        adapter = scraper.session.get_adapter('https://filmfreeway.com/festivals')
+        assert adapter is not scraper.session.get_adapter('https://example.com/')
+        assert adapter._pool_maxsize == 16
+        assert adapter._pool_block is True
+        assert scraper.session.get_adapter('https://example.com/')._pool_maxsize == 4
+    finally:
+        scraper.close()
+
+
+def main():
+    """Run all tests."""
+    test_connections_reused_across_cookie_reset()
+    test_host_pools_mount_dedicated_adapter()
+    logger.info("All connection pool tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
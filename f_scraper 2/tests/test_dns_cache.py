@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for the process-wide DNS cache.
+"""
+
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers import dns_cache
+from scrapers.dns_cache import DnsCache
+
+logger = logging.getLogger(__name__)
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    """Answers every request with a short page."""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_answers_match_system_resolver():
+    """Cached answers equal what getaddrinfo returns for the same query."""
+    cache = DnsCache(record_ttl=False)
+    for family, socktype in ((0, 0), (socket.AF_INET, socket.SOCK_STREAM)):
+        expected = sorted(socket.getaddrinfo('localhost', 8080, family, socktype))
+        assert sorted(cache.getaddrinfo('localhost', 8080, family, socktype)) == expected
+    stats = cache.get_stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+
+
+def test_ttl_and_negative_caching():
+    """Answers expire after their TTL and failures are remembered briefly."""
+    cache = DnsCache(ttl=0.05, negative_ttl=60, record_ttl=False)
+    cache.getaddrinfo('localhost', 80)
+    cache.getaddrinfo('localhost', 80)
+    time.sleep(0.1)
+    cache.getaddrinfo('localhost', 80)
+    assert cache.get_stats()['misses'] == 2
+
+    for _ in range(2):
+        try:
+            cache.getaddrinfo('no-such-host.invalid', 80)
+        except socket.gaierror:
+            pass
+        else:
+            raise AssertionError("expected gaierror")
+    assert cache.get_stats()['negative_hits'] == 1
+
+
+def test_prefetch():
+    """Prefetched hosts are served from the cache on first use."""
+    cache = DnsCache(record_ttl=False)
+    for future in cache.prefetch(['localhost', 'LOCALHOST', '127.0.0.1']):
+        future.result(timeout=5)
+    cache.getaddrinfo('localhost', 443, socket.AF_INET, socket.SOCK_STREAM)
+    stats = cache.get_stats()
+    assert stats['prefetched'] == 1
+    assert stats['hits'] == 1
+    assert stats['misses'] == 0
+    cache.close()
+    assert cache.prefetch(['example.com']) == []
+
+
+def test_installed_cache_serves_requests():
+    """Once installed, requests connections resolve through the cache."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    cache = dns_cache.install(record_ttl=False)
+    try:
+        assert socket.getaddrinfo == cache.getaddrinfo
+        for _ in range(3):
+            # A fresh session each time forces a new connection (and lookup)
+            assert requests.get(f'http://localhost:{server.server_port}/', timeout=5).text == 'ok'
+        assert cache.get_stats()['hits'] >= 2
+    finally:
+        dns_cache.uninstall()
+        server.shutdown()
+        server.server_close()
+    assert dns_cache.get_dns_cache() is None
+    assert socket.getaddrinfo is dns_cache._system_getaddrinfo
+
+
+def main():
+    """Run all tests."""
+    test_answers_match_system_resolver()
+    test_ttl_and_negative_caching()
+    test_prefetch()
+    test_installed_cache_serves_requests()
+    logger.info("All DNS cache tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
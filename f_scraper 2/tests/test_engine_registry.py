@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for the engine registry and lazy engine construction.
+"""
+
+import logging
+import os
+import sys
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.base_scraper import BaseScraper
+from scrapers.registry import EngineRegistry, registry, register_engine
+from scrapers.scraper_factory import ScraperFactory
+
+logger = logging.getLogger(__name__)
+
+BUILT = []
+
+
+@register_engine('test_static')
+class StaticScraper(BaseScraper):
+    """Engine that returns a fixed page."""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        BUILT.append(self)
+
+    def get_page(self, url: str, **kwargs) -> str:
+        return "<html>" + "x" * 200 + "</html>"
+
+    def close(self) -> None:
+        pass
+
+
+def _factory(**config):
+    return ScraperFactory({
+        'use_proxies': False,
+        'default_engine': 'test_static',
+        'fallback_order': ['test_static'],
+        **config,
+    })
+
+
+def test_builtin_engines_are_registered_by_path():
+    """Built-in engines are known without importing their modules."""
+    fresh = EngineRegistry()
+    assert {'requests', 'cloudscraper', 'playwright'} <= set(fresh.names())
+    assert isinstance(fresh._factories['playwright'], str)
+
+
+def test_engines_are_built_on_first_use():
+    """The factory builds an engine only when a page needs it."""
+    BUILT.clear()
+    factory = _factory()
+    assert factory.scrapers == {}
+    assert BUILT == []
+
+    factory.get_page("https://example.com/")
+    factory.get_page("https://example.com/other")
+    assert len(BUILT) == 1
+    assert factory.get_scraper('test_static') is BUILT[0]
+    factory.close()
+
+
+def test_warm_up_builds_in_background():
+    """Engines listed under 'warmup' are built without blocking the caller."""
+    BUILT.clear()
+    factory = _factory(warmup=['test_static'])
+    for thread in factory._warmup_threads:
+        thread.join(timeout=5)
+    assert 'test_static' in factory.scrapers
+    assert len(BUILT) == 1
+    factory.close()
+
+
+def test_factory_with_proxy_manager_argument():
+    """Factories taking (config, proxy_manager) receive the proxy manager."""
+    received = []
+
+    def build(config, proxy_manager):
+        received.append(proxy_manager)
+        return StaticScraper(config)
+
+    registry.register('test_with_proxy', build)
+    registry.create('test_with_proxy', {}, proxy_manager='pm')
+    assert received == ['pm']
+
+
+def main():
+    """Run all tests."""
+    test_builtin_engines_are_registered_by_path()
+    test_engines_are_built_on_first_use()
+    test_warm_up_builds_in_background()
+    test_factory_with_proxy_manager_argument()
+    logger.info("All engine registry tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
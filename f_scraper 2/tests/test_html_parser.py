@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the pluggable HTML parser backends.
+"""
+
+import logging
+import os
+import sys
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.base_scraper import BaseScraper, ScraperException
+from scrapers.html_parser import BACKENDS, parse_html, resolve_backend
+
+logger = logging.getLogger(__name__)
+
+PAGE = """
+<html><head>
+<title>Sundance Film Festival</title>
+<meta name="description" content="One of the largest independent film festivals in the US.">
+</head><body>
+<h1 class="festival-name">  Sundance Film Festival </h1>
+<a href="/festivals/curated/documentary" title="View Documentary Festivals">Docs</a>
+<a href="/festivals/curated/shorts" title="View Short Film Festivals">Shorts</a>
+<a href="/about">About</a>
+<div class="deadline-item"><span>Early</span> <span>August 1, 2024</span></div>
+<div class="deadline-item"><span>Late</span> <span>September 15, 2024</span></div>
+</body></html>
+"""
+
+
+class ParsingScraper(BaseScraper):
+    """Scraper that only parses."""
+
+    def get_page(self, url: str, **kwargs) -> str:
+        return PAGE
+
+    def close(self) -> None:
+        pass
+
+
+def _extract(document):
+    """Run the kind of lookups the festival extractors make."""
+    links = [(link.get('title', '').replace('View ', ''), link.get('href', ''))
+             for link in document.select("a[href^='/festivals/curated/']")]
+    return {
+        'name': document.select_one('h1.festival-name').get_text(strip=True),
+        'description': document.select_one("meta[name='description']").get('content', ''),
+        'missing': document.select_one('div.Description'),
+        'links': links,
+        'deadlines': [elem.get_text(strip=True) for elem in document.select("div[class*='deadline']")],
+    }
+
+
+def test_backends_agree():
+    """Every installed backend yields the same extracted values."""
+    expected = _extract(parse_html(PAGE, 'html.parser'))
+    assert expected['name'] == 'Sundance Film Festival'
+    assert expected['links'] == [('Documentary Festivals', '/festivals/curated/documentary'),
+                                 ('Short Film Festivals', '/festivals/curated/shorts')]
+    assert expected['deadlines'] == ['EarlyAugust 1, 2024', 'LateSeptember 15, 2024']
+    assert expected['missing'] is None
+
+    for backend in BACKENDS:
+        assert _extract(parse_html(PAGE, backend)) == expected, backend
+
+
+def test_resolve_backend():
+    """Auto picks a BeautifulSoup backend and unknown names are rejected."""
+    assert resolve_backend('auto') in ('lxml', 'html.parser')
+    try:
+        resolve_backend('regex')
+    except ScraperException:
+        pass
+    else:
+        raise AssertionError("expected ScraperException")
+
+
+def test_parse_time_reported():
+    """Parse times are reported per backend in get_stats."""
+    scraper = ParsingScraper({'parser': 'html.parser'})
+    for _ in range(3):
+        scraper.parse_html(PAGE)
+    parse = scraper.get_stats()['parse']
+    assert list(parse) == ['html.parser']
+    assert parse['html.parser']['count'] == 3
+
+
+def main():
+    """Run all tests."""
+    test_backends_agree()
+    test_resolve_backend()
+    test_parse_time_reported()
+    logger.info("All HTML parser tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script for the HTTPX (HTTP/2) scraper engine.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.base_scraper import ScraperException
+from scrapers.httpx_scraper import HttpxScraper
+from scrapers.registry import registry
+
+logger = logging.getLogger(__name__)
+
+PAGE = b'<html><body><h1 class="festival-name">Sundance</h1></body></html>'
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves the test page, or a 404 under /missing."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        status = 404 if self.path.startswith('/missing') else 200
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_sync_and_async_fetch():
+    """get_page and afetch_many return the page and record stats."""
+    server = _start_server()
+    scraper = HttpxScraper({'max_retries': 1, 'rate_limit': False})
+    try:
+        base = f'http://127.0.0.1:{server.server_port}'
+        assert scraper.get_page(base + '/festival') == PAGE.decode()
+
+        async def _fetch_all():
+            results = [result async for _, result in scraper.afetch_many([base + '/festival'] * 10, concurrency=5)]
+            await scraper.aclose()
+            return results
+
+        assert asyncio.run(_fetch_all()) == [PAGE.decode()] * 10
+
+        stats = scraper.get_stats()
+        assert stats['success'] == 11
+        assert stats['http_versions'] == {'HTTP/1.1': 11}
+        assert stats['latency']['ttfb']['count'] == 11
+    finally:
+        scraper.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_errors_raise():
+    """HTTP errors surface as ScraperException after the retries."""
+    server = _start_server()
+    scraper = HttpxScraper({'max_retries': 1, 'rate_limit': False})
+    try:
+        url = f'http://127.0.0.1:{server.server_port}/missing'
+        for fetch in (lambda: scraper.get_page(url), lambda: asyncio.run(scraper.aget_page(url))):
+            try:
+                fetch()
+            except ScraperException:
+                pass
+            else:
+                raise AssertionError("expected ScraperException")
+    finally:
+        scraper.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_registered_as_engine():
+    """The engine is available to the factory as 'httpx'."""
+    assert 'httpx' in registry.names()
+    assert registry.get_factory('httpx') is HttpxScraper
+
+
+def main():
+    """Run all tests."""
+    test_sync_and_async_fetch()
+    test_http_errors_raise()
+    test_registered_as_engine()
+    logger.info("All HTTPX scraper tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test script for the latency histograms.
+"""
+
+import logging
+import os
+import random
+import sys
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.latency import OTHER_HOSTS, LatencyHistogram, LatencyStats
+
+logger = logging.getLogger(__name__)
+
+
+def test_percentiles_within_precision():
+    """Percentiles stay within the histogram's ~3% relative precision."""
+    rng = random.Random(42)
+    samples = [rng.lognormvariate(-2, 1) for _ in range(10000)]
+    histogram = LatencyHistogram()
+    for sample in samples:
+        histogram.record(sample)
+
+    ordered = sorted(samples)
+    for percent in (50, 90, 99):
+        exact = ordered[int(len(ordered) * percent / 100) - 1]
+        assert abs(histogram.percentile(percent) - exact) / exact < 0.04
+
+    assert histogram.percentile(100) == int(max(samples) * 1_000_000) / 1_000_000
+    assert histogram.count == len(samples)
+
+
+def test_memory_is_bounded():
+    """The number of buckets does not grow with the number of samples."""
+    histogram = LatencyHistogram()
+    for i in range(100000):
+        histogram.record(i / 1000)
+    assert len(histogram.counts) < 1100
+
+
+def test_stats_per_host_and_merge():
+    """LatencyStats tracks phases per host and merges across engines."""
+    first = LatencyStats()
+    first.record('a.example', total=0.2, ttfb=0.05, body=0.15)
+    second = LatencyStats()
+    second.record('b.example', total=0.4)
+
+    first.merge(second)
+    snapshot = first.snapshot()
+
+    assert snapshot['total']['count'] == 2
+    assert snapshot['ttfb']['count'] == 1
+    assert snapshot['hosts']['b.example']['body']['count'] == 0
+    assert abs(snapshot['hosts']['a.example']['ttfb']['p50_ms'] - 50) < 2
+
+
+def test_hosts_are_capped():
+    """Hosts past max_hosts share one entry, and 0 keeps only the overall stats."""
+    stats = LatencyStats(max_hosts=3)
+    for i in range(1000):
+        stats.record(f'host{i}.example', total=0.1)
+    snapshot = stats.snapshot()
+    assert sorted(snapshot['hosts']) == [OTHER_HOSTS, 'host0.example', 'host1.example', 'host2.example']
+    assert snapshot['hosts'][OTHER_HOSTS]['total']['count'] == 997
+    assert snapshot['total']['count'] == 1000
+
+    merged = LatencyStats(max_hosts=3)
+    merged.record('new.example', total=0.2)
+    merged.merge(stats)
+    assert sorted(merged.hosts) == [OTHER_HOSTS, 'host0.example', 'host1.example', 'new.example']
+    assert sum(phases['total'].count for phases in merged.hosts.values()) == 1001
+
+    overall_only = LatencyStats(max_hosts=0)
+    overall_only.record('a.example', total=0.1)
+    overall_only.merge(stats)
+    assert overall_only.snapshot()['hosts'] == {}
+    assert overall_only.snapshot()['total']['count'] == 1001
+
+
+def main():
+    """Run all tests."""
+    test_percentiles_within_precision()
+    test_memory_is_bounded()
+    test_stats_per_host_and_merge()
+    test_hosts_are_capped()
+    logger.info("All latency tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
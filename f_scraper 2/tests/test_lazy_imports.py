@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark and guard for the lazily loaded scraper engines.
+
+Run directly to print the import cost of the package and of each engine.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Dependencies that must not be loaded until their engine is used
+HEAVY_MODULES = [
+    'playwright',
+    'cloudscraper',
+    'requests_ip_rotator',
+    'bs4',
+    'lxml',
+    'selectolax',
+    'httpx',
+    'fake_useragent',
+    'random_user_agent',
+]
+
+# Budget for the cumulative import time of `scrapers` itself, in milliseconds
+IMPORT_BUDGET_MS = 150
+
+logger = logging.getLogger(__name__)
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter with the package on the path."""
+    with tempfile.TemporaryDirectory() as cwd:
+        return subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=cwd,
+            env={**os.environ, 'PYTHONPATH': PACKAGE_ROOT},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+
+def _loaded_heavy_modules(statement: str) -> list:
+    """Get the heavy modules loaded after running an import statement."""
+    code = f"{statement}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    return [m for m in _run(code).stdout.strip().split(',') if m]
+
+
+def import_time_ms(statement: str, module: str) -> float:
+    """Get the cumulative import time of a module, as reported by -X importtime.
+
+    Args:
+        statement: Import statement to run.
+        module: Module whose cumulative time to report.
+
+    Returns:
+        Cumulative import time in milliseconds.
+    """
+    for line in _run(statement).stderr.splitlines():
+        parts = [part.strip() for part in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def test_import_scrapers_loads_no_engine_dependencies():
+    """`import scrapers` does not import any engine dependency."""
+    assert _loaded_heavy_modules('import scrapers') == []
+
+
+def test_requests_scraper_import_is_light():
+    """Importing RequestsScraper does not pull in the other engines."""
+    assert _loaded_heavy_modules('from scrapers import RequestsScraper') == []
+
+
+def test_scraper_factory_import_is_light():
+    """Importing ScraperFactory defers every engine until it is built."""
+    assert _loaded_heavy_modules('from scrapers import ScraperFactory') == []
+
+
+def test_import_time_budget():
+    """`import scrapers` stays within its import-time budget."""
+    assert import_time_ms('import scrapers', 'scrapers') < IMPORT_BUDGET_MS
+
+
+def main():
+    """Print the import cost of the package and each engine."""
+    logging.basicConfig(level=logging.INFO)
+    for statement, module in [
+        ('import scrapers', 'scrapers'),
+        ('import scrapers.requests_scraper', 'scrapers.requests_scraper'),
+        ('import scrapers.cloudscraper_engine', 'scrapers.cloudscraper_engine'),
+        ('import scrapers.playwright_scraper', 'scrapers.playwright_scraper'),
+        ('import scrapers.httpx_scraper', 'scrapers.httpx_scraper'),
+        ('import scrapers.scraper_factory', 'scrapers.scraper_factory'),
+    ]:
+        try:
+            logger.info("%s: %.1f ms", module, import_time_ms(statement, module))
+        except subprocess.CalledProcessError as e:
+            logger.warning("%s: import failed (%s)", module, e.stderr.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the queue-based logging pipeline.
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers import logging_setup
+from scrapers.logging_setup import LazyQueueHandler, configure_logging, stop_logging
+
+logger = logging.getLogger(__name__)
+
+LOGGER_NAME = 'test_logging_setup'
+
+
+def _read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_are_written_by_the_listener():
+    """Records are handled on the listener thread and flushed by stop_logging."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'scraper.log')
+        configure_logging(log_file=path, console=False, logger_name=LOGGER_NAME)
+        handler_threads = set()
+
+        def _record_thread(record):
+            handler_threads.add(threading.current_thread())
+            return True
+
+        logging_setup._listener.handlers[0].addFilter(_record_thread)
+        test_logger = logging.getLogger(LOGGER_NAME)
+        items = ['a', 'b']
+        try:
+            for i in range(100):
+                test_logger.info("Fetched page %s of %s", i, 'example.com')
+            # Mutable arguments are formatted before the call returns
+            test_logger.info("Items: %s", items)
+            items.append('c')
+        finally:
+            stop_logging()
+
+        lines = _read_lines(path)
+        assert len(lines) == 101
+        assert lines[0]['msg'] == "Fetched page 0 of example.com"
+        assert lines[-1]['msg'] == "Items: ['a', 'b']"
+        assert threading.current_thread() not in handler_threads and len(handler_threads) == 1
+        assert not logging.getLogger(LOGGER_NAME).handlers
+
+
+def test_json_lines_fields():
+    """Each JSON line has the record's fields, including a formatted exception."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'scraper.log')
+        configure_logging(log_file=path, console=False, logger_name=LOGGER_NAME)
+        try:
+            try:
+                raise ValueError("bad page")
+            except ValueError:
+                logging.getLogger(LOGGER_NAME).exception("Error parsing %s", 'https://example.com/')
+        finally:
+            stop_logging()
+
+        entry, = _read_lines(path)
+        assert set(entry) == {'ts', 'level', 'logger', 'thread', 'msg', 'exc'}
+        assert entry['level'] == 'ERROR'
+        assert entry['logger'] == LOGGER_NAME
+        assert entry['thread'] == threading.current_thread().name
+        assert entry['msg'] == "Error parsing https://example.com/"
+        assert 'ValueError: bad page' in entry['exc']
+
+
+def test_reconfiguring_replaces_the_pipeline():
+    """Calling configure_logging again leaves one handler and one running listener."""
+    with tempfile.TemporaryDirectory() as directory:
+        first_path = os.path.join(directory, 'first.log')
+        second_path = os.path.join(directory, 'second.log')
+        first = configure_logging(log_file=first_path, console=False, logger_name=LOGGER_NAME)
+        second = configure_logging(log_file=second_path, console=False, logger_name=LOGGER_NAME)
+        test_logger = logging.getLogger(LOGGER_NAME)
+        try:
+            assert first._thread is None
+            assert all(handler.stream is None for handler in first.handlers)
+            assert [type(handler) for handler in test_logger.handlers] == [LazyQueueHandler]
+            test_logger.info("Only once")
+        finally:
+            stop_logging()
+
+        assert second._thread is None
+        assert not test_logger.handlers
+        assert _read_lines(first_path) == []
+        assert [entry['msg'] for entry in _read_lines(second_path)] == ["Only once"]
+
+
+def main():
+    """Run all tests."""
+    test_records_are_written_by_the_listener()
+    test_json_lines_fields()
+    test_reconfiguring_replaces_the_pipeline()
+    logger.info("All logging setup tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test script for the browser page pool used by the Playwright scraper.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.page_pool import PagePool, PooledPage
+
+logger = logging.getLogger(__name__)
+
+
+class FakePage:
+    """Stands in for a Playwright page."""
+
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    """Stands in for a Playwright browser context."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _make_pool(**kwargs):
+    created = []
+
+    async def create_page():
+        pooled = PooledPage(FakeContext(), FakePage())
+        created.append(pooled)
+        return pooled
+
+    return PagePool(create_page, **kwargs), created
+
+
+def test_concurrent_leases_are_capped():
+    """No more than ``size`` renders hold a page at once, and pages are reused."""
+    pool, created = _make_pool(size=3, max_navigations=0)
+    active = 0
+    peak = 0
+
+    async def render():
+        nonlocal active, peak
+        async with pool.lease():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def run():
+        await asyncio.gather(*(render() for _ in range(10)))
+
+    asyncio.run(run())
+    assert peak == 3
+    assert len(created) == 3
+    stats = pool.get_stats()
+    assert stats['leases'] == 10
+    assert stats['waits'] >= 1
+    assert stats['idle'] == 3
+
+
+def test_contexts_recycled_after_max_navigations():
+    """A context is closed and replaced once it has served max_navigations renders."""
+    pool, created = _make_pool(size=1, max_navigations=2)
+
+    async def run():
+        for _ in range(5):
+            async with pool.lease():
+                pass
+
+    asyncio.run(run())
+    assert len(created) == 3
+    assert [pooled.context.closed for pooled in created] == [True, True, False]
+    assert pool.get_stats()['recycled'] == 2
+
+
+def test_closed_pages_and_failures():
+    """A page that was closed is replaced; a failed render keeps its page."""
+    pool, created = _make_pool(size=1, max_navigations=0)
+
+    async def run():
+        try:
+            async with pool.lease():
+                raise ValueError("render failed")
+        except ValueError:
+            pass
+        async with pool.lease() as pooled:
+            assert pooled is created[0]
+            pooled.page.closed = True
+        async with pool.lease() as pooled:
+            assert pooled is created[1]
+        await pool.close()
+
+    asyncio.run(run())
+    assert created[1].context.closed
+    assert pool.get_stats()['pages'] == 0
+
+
+def test_shared_context_pages():
+    """Pages sharing a persistent context only close themselves."""
+    context = FakeContext()
+
+    async def create_page():
+        return PooledPage(context, FakePage(), owns_context=False)
+
+    pool = PagePool(create_page, size=2, max_navigations=1)
+
+    async def run():
+        async with pool.lease() as pooled:
+            pass
+        return pooled
+
+    pooled = asyncio.run(run())
+    assert pooled.page.closed
+    assert not context.closed
+
+
+def main():
+    """Run all tests."""
+    test_concurrent_leases_are_capped()
+    test_contexts_recycled_after_max_navigations()
+    test_closed_pages_and_failures()
+    test_shared_context_pages()
+    logger.info("All page pool tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Test script for the Playwright scraper's dedicated event-loop thread.
+
+Runs offline against a minimal in-process stand-in for the Playwright
+browser, so no browser binaries are needed.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers import playwright_scraper
+from scrapers.playwright_scraper import PlaywrightScraper
+
+logger = logging.getLogger(__name__)
+
+
+class FakeResponse:
+    """Main document response of a navigation."""
+
+    status = 200
+    headers = {}
+    request = None
+
+
+class FakePage:
+    """Renders a page that names its URL, taking a little time to load."""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.url = 'about:blank'
+        self.closed = False
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def on(self, event, handler):
+        pass
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def add_init_script(self, script):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.browser.record_loop()
+        self.url = url
+        with self.browser.lock:
+            self.browser.active += 1
+            self.browser.peak = max(self.browser.peak, self.browser.active)
+        await asyncio.sleep(0.1)
+        with self.browser.lock:
+            self.browser.active -= 1
+        return FakeResponse()
+
+    async def query_selector(self, selector):
+        return None
+
+    async def wait_for_selector(self, selector, **kwargs):
+        return True
+
+    async def content(self):
+        return f"<html><body>{'.' * 1000}{self.url}</body></html>"
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    """Browser context handing out fake pages."""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage(self.browser)
+        self.pages.append(page)
+        return page
+
+    async def add_cookies(self, cookies):
+        pass
+
+    async def cookies(self):
+        return [{'name': 'session', 'value': 'abc'}]
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    """Browser recording how many navigations overlap and on which threads."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.threads = set()
+
+    def record_loop(self):
+        self.threads.add(threading.current_thread().name)
+
+    async def launch(self, **kwargs):
+        return self
+
+    async def new_context(self, **kwargs):
+        return FakeContext(self)
+
+    async def close(self):
+        pass
+
+
+class FakePlaywright:
+    """Stands in for the object returned by ``async_playwright().start()``."""
+
+    def __init__(self):
+        self.chromium = FakeBrowser()
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+
+def _make_scraper(**config):
+    # Playwright is only started while the scraper initializes
+    async_playwright = playwright_scraper.async_playwright
+    playwright_scraper.async_playwright = FakePlaywright
+    try:
+        scraper = PlaywrightScraper({'rate_limit': False, 'block_resources': False, **config})
+    finally:
+        playwright_scraper.async_playwright = async_playwright
+    return scraper
+
+
+def test_sync_callers_overlap():
+    """Renders from many threads run concurrently on the scraper's loop thread."""
+    scraper = _make_scraper(page_pool_size=4)
+    try:
+        urls = [f'https://example.com/{i}' for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pages = list(executor.map(scraper.get_page, urls))
+        assert all(page.endswith(f'{url}</body></html>') for page, url in zip(pages, urls))
+        assert scraper.browser.peak == 4
+        assert scraper.browser.threads == {'playwright-loop'}
+        assert scraper.get_cookies() == {'session': 'abc'}
+    finally:
+        scraper.close()
+    assert scraper.loop.is_closed()
+    assert not scraper._loop_thread.is_alive()
+
+
+def test_async_callers_on_another_loop():
+    """aget_page and aget_pages can be awaited from a caller's own running loop."""
+    scraper = _make_scraper(page_pool_size=2)
+
+    async def run():
+        page = await scraper.aget_page('https://example.com/one')
+        results = [result async for result in scraper.aget_pages(['https://example.com/a', 'https://example.com/b'])]
+        return page, results
+
+    try:
+        page, results = asyncio.run(run())
+        assert page.endswith('https://example.com/one</body></html>')
+        assert sorted(url for url, _ in results) == ['https://example.com/a', 'https://example.com/b']
+        assert scraper.browser.threads == {'playwright-loop'}
+    finally:
+        scraper.close()
+
+
+def test_blocking_stats_read_during_renders():
+    """get_stats can be read from other threads while renders update the blocking stats."""
+    scraper = _make_scraper(page_pool_size=4, block_resources=True)
+    try:
+        urls = [f'https://example.com/{i}' for i in range(8)]
+        with ThreadPoolExecutor(max_workers=9) as executor:
+            renders = executor.map(scraper.get_page, urls)
+            reads = [executor.submit(scraper.get_stats) for _ in range(50)]
+            list(renders)
+            assert all('resource_blocking' in read.result() for read in reads)
+        assert scraper.get_stats()['resource_blocking']['renders'] == 8
+    finally:
+        scraper.close()
+
+
+def main():
+    """Run all tests."""
+    test_sync_callers_overlap()
+    test_async_callers_on_another_loop()
+    test_blocking_stats_read_during_renders()
+    logger.info("All Playwright loop tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
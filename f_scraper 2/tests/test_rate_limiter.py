@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-host rate limiter.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.base_scraper import BaseScraper
+from scrapers.rate_limiter import DEFAULT_SETTING, RateLimiter, create_from_config
+from scrapers.registry import register_engine
+from scrapers.scraper_factory import ScraperFactory
+
+logger = logging.getLogger(__name__)
+
+
+def test_burst_then_steady_rate():
+    """An idle host gets its burst at once, then one request per interval."""
+    limiter = RateLimiter(rate=10, burst=3)
+    delays = [limiter.reserve('example.com') for _ in range(6)]
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    for expected, delay in zip((0.1, 0.2, 0.3), delays[3:]):
+        assert abs(delay - expected) < 0.01
+    # Other hosts have their own budget
+    assert limiter.reserve('other.example') == 0.0
+
+
+def test_acquire_holds_the_rate_across_threads():
+    """Concurrent callers are spread out at the allowed rate."""
+    limiter = RateLimiter(rate=20, burst=1)
+    times = []
+    lock = threading.Lock()
+
+    def _request():
+        limiter.acquire('example.com')
+        with lock:
+            times.append(time.monotonic())
+
+    threads = [threading.Thread(target=_request) for _ in range(5)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Five requests at 20/s with no burst take four intervals
+    assert 0.18 < max(times) - start < 0.4
+    assert limiter.get_stats()['delayed'] == 4
+
+
+def test_async_acquire_and_host_overrides():
+    """aacquire waits on the event loop; per-host rates override the default."""
+    limiter = RateLimiter(rate=1, burst=1, hosts={'fast.example': {'rate': 50, 'burst': 1}, 'free.example': None})
+
+    async def _run():
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.aacquire('FAST.example')
+        return time.monotonic() - start
+
+    assert 0.03 < asyncio.run(_run()) < 0.5
+    assert all(limiter.reserve('free.example') == 0.0 for _ in range(10))
+
+
+def test_pause():
+    """A paused host waits out the pause, even when it is otherwise unlimited."""
+    limiter = RateLimiter(rate=None)
+    limiter.pause('example.com', 5)
+    assert 4.9 < limiter.reserve('example.com') <= 5
+    assert limiter.reserve('other.example') == 0.0
+
+
+def test_create_from_config():
+    """The rate_limit setting turns the limiter off or configures it."""
+    assert create_from_config(False) is None
+    assert create_from_config(True).rate == 1.0
+    assert create_from_config({'rate': 5, 'burst': 4}).burst == 4
+
+    # By default hosts are not throttled, but pauses still apply
+    limiter = create_from_config(DEFAULT_SETTING)
+    assert all(limiter.reserve('example.com') == 0.0 for _ in range(10))
+    limiter.pause('example.com', 5)
+    assert limiter.reserve('example.com') > 4.9
+
+
+@register_engine('test_throttled')
+class ThrottledScraper(BaseScraper):
+    """Engine that only waits for the rate limiter."""
+
+    def get_page(self, url: str, **kwargs) -> str:
+        self._throttle('example.com')
+        return "<html>" + "x" * 200 + "</html>"
+
+    def close(self) -> None:
+        pass
+
+
+def test_factory_shares_one_limiter():
+    """Engines built by the factory use the factory's limiter."""
+    factory = ScraperFactory({'use_proxies': False, 'default_engine': 'test_throttled',
+                              'fallback_order': ['test_throttled'], 'rate_limit': {'rate': 100, 'burst': 1}})
+    factory.get_page("https://example.com/")
+    factory.get_page("https://example.com/other")
+    assert factory.get_scraper('test_throttled').rate_limiter is factory.rate_limiter
+    assert factory.get_stats()['rate_limiter']['requests'] == 2
+    factory.close()
+
+    factory = ScraperFactory({'use_proxies': False, 'rate_limit': False})
+    assert factory.rate_limiter is None
+    factory.close()
+
+    factory = ScraperFactory({'use_proxies': False})
+    assert factory.rate_limiter.rate is None
+    factory.close()
+
+
+def test_throttled_work_does_not_hold_workers():
+    """Work waiting for a paused host is parked, so other hosts keep the workers."""
+    scraper = ThrottledScraper({'retry_workers': 2, 'rate_limit': {'rate': None}})
+    scraper.rate_limiter.pause('paused.example', 1)
+    try:
+        start = time.monotonic()
+        paused = [scraper.submit_with_backoff(lambda: "paused", host='paused.example') for _ in range(3)]
+        other = scraper.submit_with_backoff(lambda: "other", host='other.example')
+        assert other.result(timeout=5) == "other"
+        assert time.monotonic() - start < 0.5
+
+        assert [future.result(timeout=5) for future in paused] == ["paused"] * 3
+        assert time.monotonic() - start >= 0.9
+        assert scraper.retry_scheduler.queue_depths() == {}
+    finally:
+        scraper._close_retry_scheduler()
+
+
+def main():
+    """Run all tests."""
+    test_burst_then_steady_rate()
+    test_acquire_holds_the_rate_across_threads()
+    test_async_acquire_and_host_overrides()
+    test_pause()
+    test_create_from_config()
+    test_factory_shares_one_limiter()
+    test_throttled_work_does_not_hold_workers()
+    logger.info("All rate limiter tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
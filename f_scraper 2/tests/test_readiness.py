@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test script for page readiness profiles.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.readiness import (NetworkQuietWatcher, ReadinessProfile, ReadinessProfiles,
+                                create_from_config, wait_until_ready)
+
+logger = logging.getLogger(__name__)
+
+
+class FakePage:
+    """Page whose conditions become true after a set delay."""
+
+    def __init__(self, selector_delay=None, predicate_delay=None):
+        self.selector_delay = selector_delay
+        self.predicate_delay = predicate_delay
+        self.listeners = {}
+
+    async def _wait(self, delay, timeout):
+        if delay is None or delay * 1000 > timeout:
+            await asyncio.sleep(timeout / 1000)
+            raise TimeoutError("condition not met")
+        await asyncio.sleep(delay)
+        return True
+
+    async def wait_for_selector(self, selector, state='attached', timeout=30000):
+        return await self._wait(self.selector_delay, timeout)
+
+    async def wait_for_function(self, predicate, timeout=30000):
+        return await self._wait(self.predicate_delay, timeout)
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners[event].remove(handler)
+
+    def emit(self, event):
+        for handler in list(self.listeners.get(event, [])):
+            handler(object())
+
+
+def _timed(coro):
+    start = time.monotonic()
+    result = asyncio.run(coro)
+    return result, time.monotonic() - start
+
+
+def test_returns_as_soon_as_ready():
+    """A page is ready once all its conditions hold, without waiting out the budget."""
+    profile = ReadinessProfile('listing', selector='.item', predicate='() => window.loaded', budget=5)
+    ready, elapsed = _timed(wait_until_ready(FakePage(selector_delay=0.05, predicate_delay=0.1), profile))
+    assert ready
+    assert elapsed < 1
+
+
+def test_budget_is_a_hard_limit():
+    """A condition that never holds costs no more than the budget."""
+    profile = ReadinessProfile('listing', selector='.item', predicate='() => window.loaded', budget=0.2)
+    ready, elapsed = _timed(wait_until_ready(FakePage(selector_delay=0.01), profile))
+    assert not ready
+    assert elapsed < 1
+
+    ready, _ = _timed(wait_until_ready(FakePage(), ReadinessProfile('none', budget=0.1)))
+    assert ready
+
+
+def test_network_quiet_window():
+    """The network condition waits for a quiet window after the last request."""
+    page = FakePage()
+    profile = ReadinessProfile('api', network_idle=0.1, budget=2)
+
+    async def run():
+        watcher = NetworkQuietWatcher(page)
+        watcher.attach()
+        page.emit('request')
+        page.emit('request')
+
+        async def finish_requests():
+            await asyncio.sleep(0.1)
+            page.emit('requestfinished')
+            await asyncio.sleep(0.1)
+            page.emit('requestfailed')
+
+        start = time.monotonic()
+        finisher = asyncio.ensure_future(finish_requests())
+        ready = await wait_until_ready(page, profile, watcher)
+        elapsed = time.monotonic() - start
+        await finisher
+        watcher.detach()
+        return ready, elapsed
+
+    ready, elapsed = asyncio.run(run())
+    assert ready
+    assert 0.25 <= elapsed < 1
+    assert all(not handlers for handlers in page.listeners.values())
+
+
+def test_profile_matching_and_stats():
+    """The first matching profile wins, and wait times are kept per profile."""
+    profiles = create_from_config([{'name': 'search', 'pattern': r'/search\?', 'selector': '.results'}],
+                                  {'budget': 3})
+    assert profiles.match('https://filmfreeway.com/search?q=x').name == 'search'
+    assert profiles.match('https://filmfreeway.com/festivals/1').name == 'festival'
+    default = profiles.match('https://example.com/')
+    assert default.name == 'default' and default.budget == 3
+
+    stats = ReadinessProfiles()
+    profile = stats.match('https://example.com/')
+    stats.record(profile, 0.5, ready=True)
+    stats.record(profile, 5.0, ready=False)
+    summary = stats.get_stats()['default']
+    assert summary['count'] == 2
+    assert summary['timeouts'] == 1
+
+
+def main():
+    """Run all tests."""
+    test_returns_as_soon_as_ready()
+    test_budget_is_a_hard_limit()
+    test_network_quiet_window()
+    test_profile_matching_and_stats()
+    logger.info("All readiness tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
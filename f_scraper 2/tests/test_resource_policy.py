@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script for the resource policy that blocks subresources during renders.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.resource_policy import ResourceBlocker, ResourcePolicy, create_from_config
+
+logger = logging.getLogger(__name__)
+
+
+class FakeRequest:
+    """Stands in for a Playwright request."""
+
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    """Stands in for a Playwright route, recording what was done with it."""
+
+    def __init__(self, resource_type, url):
+        self.request = FakeRequest(resource_type, url)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = 'aborted'
+
+    async def continue_(self):
+        self.outcome = 'continued'
+
+
+def test_default_policy():
+    """Images, fonts, media and trackers are blocked; pages, scripts and styles load."""
+    policy = ResourcePolicy()
+    page = 'example.com'
+    assert policy.should_block('image', 'https://example.com/logo.png', page)
+    assert policy.should_block('font', 'https://fonts.gstatic.com/a.woff2', page)
+    assert policy.should_block('media', 'https://cdn.example.com/clip.mp4', page)
+    assert policy.should_block('script', 'https://www.google-analytics.com/analytics.js', page)
+    assert policy.should_block('xhr', 'https://stats.g.doubleclick.net/collect', page)
+    assert not policy.should_block('document', 'https://example.com/', page)
+    assert not policy.should_block('script', 'https://example.com/app.js', page)
+    assert not policy.should_block('stylesheet', 'https://cdn.other.net/site.css', page)
+    assert not policy.should_block('xhr', 'https://api.example.com/list.json', page)
+
+
+def test_allow_and_third_party_rules():
+    """Allowed domains win; third-party blocking spares the page's own site and frames."""
+    policy = ResourcePolicy(block_types=['image'], block_domains=['tracker.io'],
+                            allow_domains=['images.example.com', 'cdn.tracker.io'], block_third_party=True)
+    page = 'www.example.com'
+    assert not policy.should_block('image', 'https://images.example.com/poster.jpg', page)
+    assert not policy.should_block('script', 'https://cdn.tracker.io/lib.js', page)
+    assert policy.should_block('script', 'https://tracker.io/t.js', page)
+    assert policy.should_block('script', 'https://widgets.other.net/w.js', page)
+    assert not policy.should_block('script', 'https://static.example.com/app.js', page)
+    assert not policy.should_block('document', 'https://embed.other.net/frame', page)
+
+
+def test_blocker_counts_per_render():
+    """The blocker aborts blocked requests and reports them per render."""
+    blocker = ResourceBlocker(ResourcePolicy(estimated_sizes={'image': 1000}))
+
+    async def render(url, requests):
+        blocker.start(url)
+        routes = [FakeRoute(resource_type, request_url) for resource_type, request_url in requests]
+        for route in routes:
+            await blocker.handle(route)
+        return routes, blocker.finish()
+
+    routes, summary = asyncio.run(render('https://example.com/', [
+        ('document', 'https://example.com/'),
+        ('image', 'https://example.com/a.png'),
+        ('image', 'https://example.com/b.png'),
+        ('font', 'https://example.com/f.woff'),
+    ]))
+    assert [route.outcome for route in routes] == ['continued', 'aborted', 'aborted', 'aborted']
+    assert summary == {'blocked': 3, 'by_type': {'image': 2, 'font': 1}, 'bytes_saved': 2000 + 35_000}
+
+    _, summary = asyncio.run(render('https://example.com/next', [('script', 'https://example.com/app.js')]))
+    assert summary['blocked'] == 0
+
+
+def test_create_from_config():
+    """Config values turn blocking off, on, or customize it."""
+    assert create_from_config(False) is None
+    assert create_from_config(True).block_types == frozenset(['image', 'font', 'media'])
+    assert create_from_config({'block_types': ['image']}).block_types == frozenset(['image'])
+
+
+def main():
+    """Run all tests."""
+    test_default_policy()
+    test_allow_and_third_party_rules()
+    test_blocker_counts_per_render()
+    test_create_from_config()
+    logger.info("All resource policy tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test script for capturing JSON responses during renders.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.response_capture import CapturedResponse, RenderResult, ResponseCapture
+
+logger = logging.getLogger(__name__)
+
+
+class FakeResponse:
+    """Stands in for a Playwright response whose body arrives after a delay."""
+
+    def __init__(self, url, body, content_type='application/json', status=200, delay=0.0):
+        self.url = url
+        self.status = status
+        self.headers = {'content-type': content_type}
+        self._body = body.encode() if isinstance(body, str) else body
+        self._delay = delay
+
+    async def body(self):
+        await asyncio.sleep(self._delay)
+        return self._body
+
+
+class FakePage:
+    """Page that emits response events to its listeners."""
+
+    def __init__(self):
+        self.listeners = {}
+
+    def on(self, event, handler):
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners[event].remove(handler)
+
+    def emit(self, response):
+        for handler in list(self.listeners.get('response', [])):
+            handler(response)
+
+
+def test_captures_matching_json_in_order():
+    """Matching JSON responses are decoded, in arrival order, even if bodies finish out of order."""
+    page = FakePage()
+    capture = ResponseCapture([r'/api/festivals', r'/api/categories'])
+
+    async def run():
+        capture.attach(page)
+        page.emit(FakeResponse('https://example.com/api/festivals?page=1', json.dumps({'page': 1}), delay=0.05))
+        page.emit(FakeResponse('https://example.com/api/categories', '["Short", "Feature"]'))
+        page.emit(FakeResponse('https://example.com/api/user', '{"id": 1}'))
+        page.emit(FakeResponse('https://example.com/api/festivals.html', '<html></html>', content_type='text/html'))
+        page.emit(FakeResponse('https://example.com/api/festivals?page=2', 'not json'))
+        return await capture.finish()
+
+    responses = asyncio.run(run())
+    assert responses == [
+        CapturedResponse('https://example.com/api/festivals?page=1', 200, {'page': 1}),
+        CapturedResponse('https://example.com/api/categories', 200, ['Short', 'Feature']),
+    ]
+    assert capture.skipped == 2
+    assert not page.listeners['response']
+
+
+def test_size_limit_and_timeout():
+    """Oversized bodies are skipped and slow bodies don't hold up the render."""
+    page = FakePage()
+    capture = ResponseCapture(r'/api/', max_bytes=10, timeout=0.1)
+
+    async def run():
+        capture.attach(page)
+        page.emit(FakeResponse('https://example.com/api/big', json.dumps({'items': list(range(100))})))
+        page.emit(FakeResponse('https://example.com/api/slow', '{}', delay=5))
+        page.emit(FakeResponse('https://example.com/api/small', '{"a": 1}'))
+        return await capture.finish()
+
+    responses = asyncio.run(run())
+    assert [response.url for response in responses] == ['https://example.com/api/small']
+
+
+def test_cancel_stops_pending_reads():
+    """Cancelling a capture drops the bodies still being read and detaches it."""
+    page = FakePage()
+    capture = ResponseCapture(r'/api/')
+
+    async def run():
+        capture.attach(page)
+        page.emit(FakeResponse('https://example.com/api/slow', '{}', delay=5))
+        await asyncio.sleep(0)
+        capture.cancel()
+        await asyncio.sleep(0)
+        return capture._tasks
+
+    tasks = asyncio.run(run())
+    assert len(tasks) == 1 and tasks[0].cancelled()
+    assert not page.listeners['response']
+
+
+def test_render_result_payloads():
+    """Payloads can be filtered by URL pattern."""
+    result = RenderResult('https://example.com/', None, [
+        CapturedResponse('https://example.com/api/festivals', 200, [1, 2]),
+        CapturedResponse('https://example.com/api/categories', 200, ['Short']),
+    ])
+    assert result.payloads() == [[1, 2], ['Short']]
+    assert result.payloads(r'festivals') == [[1, 2]]
+
+
+def main():
+    """Run all tests."""
+    test_captures_matching_json_in_order()
+    test_size_limit_and_timeout()
+    test_cancel_stops_pending_reads()
+    test_render_result_payloads()
+    logger.info("All response capture tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
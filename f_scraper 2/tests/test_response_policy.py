@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Test script for response classification and Retry-After handling.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.base_scraper import BaseScraper
+from scrapers.httpx_scraper import HttpxScraper
+from scrapers.registry import register_engine
+from scrapers.requests_scraper import RequestsScraper
+from scrapers.response_policy import (FAIL, OK, RETRY, THROTTLED, HttpStatusError, check_response,
+                                      classify_response, parse_retry_after)
+from scrapers.scraper_factory import ScraperFactory
+
+logger = logging.getLogger(__name__)
+
+PAGE = b'<html><body>' + b'x' * 2000 + b'</body></html>'
+
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    """Answers /throttled with one 429 (Retry-After: 1) before serving the page; /missing is a 404."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append(time.monotonic())
+        if self.path.startswith('/missing'):
+            self._reply(404)
+        elif self.path.startswith('/throttled') and len(self.server.requests) == 1:
+            self._reply(429, {'Retry-After': '1'})
+        else:
+            self._reply(200)
+
+    def _reply(self, status, headers=None):
+        body = PAGE if status == 200 else b'error'
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ThrottlingHandler)
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_parse_retry_after():
+    """Retry-After is parsed as delay-seconds or as an HTTP-date."""
+    now = time.time()
+    assert parse_retry_after('120') == 120.0
+    assert abs(parse_retry_after(formatdate(now + 30, usegmt=True), now=now) - 30) <= 1
+    assert parse_retry_after(formatdate(now - 30, usegmt=True), now=now) == 0.0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+
+def test_classify_response():
+    """Statuses map to success, retry, throttling or permanent failure."""
+    assert classify_response(200).action == OK
+    assert classify_response(429, {'retry-after': '5'}) == (THROTTLED, 5.0)
+    assert classify_response(429).action == THROTTLED
+    assert classify_response(503, {'Retry-After': '7'}) == (THROTTLED, 7.0)
+    assert classify_response(503).action == RETRY
+    assert classify_response(404).action == FAIL
+
+    try:
+        check_response('https://example.com/', 429, {'Retry-After': '3600'}, max_retry_after=600)
+    except HttpStatusError as e:
+        assert e.retry_after == 3600 and not e.retryable
+    else:
+        raise AssertionError("expected HttpStatusError")
+
+
+def test_requests_scraper_honors_retry_after():
+    """A 429 is retried after its Retry-After, and only its host is paused."""
+    server = _start_server()
+    scraper = RequestsScraper({'use_proxies': False, 'rate_limit': {'rate': None}})
+    try:
+        base = f'http://127.0.0.1:{server.server_port}'
+        assert scraper.get_page(base + '/throttled', max_retries=3, retry_delay=30) == PAGE.decode()
+        first, second = server.requests
+        assert 0.9 < second - first < 5
+        assert scraper.rate_limiter.reserve('other.example') == 0.0
+
+        # Permanent failures are not retried, and surface as themselves
+        del server.requests[:]
+        try:
+            scraper.get_page(base + '/missing', max_retries=3)
+        except HttpStatusError as e:
+            assert e.status_code == 404
+        else:
+            raise AssertionError("expected HttpStatusError")
+        assert len(server.requests) == 1
+    finally:
+        scraper.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_pause_is_capped_by_max_retry_after():
+    """A Retry-After we won't wait for pauses the host for at most max_retry_after."""
+    scraper = RequestsScraper({'use_proxies': False, 'rate_limit': {'rate': None}, 'max_retry_after': 2})
+    try:
+        try:
+            scraper._check_response('https://example.com/', 429, {'Retry-After': '86400'})
+        except HttpStatusError as e:
+            assert e.retry_after == 86400 and not e.retryable
+        else:
+            raise AssertionError("expected HttpStatusError")
+        assert 1.9 < scraper.rate_limiter.reserve('example.com') <= 2
+    finally:
+        scraper.close()
+
+
+def test_paused_host_does_not_block_other_hosts():
+    """While a throttled host is paused, a single worker still serves other hosts."""
+    server = _start_server()
+    scraper = RequestsScraper({'use_proxies': False, 'rate_limit': {'rate': None}, 'retry_workers': 1})
+    try:
+        port = server.server_port
+        throttled = scraper.submit_page(f'http://127.0.0.1:{port}/throttled', max_retries=3, retry_delay=30)
+        deadline = time.monotonic() + 5
+        while not server.requests:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        waiting = [scraper.submit_page(f'http://127.0.0.1:{port}/page/{i}', max_retries=1) for i in range(3)]
+
+        # Same server under another host name, which is not paused
+        start = time.monotonic()
+        assert scraper.get_page(f'http://localhost:{port}/other', max_retries=1) == PAGE.decode()
+        assert time.monotonic() - start < 0.8
+
+        assert throttled.result(timeout=5) == PAGE.decode()
+        assert all(future.result(timeout=5) == PAGE.decode() for future in waiting)
+        assert time.monotonic() - start >= 0.5
+    finally:
+        scraper.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_httpx_scraper_honors_retry_after():
+    """The async HTTPX path waits out Retry-After instead of its backoff."""
+    server = _start_server()
+    scraper = HttpxScraper({'max_retries': 3, 'retry_delay': 30, 'rate_limit': {'rate': None}})
+
+    async def _fetch():
+        try:
+            return await scraper.aget_page(f'http://127.0.0.1:{server.server_port}/throttled')
+        finally:
+            await scraper.aclose()
+
+    try:
+        assert asyncio.run(_fetch()) == PAGE.decode()
+        first, second = server.requests
+        assert 0.9 < second - first < 5
+    finally:
+        scraper.close()
+        server.shutdown()
+        server.server_close()
+
+
+FETCHED = []
+
+
+@register_engine('test_policy_not_found')
+class NotFoundScraper(BaseScraper):
+    """Engine that answers every URL with a 404."""
+
+    def get_page(self, url: str, **kwargs) -> str:
+        FETCHED.append('test_policy_not_found')
+        return self.retry_with_backoff(self._check_response, url, 404)
+
+    def close(self) -> None:
+        pass
+
+
+@register_engine('test_policy_fallback')
+class FallbackScraper(BaseScraper):
+    """Engine that records being tried."""
+
+    def get_page(self, url: str, **kwargs) -> str:
+        FETCHED.append('test_policy_fallback')
+        return "<html>" + "x" * 200 + "</html>"
+
+    def close(self) -> None:
+        pass
+
+
+def test_factory_does_not_fall_back_on_permanent_failure():
+    """A non-retryable error ends get_page without trying the other engines."""
+    FETCHED.clear()
+    factory = ScraperFactory({'use_proxies': False, 'default_engine': 'test_policy_not_found',
+                              'fallback_order': ['test_policy_not_found', 'test_policy_fallback'], 'rate_limit': False})
+    try:
+        try:
+            factory.get_page('https://example.com/missing')
+        except HttpStatusError as e:
+            assert e.status_code == 404
+        else:
+            raise AssertionError("expected HttpStatusError")
+        assert FETCHED == ['test_policy_not_found']
+        assert factory.get_scraper('test_policy_not_found').get_stats()['failures'] == 1
+    finally:
+        factory.close()
+
+
+def main():
+    """Run all tests."""
+    test_parse_retry_after()
+    test_classify_response()
+    test_requests_scraper_honors_retry_after()
+    test_pause_is_capped_by_max_retry_after()
+    test_paused_host_does_not_block_other_hosts()
+    test_httpx_scraper_honors_retry_after()
+    test_factory_does_not_fall_back_on_permanent_failure()
+    logger.info("All response policy tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
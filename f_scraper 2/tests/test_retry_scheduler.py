@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for the non-blocking retry scheduler.
+"""
+
+import logging
+import os
+import sys
+import time
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.retry_scheduler import RetryScheduler
+
+logger = logging.getLogger(__name__)
+
+
+def test_retries_until_success():
+    """A failing item is retried and resolves with the first success."""
+    scheduler = RetryScheduler(max_workers=1)
+    attempts = []
+
+    def flaky(attempt):
+        attempts.append(attempt)
+        if attempt < 3:
+            raise ValueError("not yet")
+        return "ok"
+
+    try:
+        future = scheduler.submit(flaky, host='example.com', max_retries=5, backoff=lambda a, e: 0.01)
+        assert future.result(timeout=5) == "ok"
+        assert attempts == [1, 2, 3]
+    finally:
+        scheduler.close()
+
+
+def test_gives_up_with_last_exception():
+    """After max_retries failures the future carries the last exception."""
+    scheduler = RetryScheduler(max_workers=1)
+
+    def always_fails(attempt):
+        raise ValueError(f"attempt {attempt}")
+
+    try:
+        future = scheduler.submit(always_fails, max_retries=2, backoff=lambda a, e: 0.01)
+        try:
+            future.result(timeout=5)
+        except ValueError as e:
+            assert str(e) == "attempt 2"
+        else:
+            raise AssertionError("expected ValueError")
+    finally:
+        scheduler.close()
+
+
+def test_non_retryable_error_fails_fast():
+    """An exception with retryable = False is not retried."""
+    scheduler = RetryScheduler(max_workers=1)
+    attempts = []
+
+    class FatalError(Exception):
+        retryable = False
+
+    def fails_fatally(attempt):
+        attempts.append(attempt)
+        raise FatalError("too large")
+
+    try:
+        future = scheduler.submit(fails_fatally, max_retries=5, backoff=lambda a, e: 0.01)
+        try:
+            future.result(timeout=5)
+        except FatalError:
+            pass
+        else:
+            raise AssertionError("expected FatalError")
+        assert attempts == [1]
+    finally:
+        scheduler.close()
+
+
+def test_parked_items_free_the_worker():
+    """While one item waits out its backoff, the single worker serves others."""
+    scheduler = RetryScheduler(max_workers=1)
+
+    def slow_retry(attempt):
+        if attempt == 1:
+            raise ValueError("retry later")
+        return "retried"
+
+    try:
+        parked = scheduler.submit(slow_retry, host='slow.example', max_retries=2, backoff=lambda a, e: 0.5)
+
+        # Wait for the first attempt to fail and be parked
+        deadline = time.monotonic() + 5
+        while scheduler.queue_depths().get('slow.example') != 1:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        start = time.monotonic()
+        quick = scheduler.submit(lambda attempt: "quick", host='fast.example')
+        assert quick.result(timeout=5) == "quick"
+        assert time.monotonic() - start < 0.4
+
+        assert parked.result(timeout=5) == "retried"
+        assert scheduler.queue_depths() == {}
+    finally:
+        scheduler.close()
+
+
+def main():
+    """Run all tests."""
+    test_retries_until_success()
+    test_gives_up_with_last_exception()
+    test_non_retryable_error_fails_fast()
+    test_parked_items_free_the_worker()
+    logger.info("All retry scheduler tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Test script for the robots.txt cache.
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.base_scraper import BaseScraper
+from scrapers.rate_limiter import RateLimiter
+from scrapers.registry import register_engine
+from scrapers.robots import RobotsCache, RobotsDisallowedError, RobotsRules
+from scrapers.scraper_factory import ScraperFactory
+
+logger = logging.getLogger(__name__)
+
+ROBOTS = """
+User-agent: festivalbot
+Disallow: /admin
+Crawl-delay: 2
+
+User-agent: *
+Disallow: /private
+Allow: /private/public
+Disallow: /*.pdf$
+Disallow: /search*q=
+Crawl-delay: 0.5
+"""
+
+
+class RobotsHandler(BaseHTTPRequestHandler):
+    """Serves ROBOTS, or answers with the status set on the server."""
+
+    def do_GET(self):
+        self.server.requests += 1
+        status = self.server.robots_status
+        body = ROBOTS.encode() if status == 200 else b'error'
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_server(status: int = 200) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RobotsHandler)
+    server.requests = 0
+    server.robots_status = status
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_matching():
+    """Longest match wins, Allow wins ties, and wildcards and $ work."""
+    rules = RobotsRules.parse(ROBOTS)
+    assert rules.allowed('/festivals')
+    assert not rules.allowed('/private/notes')
+    assert rules.allowed('/private/public/page')
+    assert not rules.allowed('/files/guide.pdf')
+    assert rules.allowed('/files/guide.pdf?download=1')
+    assert not rules.allowed('/search?page=2&q=film')
+    assert rules.allowed('/admin')
+    assert rules.allowed('/robots.txt')
+    assert rules.crawl_delay == 0.5
+
+    tie = RobotsRules([(False, '/page'), (True, '/page')])
+    assert tie.allowed('/page')
+
+
+def test_user_agent_groups():
+    """A group naming our product token replaces the * group."""
+    rules = RobotsRules.parse(ROBOTS, user_agent='FestivalBot')
+    assert not rules.allowed('/admin/users')
+    assert rules.allowed('/private/notes')
+    assert rules.crawl_delay == 2
+
+
+def test_fetch_once_and_status_handling():
+    """robots.txt is fetched once per origin; 4xx allows all, 5xx disallows all."""
+    server = _start_server()
+    try:
+        base = f'http://127.0.0.1:{server.server_port}'
+        cache = RobotsCache()
+        assert cache.can_fetch(base + '/festivals')
+        assert not cache.can_fetch(base + '/private/x')
+        assert server.requests == 1
+        assert cache.get_stats()['hits'] == 1
+
+        server.robots_status = 404
+        assert RobotsCache().can_fetch(base + '/private/x')
+
+        server.robots_status = 503
+        assert not RobotsCache().can_fetch(base + '/festivals')
+
+        # A failed refresh keeps the last good copy
+        cache._entries[cache.origin(base)].expires = 0
+        assert cache.can_fetch(base + '/festivals')
+        assert not cache.can_fetch(base + '/private/x')
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_persistence():
+    """A saved cache is reused by a new instance without refetching."""
+    server = _start_server()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'robots.json')
+        try:
+            url = f'http://127.0.0.1:{server.server_port}/private/x'
+            assert not RobotsCache(path=path).can_fetch(url)
+            assert not RobotsCache(path=path).can_fetch(url)
+            assert server.requests == 1
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def test_check_applies_crawl_delay():
+    """check() raises for disallowed URLs and caps the host's rate."""
+    server = _start_server()
+    try:
+        base = f'http://127.0.0.1:{server.server_port}'
+        cache = RobotsCache()
+        limiter = RateLimiter(rate=10, burst=5)
+        cache.check(base + '/festivals', limiter)
+        assert limiter._limits('127.0.0.1') == (2.0, 1)
+        try:
+            cache.check(base + '/private/x', limiter)
+        except RobotsDisallowedError:
+            pass
+        else:
+            raise AssertionError("expected RobotsDisallowedError")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+FETCHED = []
+
+
+@register_engine('test_robots')
+class RecordingScraper(BaseScraper):
+    """Engine that records the URLs it is asked for."""
+
+    def get_page(self, url: str, **kwargs) -> str:
+        FETCHED.append(url)
+        return "<html>" + "x" * 200 + "</html>"
+
+    def close(self) -> None:
+        pass
+
+
+def test_factory_filters_disallowed_urls():
+    """The factory never hands disallowed URLs to an engine."""
+    server = _start_server()
+    FETCHED.clear()
+    factory = ScraperFactory({'use_proxies': False, 'default_engine': 'test_robots',
+                              'fallback_order': ['test_robots'], 'respect_robots': True, 'rate_limit': False})
+    try:
+        base = f'http://127.0.0.1:{server.server_port}'
+        results = dict(factory.get_pages([base + '/a', base + '/private/b', base + '/c']))
+        assert isinstance(results[base + '/private/b'], RobotsDisallowedError)
+        assert sorted(FETCHED) == [base + '/a', base + '/c']
+        assert factory.get_scraper('test_robots').robots is factory.robots
+        assert server.requests == 1
+        try:
+            factory.get_page(base + '/private/b')
+        except RobotsDisallowedError:
+            pass
+        else:
+            raise AssertionError("expected RobotsDisallowedError")
+    finally:
+        factory.close()
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    """Run all tests."""
+    test_matching()
+    test_user_agent_groups()
+    test_fetch_once_and_status_handling()
+    test_persistence()
+    test_check_applies_crawl_delay()
+    test_factory_filters_disallowed_urls()
+    logger.info("All robots.txt tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
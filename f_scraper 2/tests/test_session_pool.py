@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test script for sharing one RequestsScraper between threads.
+"""
+
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.connection_pool import SessionPool
+from scrapers.requests_scraper import RequestsScraper
+
+logger = logging.getLogger(__name__)
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Answers with the request path and the user agent it was sent with."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = f"<html><body>{self.path}|{self.headers.get('User-Agent')}</body></html>".encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_pool_reuses_and_limits_sessions():
+    """Sessions are reused once returned, and callers wait when all are leased."""
+    pool = SessionPool(requests.Session, size=2)
+    with pool.lease() as first:
+        pass
+    with pool.lease() as again:
+        assert again is first
+
+    leased = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.lease():
+            leased.set()
+            release.wait(5)
+
+    holders = [threading.Thread(target=hold) for _ in range(2)]
+    for holder in holders:
+        holder.start()
+    leased.wait(5)
+    threading.Timer(0.1, release.set).start()
+    with pool.lease():
+        pass
+    for holder in holders:
+        holder.join(5)
+
+    stats = pool.get_stats()
+    assert stats['sessions'] == 2
+    assert stats['idle'] == 2
+    assert stats['waits'] >= 1
+    pool.close()
+
+
+def test_scraper_shared_between_threads():
+    """One scraper serves many threads, each page getting its own response."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), EchoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+    scraper = RequestsScraper({'use_proxies': False, 'rate_limit': False, 'session_pool_size': 4})
+    user_agent = scraper.current_user_agent
+    try:
+        urls = [f'{base}/page/{i}' for i in range(24)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pages = list(executor.map(scraper.get_page, urls))
+
+        for i, html in enumerate(pages):
+            assert f'/page/{i}?' in html
+            assert html.endswith(f'|{user_agent}</body></html>')
+
+        stats = scraper.get_stats()['session_pool']
+        assert 1 <= stats['sessions'] <= 4
+        assert stats['leases'] == len(urls)
+        assert stats['idle'] == stats['sessions']
+        # Per-request headers never leak into the shared sessions
+        default_headers = {**requests.utils.default_headers(), **scraper.headers}
+        for session in scraper.session_pool.sessions:
+            assert dict(session.headers) == default_headers
+    finally:
+        scraper.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_cookies_reach_every_session():
+    """Updated cookies are set on all pooled sessions."""
+    scraper = RequestsScraper({'use_proxies': False, 'rate_limit': False})
+    try:
+        with scraper.session_pool.lease():
+            with scraper.session_pool.lease():
+                pass
+        scraper.update_cookies({'token': 'abc'})
+        assert len(scraper.session_pool.sessions) == 2
+        for session in scraper.session_pool.sessions:
+            assert session.cookies.get('token') == 'abc'
+    finally:
+        scraper.close()
+
+
+def main():
+    """Run all tests."""
+    test_pool_reuses_and_limits_sessions()
+    test_scraper_shared_between_threads()
+    test_cookies_reach_every_session()
+    logger.info("All session pool tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test script for in-flight request coalescing.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.base_scraper import BaseScraper, ScraperException
+from scrapers.registry import register_engine
+from scrapers.scraper_factory import ScraperFactory
+from scrapers.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+FETCHES = []
+
+
+@register_engine('test_counting')
+class CountingScraper(BaseScraper):
+    """Engine that takes a moment per page and records every fetch."""
+
+    def get_page(self, url: str, **kwargs) -> str:
+        FETCHES.append(url)
+        time.sleep(0.1)
+        if 'fail' in url:
+            raise ScraperException(f"cannot fetch {url}")
+        return "<html>" + "x" * 200 + url + "</html>"
+
+    def close(self) -> None:
+        pass
+
+
+def _run_concurrently(func, count: int = 8) -> list:
+    results = [None] * count
+    barrier = threading.Barrier(count)
+
+    def _call(index):
+        barrier.wait()
+        try:
+            results[index] = func()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=_call, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_calls_share_one_result():
+    """Callers arriving while a call is in flight get its result."""
+    flight = SingleFlight()
+    calls = []
+
+    def _work():
+        calls.append(1)
+        time.sleep(0.1)
+        return object()
+
+    results = _run_concurrently(lambda: flight.do('key', _work))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.get_stats()['coalesced'] == 7
+
+    # Nothing is kept without a TTL
+    flight.do('key', _work)
+    assert len(calls) == 2
+
+
+def test_memo_ttl_and_errors():
+    """Results are memoized for the TTL; failures are shared but not kept."""
+    flight = SingleFlight(ttl=0.2)
+    assert flight.do('a', lambda: 1) == 1
+    assert flight.do('a', lambda: 2) == 1
+    time.sleep(0.25)
+    assert flight.do('a', lambda: 3) == 3
+
+    def _fail():
+        raise ValueError("boom")
+
+    for _ in range(2):
+        try:
+            flight.do('b', _fail)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError")
+    assert flight.get_stats()['calls'] == 4
+
+
+def test_factory_coalesces_by_normalized_url():
+    """Concurrent get_page calls for one page run a single fetch."""
+    FETCHES.clear()
+    factory = ScraperFactory({'use_proxies': False, 'default_engine': 'test_counting',
+                              'fallback_order': ['test_counting'], 'coalesce_ttl': 0})
+    urls = ["https://Example.com/list?b=2&a=1", "https://example.com/list?a=1&b=2#top"] * 4
+    counter = iter(range(len(urls)))
+    results = _run_concurrently(lambda: factory.get_page(urls[next(counter)]))
+    assert len(FETCHES) == 1
+    assert len(set(results)) == 1
+
+    # Failures reach every waiting caller
+    FETCHES.clear()
+    results = _run_concurrently(lambda: factory.get_page("https://example.com/fail"))
+    assert len(FETCHES) == 1
+    assert all(isinstance(result, ScraperException) for result in results)
+
+    # POSTs are never shared
+    FETCHES.clear()
+    _run_concurrently(lambda: factory.get_page("https://example.com/form", method='POST'), count=3)
+    assert len(FETCHES) == 3
+    factory.close()
+
+
+def test_factory_memo_is_opt_in():
+    """Repeated get_page calls fetch again unless coalesce_ttl is set."""
+    FETCHES.clear()
+    factory = ScraperFactory({'use_proxies': False, 'default_engine': 'test_counting',
+                              'fallback_order': ['test_counting'], 'rate_limit': False})
+    factory.get_page("https://example.com/poll")
+    factory.get_page("https://example.com/poll")
+    assert len(FETCHES) == 2
+    factory.close()
+
+    FETCHES.clear()
+    factory = ScraperFactory({'use_proxies': False, 'default_engine': 'test_counting',
+                              'fallback_order': ['test_counting'], 'rate_limit': False, 'coalesce_ttl': 60})
+    factory.get_page("https://example.com/poll")
+    factory.get_page("https://example.com/poll")
+    assert len(FETCHES) == 1
+    factory.close()
+
+
+def main():
+    """Run all tests."""
+    test_concurrent_calls_share_one_result()
+    test_memo_ttl_and_errors()
+    test_factory_coalesces_by_normalized_url()
+    test_factory_memo_is_opt_in()
+    logger.info("All single-flight tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for the sampled debug snapshot sink.
+"""
+
+import gzip
+import logging
+import os
+import sys
+import tempfile
+import threading
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.snapshots import SnapshotSink, create_from_config
+
+logger = logging.getLogger(__name__)
+
+
+def test_sampling():
+    """One in every N pages is sampled, and failures only when asked for."""
+    sink = SnapshotSink(every=3, failures=False)
+    assert [sink.sample() for _ in range(6)] == [False, False, True, False, False, True]
+    assert not sink.sample(failed=True)
+
+    sink = SnapshotSink()
+    assert not any(sink.sample() for _ in range(10))
+    assert sink.sample(failed=True)
+
+
+def test_writes_compressed_unique_files():
+    """Snapshots from many threads end up in distinct gzip files."""
+    with tempfile.TemporaryDirectory() as directory:
+        sink = SnapshotSink(directory=directory, every=1)
+
+        def fetch(i):
+            sink.write(f'https://example.com/page/{i}', f'<html>{i}</html>', failed=i == 0)
+
+        threads = [threading.Thread(target=fetch, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sink.close()
+
+        names = sorted(os.listdir(directory))
+        assert len(names) == 8
+        assert all(name.endswith('.html.gz') for name in names)
+        assert sum('-failed' in name for name in names) == 1
+        bodies = set()
+        for name in names:
+            with gzip.open(os.path.join(directory, name), 'rt', encoding='utf-8') as f:
+                bodies.add(f.read().split('\n', 1)[1])
+        assert bodies == {f'<html>{i}</html>' for i in range(8)}
+        assert sink.get_stats() == {'written': 8, 'dropped': 0, 'errors': 0, 'pending': 0}
+        assert not sink.write('https://example.com/late', '<html></html>')
+
+
+def test_drops_when_writer_is_behind():
+    """Snapshots beyond max_pending are dropped instead of blocking the caller."""
+    with tempfile.TemporaryDirectory() as directory:
+        sink = SnapshotSink(directory=directory, compress=False, max_pending=1)
+        sink._writer = threading.Thread()  # keep the real writer from starting
+        assert sink.write('https://example.com/a', 'a')
+        assert not sink.write('https://example.com/b', 'b')
+        assert sink.get_stats()['dropped'] == 1
+
+
+def test_create_from_config():
+    """Snapshots are off unless configured."""
+    assert create_from_config(None) is None
+    assert create_from_config(False) is None
+    sink = create_from_config({'every': 10, 'compress': False})
+    assert sink.every == 10 and not sink.compress
+
+
+def main():
+    """Run all tests."""
+    test_sampling()
+    test_writes_compressed_unique_files()
+    test_drops_when_writer_is_behind()
+    test_create_from_config()
+    logger.info("All snapshot tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for the thread-safe scraper statistics.
+"""
+
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.base_scraper import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+
+class CountingScraper(BaseScraper):
+    """Scraper that only records attempts."""
+
+    def get_page(self, url: str, **kwargs) -> str:
+        return url
+
+    def close(self) -> None:
+        pass
+
+
+def test_counters_exact_under_threads():
+    """Counters recorded from a thread pool add up exactly."""
+    scraper = CountingScraper()
+    per_thread = 5000
+    threads = 8
+
+    def work(index):
+        for i in range(per_thread):
+            scraper._record_attempt('example.com', 0.001, success=(i % 4 != 0))
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(work, range(threads)))
+
+    total = per_thread * threads
+    stats = scraper.get_stats()
+    assert scraper.request_count == total
+    assert stats['success'] == total * 3 // 4
+    assert stats['failures'] == total // 4
+    assert stats['success_rate'] == 0.75
+    assert stats['latency']['hosts']['example.com']['total']['count'] == total * 3 // 4
+
+
+def main():
+    """Run all tests."""
+    test_counters_exact_under_threads()
+    logger.info("All stats tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
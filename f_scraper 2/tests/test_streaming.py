@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming body downloads.
+"""
+
+import gzip
+import logging
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add parent directory to path so we can import from scrapers
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from scrapers.requests_scraper import RequestsScraper
+from scrapers.streaming import BodyTooLargeError, read_body
+
+logger = logging.getLogger(__name__)
+
+PAGE = ('<html><body><main>' + 'café ' * 5000 + '</main>' + '<footer>x</footer>' * 20000 + '</body></html>').encode('utf-8')
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves the test page, gzipped under /gzip."""
+
+    requests_served = 0
+
+    def do_GET(self):
+        type(self).requests_served += 1
+        body = gzip.compress(PAGE) if self.path.startswith('/gzip') else PAGE
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        if self.path.startswith('/gzip'):
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_read_body_matches_text():
+    """A streamed, gzipped body decodes to the same text as response.text."""
+    server = _start_server()
+    try:
+        url = f'http://127.0.0.1:{server.server_port}/gzip'
+        assert read_body(requests.get(url, stream=True), chunk_size=1000) == PAGE.decode('utf-8')
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_size_cap_and_early_stop():
+    """The cap applies to the decompressed size; stop_when ends the download early."""
+    server = _start_server()
+    try:
+        base = f'http://127.0.0.1:{server.server_port}'
+        for path in ('/plain', '/gzip'):
+            try:
+                read_body(requests.get(base + path, stream=True), max_bytes=len(PAGE) - 1)
+            except BodyTooLargeError:
+                pass
+            else:
+                raise AssertionError("expected BodyTooLargeError")
+
+        html = read_body(requests.get(base + '/gzip', stream=True), stop_when=lambda text: '</main>' in text,
+                         chunk_size=4096)
+        assert '</main>' in html
+        assert len(html) < len(PAGE) // 2
+
+        # The predicate sees a bounded window, yet finds a marker split across chunks
+        windows = []
+
+        def _stop(text):
+            windows.append(len(text))
+            return '</main>' in text
+
+        html = read_body(requests.get(base + '/plain', stream=True), stop_when=_stop, chunk_size=3,
+                         stop_overlap=16)
+        assert '</main>' in html[-9:]
+        assert max(windows) <= 16 + 3
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_requests_scraper_does_not_retry_oversized_body():
+    """An oversized body fails the fetch on the first attempt."""
+    server = _start_server()
+    scraper = RequestsScraper({'use_proxies': False, 'stream': True, 'max_body_size': 1024})
+    try:
+        url = f'http://127.0.0.1:{server.server_port}/plain'
+        PageHandler.requests_served = 0
+        try:
+            scraper.get_page(url, max_retries=3, retry_delay=0.01)
+        except BodyTooLargeError:
+            pass
+        else:
+            raise AssertionError("expected BodyTooLargeError")
+        assert PageHandler.requests_served == 1
+
+        assert scraper.get_page(url, max_retries=1, max_body_size=None) == PAGE.decode('utf-8')
+    finally:
+        scraper.close()
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    """Run all tests."""
+    test_read_body_matches_text()
+    test_size_cap_and_early_stop()
+    test_requests_scraper_does_not_retry_oversized_body()
+    logger.info("All streaming tests PASSED!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()